@@ -0,0 +1,139 @@
+"""Shared fixtures for the zhinst-qcodes benchmarks."""
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from zhinst.toolkit.nodetree import NodeTree
+
+TESTS_DIR = Path(__file__).parent.parent / "tests"
+sys.path.insert(0, str(TESTS_DIR))
+
+from fixtures import mock_connection  # noqa: E402,F401
+
+
+def _node(path, description, unit="None", properties="Read, Write, Setting"):
+    return path, {
+        "Node": path.upper(),
+        "Description": description,
+        "Properties": properties,
+        "Type": "Double",
+        "Unit": unit,
+    }
+
+
+def device_nodedoc(serial: str, qa_channels: int = 4, sg_channels: int = 6) -> dict:
+    """Synthetic nodedoc with the size and layout of a SHFQC.
+
+    The number of channels can be increased to get larger node trees.
+    """
+    nodes = []
+    for ch in range(qa_channels):
+        base = f"/{serial}/qachannels/{ch}"
+        for osc in range(16):
+            nodes.append(
+                _node(f"{base}/oscs/{osc}/freq", "Oscillator frequency.", "Hz")
+            )
+            nodes.append(_node(f"{base}/oscs/{osc}/gain", "Oscillator gain."))
+        for weight in range(16):
+            nodes.append(
+                _node(
+                    f"{base}/readout/integration/weights/{weight}/wave",
+                    "Contains the complex-valued waveform of the integration weight.",
+                    properties="Read, Write",
+                )
+            )
+            for name in ["threshold", "enable", "delay", "length"]:
+                nodes.append(
+                    _node(
+                        f"{base}/readout/discriminators/{weight}/{name}",
+                        f"Sets the {name} of the discriminator of the readout unit.",
+                    )
+                )
+        for qudit in range(8):
+            for state in range(4):
+                for name in ["weight", "threshold", "enable"]:
+                    nodes.append(
+                        _node(
+                            f"{base}/readout/multistate/qudits/{qudit}/"
+                            f"states/{state}/{name}",
+                            f"Sets the {name} of the qudit state discrimination.",
+                        )
+                    )
+        for wave in range(16):
+            nodes.append(
+                _node(
+                    f"{base}/generator/waveforms/{wave}/wave",
+                    "Complex waveform of the readout pulse.",
+                    properties="Read, Write",
+                )
+            )
+        for name in ["on", "range", "centerfreq", "mode", "rflfpath"]:
+            nodes.append(_node(f"{base}/input/{name}", f"Input {name} setting."))
+            nodes.append(_node(f"{base}/output/{name}", f"Output {name} setting."))
+    for ch in range(sg_channels):
+        base = f"/{serial}/sgchannels/{ch}"
+        for osc in range(8):
+            nodes.append(
+                _node(f"{base}/oscs/{osc}/freq", "Oscillator frequency.", "Hz")
+            )
+        for sine in range(2):
+            for name in ["harmonic", "phaseshift", "oscselect"]:
+                nodes.append(
+                    _node(f"{base}/sines/{sine}/{name}", f"Sine generator {name}.")
+                )
+            for path in ["i", "q"]:
+                for name in ["cos", "sin"]:
+                    nodes.append(
+                        _node(
+                            f"{base}/sines/{sine}/{path}/{name}/amplitude",
+                            "Amplitude of the sine generator.",
+                        )
+                    )
+        for name in ["enable", "single", "ready", "modulation/enable"]:
+            nodes.append(_node(f"{base}/awg/{name}", f"AWG {name} setting."))
+        for node in range(64):
+            nodes.append(
+                _node(
+                    f"{base}/awg/commandtable/entries/{node}/amplitude",
+                    "Amplitude of the command table entry.",
+                )
+            )
+        for user_reg in range(16):
+            nodes.append(
+                _node(f"{base}/awg/userregs/{user_reg}", "User register of the AWG.")
+            )
+        for name in ["on", "range", "rflfpath", "filter"]:
+            nodes.append(_node(f"{base}/output/{name}", f"Output {name} setting."))
+    for name in ["fwrevision", "fpgarevision", "owner", "activeinterface"]:
+        nodes.append(_node(f"/{serial}/system/{name}", f"System {name}."))
+    for volt in range(12):
+        nodes.append(
+            _node(
+                f"/{serial}/stats/physical/voltages/{volt}",
+                "Internal voltage measurement.",
+                "V",
+                "Read",
+            )
+        )
+    return dict(nodes)
+
+
+@pytest.fixture()
+def data_dir():
+    """Directory of the recorded test data."""
+    yield TESTS_DIR / "data"
+
+
+@pytest.fixture()
+def device_nodetree():
+    """Factory for the node tree of a synthetic SHFQC."""
+
+    def create(serial: str = "dev12000", **kwargs) -> NodeTree:
+        return NodeTree(
+            MagicMock(),
+            prefix_hide=serial,
+            preloaded_json=device_nodedoc(serial, **kwargs),
+        )
+
+    yield create
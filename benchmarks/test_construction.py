@@ -0,0 +1,126 @@
+"""Construction time benchmarks of the QCoDeS hierarchy.
+
+Run with ``tox -e benchmark``. The results are stored in
+``benchmarks/.results`` and can be compared with a previous run through
+``tox -e benchmark -- --benchmark-compare``.
+"""
+import tracemalloc
+from itertools import count
+from unittest.mock import MagicMock
+
+import pytest
+from qcodes.instrument.base import Instrument
+from zhinst.toolkit.nodetree import NodeTree
+
+from zhinst.qcodes import ZISession
+from zhinst.qcodes.qcodes_adaptions import (
+    _get_submodule,
+    init_nodetree,
+    tk_node_to_qcodes_list,
+    ZIInstrument,
+)
+
+_instrument_id = count()
+
+
+@pytest.fixture()
+def zi_nodedoc(data_dir):
+    """Recorded nodedoc of the data server (/zi)."""
+    with (data_dir / "nodedoc_zi.json").open("r", encoding="UTF-8") as file:
+        yield file.read()
+
+
+@pytest.fixture(params=["zi", "shfqc"])
+def nodetree(request, zi_nodedoc, device_nodetree):
+    """Node tree of the data server and of a synthetic SHFQC."""
+    if request.param == "zi":
+        connection = MagicMock()
+        connection.listNodesJSON.return_value = zi_nodedoc
+        yield NodeTree(connection)
+    else:
+        yield device_nodetree()
+
+
+@pytest.fixture(autouse=True)
+def close_instruments():
+    """Close the instruments created by a benchmark."""
+    yield
+    Instrument.close_all()
+
+
+def empty_instrument(nodetree, **kwargs):
+    """Arguments of ``init_nodetree`` for a new instrument without parameters."""
+    instrument = ZIInstrument(f"benchmark_{next(_instrument_id)}", nodetree)
+    return (instrument, nodetree, instrument._snapshot_cache), kwargs
+
+
+def test_session(benchmark, mock_connection, zi_nodedoc):
+    """Creation of a session to the data server."""
+    mock_connection.return_value.listNodesJSON.return_value = zi_nodedoc
+    benchmark.pedantic(
+        ZISession,
+        args=("localhost",),
+        kwargs={"new_session": True},
+        setup=Instrument.close_all,
+        rounds=10,
+    )
+
+
+@pytest.mark.parametrize("lazy", [False, True], ids=["eager", "lazy"])
+def test_init_nodetree(benchmark, nodetree, lazy):
+    """Creation of the QCoDeS parameters from a node tree."""
+    benchmark.pedantic(
+        init_nodetree,
+        setup=lambda: empty_instrument(nodetree, lazy=lazy),
+        rounds=10,
+    )
+
+
+def test_tk_node_to_qcodes_list(benchmark, device_nodetree):
+    """Conversion of all nodes of a SHFQC into their QCoDeS path."""
+    nodes = [node for node, _ in device_nodetree()]
+    benchmark(lambda: [tk_node_to_qcodes_list(node) for node in nodes])
+
+
+@pytest.mark.parametrize("cached", [False, True], ids=["uncached", "cached"])
+def test_get_submodule(benchmark, device_nodetree, cached):
+    """Resolution of the parent of all nodes of an existing SHFQC hierarchy.
+
+    The cached variant uses a new prefix cache for every round, as it is done
+    for every build of a node tree.
+    """
+    nodetree = device_nodetree()
+    (instrument, *_), _ = empty_instrument(nodetree)
+    init_nodetree(instrument, nodetree, instrument._snapshot_cache)
+    parents = [tk_node_to_qcodes_list(node)[:-1] for node, _ in nodetree]
+    snapshot_cache = instrument._snapshot_cache
+
+    def resolve():
+        cache = {} if cached else None
+        for parent in parents:
+            _get_submodule(instrument, parent, snapshot_cache, cache)
+
+    benchmark(resolve)
+
+
+@pytest.mark.parametrize("lazy", [False, True], ids=["eager", "lazy"])
+def test_peak_memory(benchmark, nodetree, lazy):
+    """Peak memory while building the QCoDeS hierarchy of a node tree.
+
+    The peak memory in bytes is stored as ``peak_memory`` in the extra info
+    of the benchmark results.
+    """
+
+    def build(instrument, nodetree, snapshot_cache):
+        tracemalloc.start()
+        try:
+            init_nodetree(instrument, nodetree, snapshot_cache, lazy=lazy)
+            instrument.snapshot(update=False)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    peak_memory = benchmark.pedantic(
+        build, setup=lambda: empty_instrument(nodetree), rounds=1
+    )
+    benchmark.extra_info["peak_memory"] = peak_memory
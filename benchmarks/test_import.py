@@ -0,0 +1,16 @@
+"""Import time benchmark of ``zhinst.qcodes``.
+
+Run with ``tox -e benchmark``.
+"""
+import subprocess
+import sys
+
+
+def test_cold_import(benchmark):
+    """Import of the bare package in a fresh interpreter."""
+    benchmark.pedantic(
+        subprocess.run,
+        args=([sys.executable, "-c", "import zhinst.qcodes"],),
+        kwargs={"check": True},
+        rounds=10,
+    )
@@ -0,0 +1,47 @@
+"""Overhead of the latency statistics on the get of a parameter.
+
+Run with ``tox -e benchmark``.
+"""
+import timeit
+from types import SimpleNamespace
+
+import pytest
+from qcodes.instrument.base import Instrument
+
+from zhinst.qcodes.qcodes_adaptions import init_nodetree, ZIInstrument
+
+# Maximal overhead of the disabled statistics per call in seconds
+DISABLED_OVERHEAD = 1e-6
+
+
+@pytest.fixture(autouse=True)
+def close_instruments():
+    """Close the instruments created by a benchmark."""
+    yield
+    Instrument.close_all()
+
+
+@pytest.fixture()
+def parameter(device_nodetree):
+    """Parameter whose toolkit node returns immediately."""
+    instrument = ZIInstrument("benchmark_latency", device_nodetree())
+    init_nodetree(instrument, device_nodetree(), instrument._snapshot_cache)
+    parameter = instrument.qachannels[0].oscs[0].freq
+    parameter._tk_node = SimpleNamespace(_get=lambda: 1.0)
+    yield parameter
+
+
+@pytest.mark.parametrize("enabled", [False, True], ids=["disabled", "enabled"])
+def test_get_raw(benchmark, parameter, enabled):
+    """Raw get of a parameter with and without the latency statistics."""
+    parameter._latency_stats.enabled = enabled
+    benchmark(parameter.get_raw)
+
+
+def test_disabled_overhead(parameter):
+    """The disabled statistics cost less than 1 us per get."""
+    number = 100000
+    node_get = parameter._tk_node._get
+    baseline = min(timeit.repeat(node_get, number=number, repeat=5)) / number
+    duration = min(timeit.repeat(parameter.get_raw, number=number, repeat=5)) / number
+    assert duration - baseline < DISABLED_OVERHEAD
@@ -0,0 +1,57 @@
+"""Memory footprint of the QCoDeS hierarchy of identical devices.
+
+The footprint per device in bytes is stored as ``memory_per_device`` in the
+extra info of the benchmark results. The ``copied`` variant builds the
+devices without a shared metadata table, i.e. every parameter gets its own
+node metadata as before the metadata was shared. It only uses ``init_nodetree``
+without any additional arguments and can therefore also be run against older
+revisions (``tox -e benchmark -- --benchmark-compare``).
+"""
+import gc
+import tracemalloc
+
+import pytest
+from qcodes.instrument.base import Instrument
+
+from zhinst.qcodes.qcodes_adaptions import (
+    init_nodetree,
+    node_metadata_table,
+    ZIInstrument,
+)
+
+NUMBER_OF_DEVICES = 4
+
+
+def footprint(nodetrees, metadata_table) -> int:
+    """Average memory per device in bytes for a set of identical devices."""
+    kwargs = {} if metadata_table is None else {"metadata_table": metadata_table}
+    gc.collect()
+    tracemalloc.start()
+    try:
+        for i, nodetree in enumerate(nodetrees):
+            instrument = ZIInstrument(f"memory_{i}", nodetree)
+            init_nodetree(instrument, nodetree, instrument._snapshot_cache, **kwargs)
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0] // len(nodetrees)
+    finally:
+        tracemalloc.stop()
+        Instrument.close_all()
+
+
+@pytest.mark.parametrize("shared", [False, True], ids=["copied", "shared"])
+def test_footprint(benchmark, device_nodetree, shared):
+    """Memory per device of identical devices."""
+    nodetrees = [device_nodetree(f"dev{12000 + i}") for i in range(NUMBER_OF_DEVICES)]
+    # The first device of a model fills the shared table
+    metadata_table = node_metadata_table("BENCHMARK") if shared else None
+    footprint([device_nodetree("dev11999")], metadata_table)
+    memory_per_device = benchmark.pedantic(
+        footprint, args=(nodetrees, metadata_table), rounds=1
+    )
+    benchmark.extra_info["memory_per_device"] = memory_per_device
+    if shared:
+        copied = footprint(
+            [device_nodetree(f"dev{13000 + i}") for i in range(NUMBER_OF_DEVICES)],
+            None,
+        )
+        assert memory_per_device < copied
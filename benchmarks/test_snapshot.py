@@ -0,0 +1,97 @@
+"""Snapshot benchmarks of a device with several thousand nodes.
+
+Run with ``tox -e benchmark``.
+"""
+import json
+
+import numpy as np
+import pytest
+from qcodes.instrument.base import Instrument
+from qcodes.utils.helpers import NumpyJSONEncoder
+
+from zhinst.qcodes.qcodes_adaptions import init_nodetree, ZIInstrument, ZISnapshotHelper
+from zhinst.qcodes.snapshot_codec import decode_snapshot, encode_snapshot
+
+
+@pytest.fixture(autouse=True)
+def close_instruments():
+    """Close the instruments created by a benchmark."""
+    yield
+    Instrument.close_all()
+
+
+def raw_values(nodetree, with_timestamp):
+    """Result of a get command for all nodes of a node tree.
+
+    Without timestamp the result has the format of a HF2.
+    """
+    values = {}
+    for i, (_, info) in enumerate(nodetree):
+        value = np.array([i], dtype=np.float64)
+        if with_timestamp:
+            values[info["Node"].lower()] = {
+                "timestamp": np.array([i], dtype=np.uint64),
+                "value": value,
+            }
+        else:
+            values[info["Node"].lower()] = value
+    return values
+
+
+@pytest.fixture(params=[True, False], ids=["timestamp", "hf2"])
+def large_nodetree(request, device_nodetree):
+    """Node tree with several thousand nodes and mocked get results."""
+    nodetree = device_nodetree(qa_channels=8, sg_channels=12)
+    nodetree.connection.get.return_value = raw_values(nodetree, request.param)
+    yield nodetree
+
+
+def test_convert_values(benchmark, large_nodetree):
+    """Conversion of the raw get results into python scalars."""
+    values = large_nodetree.connection.get.return_value
+    benchmark(ZISnapshotHelper._convert_values, values)
+
+
+def test_snapshot(benchmark, large_nodetree):
+    """Full snapshot of a device with several thousand nodes."""
+    instrument = ZIInstrument("benchmark_snapshot", large_nodetree)
+    init_nodetree(instrument, large_nodetree, instrument._snapshot_cache)
+    benchmark(instrument.snapshot)
+
+
+@pytest.fixture()
+def device_snapshot(device_nodetree):
+    """Full snapshot of a device with several thousand nodes."""
+    nodetree = device_nodetree(qa_channels=8, sg_channels=12)
+    nodetree.connection.get.return_value = raw_values(nodetree, True)
+    instrument = ZIInstrument("benchmark_device_snapshot", nodetree)
+    init_nodetree(instrument, nodetree, instrument._snapshot_cache)
+    yield instrument.snapshot()
+
+
+def json_encode(snapshot):
+    """Encode a snapshot as QCoDeS does for the dataset metadata."""
+    return json.dumps(snapshot, cls=NumpyJSONEncoder).encode("utf-8")
+
+
+@pytest.mark.parametrize(
+    "encode", [json_encode, encode_snapshot], ids=["json", "compact"]
+)
+def test_encode_snapshot(benchmark, device_snapshot, encode):
+    """Encoding of a full device snapshot.
+
+    The size of the encoded snapshot in bytes is stored as ``size`` in the
+    extra info of the benchmark results.
+    """
+    data = benchmark(encode, device_snapshot)
+    benchmark.extra_info["size"] = len(data)
+
+
+@pytest.mark.parametrize(
+    "encode, decode",
+    [(json_encode, json.loads), (encode_snapshot, decode_snapshot)],
+    ids=["json", "compact"],
+)
+def test_decode_snapshot(benchmark, device_snapshot, encode, decode):
+    """Decoding of a full device snapshot."""
+    benchmark(decode, encode(device_snapshot))
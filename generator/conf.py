@@ -28,6 +28,34 @@ MODULE_DRIVERS = [
 ]
 TOOLKIT_MODULE_MODULE = "zhinst.toolkit.driver.modules"
 
+# Functions that get an asynchronous variant (same name suffixed with "_async")
+ASYNC_FUNCTIONS = ["wait_done", "stop"]
+
+# Asynchronous functions that wait for the device and can therefore block for
+# their whole timeout. They do not delay the other operations of the instrument.
+WAIT_FUNCTIONS = ["wait_done"]
+
+# Module functions whose duration is recorded in the latency statistics
+TIMED_FUNCTIONS = ["read"]
+
+# Toolkit functions of the devices that do not change any node. All other
+# functions invalidate the write and snapshot caches of the instrument.
+READ_ONLY_FUNCTIONS = [
+    "check_ref_clock",
+    "check_status",
+    "check_zsync_connection",
+    "compile_sequencer_program",
+    "find_zsync_worker_port",
+    "get_qudits_results",
+    "get_streamingnodes",
+    "load_from_device",
+    "load_validation_schema",
+    "read",
+    "read_from_waveform_memory",
+    "read_integration_weights",
+    "wait_done",
+]
+
 # Typing
 # Weird typing infos that can be replaced with the right term
 TYPE_HINT_REPLACEMENTS = {
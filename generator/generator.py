@@ -90,7 +90,8 @@ def getInfo(class_type: object, existing_names: list) -> t.Tuple[class_tuple, li
         class_tuple: functions,parameters,sub_modules
         list:        updated existing names
     """
-    blacklist_names = []
+    # implemented by ZIBaseInstrument
+    blacklist_names = ["factory_reset"]
     functions = []
     parameters = []
     sub_modules = []
@@ -280,6 +281,9 @@ def generate_functions_info(functions: list, toolkit_class: object) -> list:
                 if signature.return_annotation
                 else "",
                 "is_node_dict": is_node_doc,
+                "is_awaitable": name in conf.ASYNC_FUNCTIONS,
+                "is_wait": name in conf.WAIT_FUNCTIONS,
+                "invalidates_caches": name not in conf.READ_ONLY_FUNCTIONS,
             }
         )
     return functions_info
@@ -414,6 +418,10 @@ def generate_qcodes_driver_modules(
         node_param.append("gridnode")
     if module_name == "daq_module":
         node_param.append("triggernode")
+    # functions that change the nodes of the device passed as ``device``
+    write_cache_functions = []
+    if module_name == "device_settings_module":
+        write_cache_functions.append("load_from_file")
     data = {
         "name": name,
         "module_name": module_name,
@@ -423,6 +431,8 @@ def generate_qcodes_driver_modules(
         else "ZIBaseModule",
         "functions": function_info,
         "node_param": node_param,
+        "write_cache_functions": write_cache_functions,
+        "timed_functions": conf.TIMED_FUNCTIONS,
     }
     templateLoader = jinja2.FileSystemLoader(searchpath=template_path)
     templateEnv = jinja2.Environment(loader=templateLoader)
@@ -1,28 +1,36 @@
-"""QCoDeS Drivers for Zurich Instruments devices."""
-
-from zhinst.qcodes.session import ZISession
-from zhinst.qcodes.device_creator import (
-    HDAWG,
-    MFLI,
-    MFIA,
-    PQSC,
-    SHFQA,
-    SHFQC,
-    SHFSG,
-    UHFLI,
-    UHFQA,
-    ZIDevice,
-    HF2,
-)
-
-from zhinst.toolkit import (
-    Waveforms,
-    CommandTable,
-    Sequence,
-    PollFlags,
-    AveragingMode,
-    SHFQAChannelMode,
-)
+"""QCoDeS Drivers for Zurich Instruments devices.
+
+The public objects are imported lazily on their first access. This keeps
+``import zhinst.qcodes`` cheap since the drivers pull in QCoDeS and
+zhinst-toolkit.
+"""
+import importlib
+import typing as t
+
+if t.TYPE_CHECKING:
+    from zhinst.qcodes.session import ZISession
+    from zhinst.qcodes.device_creator import (
+        HDAWG,
+        MFLI,
+        MFIA,
+        PQSC,
+        SHFQA,
+        SHFQC,
+        SHFSG,
+        UHFLI,
+        UHFQA,
+        ZIDevice,
+        HF2,
+    )
+
+    from zhinst.toolkit import (
+        Waveforms,
+        CommandTable,
+        Sequence,
+        PollFlags,
+        AveragingMode,
+        SHFQAChannelMode,
+    )
 
 try:
     from zhinst.qcodes._version import version as __version__
@@ -49,3 +57,39 @@ __all__ = [
     "AveragingMode",
     "SHFQAChannelMode",
 ]
+
+# Module from which each public object is imported on its first access.
+_LAZY_IMPORTS = {
+    "ZISession": "zhinst.qcodes.session",
+    "HDAWG": "zhinst.qcodes.device_creator",
+    "MFLI": "zhinst.qcodes.device_creator",
+    "MFIA": "zhinst.qcodes.device_creator",
+    "PQSC": "zhinst.qcodes.device_creator",
+    "SHFQA": "zhinst.qcodes.device_creator",
+    "SHFQC": "zhinst.qcodes.device_creator",
+    "SHFSG": "zhinst.qcodes.device_creator",
+    "UHFLI": "zhinst.qcodes.device_creator",
+    "UHFQA": "zhinst.qcodes.device_creator",
+    "ZIDevice": "zhinst.qcodes.device_creator",
+    "HF2": "zhinst.qcodes.device_creator",
+    "Waveforms": "zhinst.toolkit",
+    "CommandTable": "zhinst.toolkit",
+    "Sequence": "zhinst.toolkit",
+    "PollFlags": "zhinst.toolkit",
+    "AveragingMode": "zhinst.toolkit",
+    "SHFQAChannelMode": "zhinst.toolkit",
+}
+
+
+def __getattr__(name: str) -> t.Any:
+    try:
+        module = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> t.List[str]:
+    return sorted(set(globals()) | set(__all__))
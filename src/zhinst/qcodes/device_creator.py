@@ -29,6 +29,13 @@ class ZIDevice(ZIBaseInstrument):
         name: Name of the instrument in qcodes.
         raw: Flag if qcodes instance should only created with the nodes and
             not forwarding the toolkit functions. (default = False)
+        lazy: Flag if the QCoDeS parameters should only be created on their
+            first access instead of during the initialization. (default = False)
+        include: Glob patterns of the node paths that should be added as
+            parameters (e.g. ["/*/qachannels/*", "/*/system/*"]). If not
+            specified all nodes are added. (default = None)
+        exclude: Glob patterns of the node paths that should not be added as
+            parameters. Takes precedence over ``include``. (default = None)
         new_session: By default zhinst-qcodes reuses already existing data
             server session (within itself only), meaning only one session to a
             data server exists. Setting the flag will create a new session.
@@ -48,11 +55,22 @@ class ZIDevice(ZIBaseInstrument):
         interface: t.Optional[str] = None,
         name=None,
         raw=False,
+        lazy=False,
+        include: t.Optional[t.Sequence[str]] = None,
+        exclude: t.Optional[t.Sequence[str]] = None,
         new_session: bool = False,
     ):
         session = ZISession(host, port, hf2=False, new_session=new_session)
         tk_device = session.toolkit_session.connect_device(serial, interface=interface)
-        super().__init__(tk_device, session, name=name, raw=raw)
+        super().__init__(
+            tk_device,
+            session,
+            name=name,
+            raw=raw,
+            lazy=lazy,
+            include=include,
+            exclude=exclude,
+        )
         session.devices[self.serial] = self
 
 
@@ -70,6 +88,13 @@ class SHFQA(SHFQADriver):
         name: Name of the instrument in qcodes.
         raw: Flag if qcodes instance should only created with the nodes and
             not forwarding the toolkit functions. (default = False)
+        lazy: Flag if the QCoDeS parameters should only be created on their
+            first access instead of during the initialization. (default = False)
+        include: Glob patterns of the node paths that should be added as
+            parameters (e.g. ["/*/qachannels/*", "/*/system/*"]). If not
+            specified all nodes are added. (default = None)
+        exclude: Glob patterns of the node paths that should not be added as
+            parameters. Takes precedence over ``include``. (default = None)
         new_session: By default zhinst-qcodes reuses already existing data
             server session (within itself only), meaning only one session to a
             data server exists. Setting the flag will create a new session.
@@ -89,11 +114,22 @@ class SHFQA(SHFQADriver):
         interface: t.Optional[str] = None,
         name=None,
         raw=False,
+        lazy=False,
+        include: t.Optional[t.Sequence[str]] = None,
+        exclude: t.Optional[t.Sequence[str]] = None,
         new_session: bool = False,
     ):
         session = ZISession(host, port, hf2=False, new_session=new_session)
         tk_device = session.toolkit_session.connect_device(serial, interface=interface)
-        super().__init__(tk_device, session, name=name, raw=raw)
+        super().__init__(
+            tk_device,
+            session,
+            name=name,
+            raw=raw,
+            lazy=lazy,
+            include=include,
+            exclude=exclude,
+        )
         session.devices[self.serial] = self
 
 
@@ -111,6 +147,13 @@ class SHFSG(SHFSGDriver):
         name: Name of the instrument in qcodes.
         raw: Flag if qcodes instance should only created with the nodes and
             not forwarding the toolkit functions. (default = False)
+        lazy: Flag if the QCoDeS parameters should only be created on their
+            first access instead of during the initialization. (default = False)
+        include: Glob patterns of the node paths that should be added as
+            parameters (e.g. ["/*/qachannels/*", "/*/system/*"]). If not
+            specified all nodes are added. (default = None)
+        exclude: Glob patterns of the node paths that should not be added as
+            parameters. Takes precedence over ``include``. (default = None)
         new_session: By default zhinst-qcodes reuses already existing data
             server session (within itself only), meaning only one session to a
             data server exists. Setting the flag will create a new session.
@@ -130,11 +173,22 @@ class SHFSG(SHFSGDriver):
         interface: t.Optional[str] = None,
         name=None,
         raw=False,
+        lazy=False,
+        include: t.Optional[t.Sequence[str]] = None,
+        exclude: t.Optional[t.Sequence[str]] = None,
         new_session: bool = False,
     ):
         session = ZISession(host, port, hf2=False, new_session=new_session)
         tk_device = session.toolkit_session.connect_device(serial, interface=interface)
-        super().__init__(tk_device, session, name=name, raw=raw)
+        super().__init__(
+            tk_device,
+            session,
+            name=name,
+            raw=raw,
+            lazy=lazy,
+            include=include,
+            exclude=exclude,
+        )
         session.devices[self.serial] = self
 
 
@@ -152,6 +206,13 @@ class HDAWG(HDAWGDriver):
         name: Name of the instrument in qcodes.
         raw: Flag if qcodes instance should only created with the nodes and
             not forwarding the toolkit functions. (default = False)
+        lazy: Flag if the QCoDeS parameters should only be created on their
+            first access instead of during the initialization. (default = False)
+        include: Glob patterns of the node paths that should be added as
+            parameters (e.g. ["/*/qachannels/*", "/*/system/*"]). If not
+            specified all nodes are added. (default = None)
+        exclude: Glob patterns of the node paths that should not be added as
+            parameters. Takes precedence over ``include``. (default = None)
         new_session: By default zhinst-qcodes reuses already existing data
             server session (within itself only), meaning only one session to a
             data server exists. Setting the flag will create a new session.
@@ -171,11 +232,22 @@ class HDAWG(HDAWGDriver):
         interface: t.Optional[str] = None,
         name=None,
         raw=False,
+        lazy=False,
+        include: t.Optional[t.Sequence[str]] = None,
+        exclude: t.Optional[t.Sequence[str]] = None,
         new_session: bool = False,
     ):
         session = ZISession(host, port, hf2=False, new_session=new_session)
         tk_device = session.toolkit_session.connect_device(serial, interface=interface)
-        super().__init__(tk_device, session, name=name, raw=raw)
+        super().__init__(
+            tk_device,
+            session,
+            name=name,
+            raw=raw,
+            lazy=lazy,
+            include=include,
+            exclude=exclude,
+        )
         session.devices[self.serial] = self
 
 
@@ -193,6 +265,13 @@ class PQSC(PQSCDriver):
         name: Name of the instrument in qcodes.
         raw: Flag if qcodes instance should only created with the nodes and
             not forwarding the toolkit functions. (default = False)
+        lazy: Flag if the QCoDeS parameters should only be created on their
+            first access instead of during the initialization. (default = False)
+        include: Glob patterns of the node paths that should be added as
+            parameters (e.g. ["/*/qachannels/*", "/*/system/*"]). If not
+            specified all nodes are added. (default = None)
+        exclude: Glob patterns of the node paths that should not be added as
+            parameters. Takes precedence over ``include``. (default = None)
         new_session: By default zhinst-qcodes reuses already existing data
             server session (within itself only), meaning only one session to a
             data server exists. Setting the flag will create a new session.
@@ -212,11 +291,22 @@ class PQSC(PQSCDriver):
         interface: t.Optional[str] = None,
         name=None,
         raw=False,
+        lazy=False,
+        include: t.Optional[t.Sequence[str]] = None,
+        exclude: t.Optional[t.Sequence[str]] = None,
         new_session: bool = False,
     ):
         session = ZISession(host, port, hf2=False, new_session=new_session)
         tk_device = session.toolkit_session.connect_device(serial, interface=interface)
-        super().__init__(tk_device, session, name=name, raw=raw)
+        super().__init__(
+            tk_device,
+            session,
+            name=name,
+            raw=raw,
+            lazy=lazy,
+            include=include,
+            exclude=exclude,
+        )
         session.devices[self.serial] = self
 
 
@@ -234,6 +324,13 @@ class SHFQC(SHFQCDriver):
         name: Name of the instrument in qcodes.
         raw: Flag if qcodes instance should only created with the nodes and
             not forwarding the toolkit functions. (default = False)
+        lazy: Flag if the QCoDeS parameters should only be created on their
+            first access instead of during the initialization. (default = False)
+        include: Glob patterns of the node paths that should be added as
+            parameters (e.g. ["/*/qachannels/*", "/*/system/*"]). If not
+            specified all nodes are added. (default = None)
+        exclude: Glob patterns of the node paths that should not be added as
+            parameters. Takes precedence over ``include``. (default = None)
         new_session: By default zhinst-qcodes reuses already existing data
             server session (within itself only), meaning only one session to a
             data server exists. Setting the flag will create a new session.
@@ -253,11 +350,22 @@ class SHFQC(SHFQCDriver):
         interface: t.Optional[str] = None,
         name=None,
         raw=False,
+        lazy=False,
+        include: t.Optional[t.Sequence[str]] = None,
+        exclude: t.Optional[t.Sequence[str]] = None,
         new_session: bool = False,
     ):
         session = ZISession(host, port, hf2=False, new_session=new_session)
         tk_device = session.toolkit_session.connect_device(serial, interface=interface)
-        super().__init__(tk_device, session, name=name, raw=raw)
+        super().__init__(
+            tk_device,
+            session,
+            name=name,
+            raw=raw,
+            lazy=lazy,
+            include=include,
+            exclude=exclude,
+        )
         session.devices[self.serial] = self
 
 
@@ -275,6 +383,13 @@ class UHFLI(UHFLIDriver):
         name: Name of the instrument in qcodes.
         raw: Flag if qcodes instance should only created with the nodes and
             not forwarding the toolkit functions. (default = False)
+        lazy: Flag if the QCoDeS parameters should only be created on their
+            first access instead of during the initialization. (default = False)
+        include: Glob patterns of the node paths that should be added as
+            parameters (e.g. ["/*/qachannels/*", "/*/system/*"]). If not
+            specified all nodes are added. (default = None)
+        exclude: Glob patterns of the node paths that should not be added as
+            parameters. Takes precedence over ``include``. (default = None)
         new_session: By default zhinst-qcodes reuses already existing data
             server session (within itself only), meaning only one session to a
             data server exists. Setting the flag will create a new session.
@@ -294,11 +409,22 @@ class UHFLI(UHFLIDriver):
         interface: t.Optional[str] = None,
         name=None,
         raw=False,
+        lazy=False,
+        include: t.Optional[t.Sequence[str]] = None,
+        exclude: t.Optional[t.Sequence[str]] = None,
         new_session: bool = False,
     ):
         session = ZISession(host, port, hf2=False, new_session=new_session)
         tk_device = session.toolkit_session.connect_device(serial, interface=interface)
-        super().__init__(tk_device, session, name=name, raw=raw)
+        super().__init__(
+            tk_device,
+            session,
+            name=name,
+            raw=raw,
+            lazy=lazy,
+            include=include,
+            exclude=exclude,
+        )
         session.devices[self.serial] = self
 
 
@@ -316,6 +442,13 @@ class UHFQA(UHFQADriver):
         name: Name of the instrument in qcodes.
         raw: Flag if qcodes instance should only created with the nodes and
             not forwarding the toolkit functions. (default = False)
+        lazy: Flag if the QCoDeS parameters should only be created on their
+            first access instead of during the initialization. (default = False)
+        include: Glob patterns of the node paths that should be added as
+            parameters (e.g. ["/*/qachannels/*", "/*/system/*"]). If not
+            specified all nodes are added. (default = None)
+        exclude: Glob patterns of the node paths that should not be added as
+            parameters. Takes precedence over ``include``. (default = None)
         new_session: By default zhinst-qcodes reuses already existing data
             server session (within itself only), meaning only one session to a
             data server exists. Setting the flag will create a new session.
@@ -335,11 +468,22 @@ class UHFQA(UHFQADriver):
         interface: t.Optional[str] = None,
         name=None,
         raw=False,
+        lazy=False,
+        include: t.Optional[t.Sequence[str]] = None,
+        exclude: t.Optional[t.Sequence[str]] = None,
         new_session: bool = False,
     ):
         session = ZISession(host, port, hf2=False, new_session=new_session)
         tk_device = session.toolkit_session.connect_device(serial, interface=interface)
-        super().__init__(tk_device, session, name=name, raw=raw)
+        super().__init__(
+            tk_device,
+            session,
+            name=name,
+            raw=raw,
+            lazy=lazy,
+            include=include,
+            exclude=exclude,
+        )
         session.devices[self.serial] = self
 
 
@@ -357,6 +501,13 @@ class MFLI(ZIBaseInstrument):
         name: Name of the instrument in qcodes.
         raw: Flag if qcodes instance should only created with the nodes and
             not forwarding the toolkit functions. (default = False)
+        lazy: Flag if the QCoDeS parameters should only be created on their
+            first access instead of during the initialization. (default = False)
+        include: Glob patterns of the node paths that should be added as
+            parameters (e.g. ["/*/qachannels/*", "/*/system/*"]). If not
+            specified all nodes are added. (default = None)
+        exclude: Glob patterns of the node paths that should not be added as
+            parameters. Takes precedence over ``include``. (default = None)
         new_session: By default zhinst-qcodes reuses already existing data
             server session (within itself only), meaning only one session to a
             data server exists. Setting the flag will create a new session.
@@ -376,11 +527,22 @@ class MFLI(ZIBaseInstrument):
         interface: t.Optional[str] = None,
         name=None,
         raw=False,
+        lazy=False,
+        include: t.Optional[t.Sequence[str]] = None,
+        exclude: t.Optional[t.Sequence[str]] = None,
         new_session: bool = False,
     ):
         session = ZISession(host, port, hf2=False, new_session=new_session)
         tk_device = session.toolkit_session.connect_device(serial, interface=interface)
-        super().__init__(tk_device, session, name=name, raw=raw)
+        super().__init__(
+            tk_device,
+            session,
+            name=name,
+            raw=raw,
+            lazy=lazy,
+            include=include,
+            exclude=exclude,
+        )
         session.devices[self.serial] = self
 
 
@@ -398,6 +560,13 @@ class MFIA(ZIBaseInstrument):
         name: Name of the instrument in qcodes.
         raw: Flag if qcodes instance should only created with the nodes and
             not forwarding the toolkit functions. (default = False)
+        lazy: Flag if the QCoDeS parameters should only be created on their
+            first access instead of during the initialization. (default = False)
+        include: Glob patterns of the node paths that should be added as
+            parameters (e.g. ["/*/qachannels/*", "/*/system/*"]). If not
+            specified all nodes are added. (default = None)
+        exclude: Glob patterns of the node paths that should not be added as
+            parameters. Takes precedence over ``include``. (default = None)
         new_session: By default zhinst-qcodes reuses already existing data
             server session (within itself only), meaning only one session to a
             data server exists. Setting the flag will create a new session.
@@ -417,11 +586,22 @@ class MFIA(ZIBaseInstrument):
         interface: t.Optional[str] = None,
         name=None,
         raw=False,
+        lazy=False,
+        include: t.Optional[t.Sequence[str]] = None,
+        exclude: t.Optional[t.Sequence[str]] = None,
         new_session: bool = False,
     ):
         session = ZISession(host, port, hf2=False, new_session=new_session)
         tk_device = session.toolkit_session.connect_device(serial, interface=interface)
-        super().__init__(tk_device, session, name=name, raw=raw)
+        super().__init__(
+            tk_device,
+            session,
+            name=name,
+            raw=raw,
+            lazy=lazy,
+            include=include,
+            exclude=exclude,
+        )
         session.devices[self.serial] = self
 
 
@@ -439,6 +619,13 @@ class HF2(ZIBaseInstrument):
         name: Name of the instrument in qcodes.
         raw: Flag if qcodes instance should only created with the nodes and
             not forwarding the toolkit functions. (default = False)
+        lazy: Flag if the QCoDeS parameters should only be created on their
+            first access instead of during the initialization. (default = False)
+        include: Glob patterns of the node paths that should be added as
+            parameters (e.g. ["/*/qachannels/*", "/*/system/*"]). If not
+            specified all nodes are added. (default = None)
+        exclude: Glob patterns of the node paths that should not be added as
+            parameters. Takes precedence over ``include``. (default = None)
         new_session: By default zhinst-qcodes reuses already existing data
             server session (within itself only), meaning only one session to a
             data server exists. Setting the flag will create a new session.
@@ -458,9 +645,20 @@ class HF2(ZIBaseInstrument):
         interface: t.Optional[str] = None,
         name=None,
         raw=False,
+        lazy=False,
+        include: t.Optional[t.Sequence[str]] = None,
+        exclude: t.Optional[t.Sequence[str]] = None,
         new_session: bool = False,
     ):
         session = ZISession(host, port, hf2=True, new_session=new_session)
         tk_device = session.toolkit_session.connect_device(serial, interface=interface)
-        super().__init__(tk_device, session, name=name, raw=raw)
+        super().__init__(
+            tk_device,
+            session,
+            name=name,
+            raw=raw,
+            lazy=lazy,
+            include=include,
+            exclude=exclude,
+        )
         session.devices[self.serial] = self
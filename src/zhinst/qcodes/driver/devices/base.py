@@ -1,9 +1,16 @@
 """Base modules for the Zurich Instrument specific QCoDeS driver."""
 import typing as t
+from contextlib import contextmanager
 
 from zhinst.toolkit.driver.devices import DeviceType
 
-from zhinst.qcodes.qcodes_adaptions import init_nodetree, ZIInstrument
+from zhinst.qcodes.qcodes_adaptions import (
+    init_nodetree,
+    invalidate_caches,
+    node_metadata_table,
+    rebind_nodetree,
+    ZIInstrument,
+)
 
 if t.TYPE_CHECKING:
     from zhinst.qcodes.session import ZISession, Session
@@ -24,6 +31,13 @@ class ZIBaseInstrument(ZIInstrument):
         name: Name of the instrument in qcodes. (default = "zi_{dev_type}_{serial}")
         raw: Flag if qcodes instance should only created with the nodes and not
             forwarding the toolkit functions. (default = False)
+        lazy: Flag if the QCoDeS parameters should only be created on their first
+            access instead of during the initialization. (default = False)
+        include: Glob patterns of the node paths that should be added as
+            parameters (e.g. ["/*/qachannels/*", "/*/system/*"]). If not
+            specified all nodes are added. (default = None)
+        exclude: Glob patterns of the node paths that should not be added as
+            parameters. Takes precedence over ``include``. (default = None)
     """
 
     def __init__(
@@ -32,6 +46,9 @@ class ZIBaseInstrument(ZIInstrument):
         session: t.Union["ZISession", "Session", "Instrument"],
         name: t.Optional[str] = None,
         raw: bool = False,
+        lazy: bool = False,
+        include: t.Optional[t.Sequence[str]] = None,
+        exclude: t.Optional[t.Sequence[str]] = None,
     ):
         self._tk_object = tk_object
         self._session = session
@@ -39,11 +56,31 @@ class ZIBaseInstrument(ZIInstrument):
             name = (
                 f"zi_{tk_object.__class__.__name__.lower()}_{tk_object.serial.lower()}"
             )
-        super().__init__(name, self._tk_object.root)
+        super().__init__(
+            name,
+            self._tk_object.root,
+            latency_stats=getattr(session, "_latency_stats", None),
+        )
+        # Arguments to recreate the instrument (see ``Session.reconnect_device``)
+        self._init_kwargs = {
+            "name": name,
+            "raw": raw,
+            "lazy": lazy,
+            "include": include,
+            "exclude": exclude,
+        }
 
         if not raw:
             self._init_additional_nodes()
-        init_nodetree(self, self._tk_object.root, self._snapshot_cache)
+        init_nodetree(
+            self,
+            self._tk_object.root,
+            self._snapshot_cache,
+            lazy=lazy,
+            metadata_table=node_metadata_table(tk_object.device_type),
+            include=include,
+            exclude=exclude,
+        )
 
     def get_idn(self) -> t.Dict[str, t.Optional[str]]:
         """Fake a standard VISA ``*IDN?`` response."""
@@ -57,15 +94,39 @@ class ZIBaseInstrument(ZIInstrument):
     def _init_additional_nodes(self) -> None:
         """Init additional qcodes parameter."""
 
+    def _rebind(self, tk_object: DeviceType) -> bool:
+        """Bind the instrument to a new toolkit device object.
+
+        The existing QCoDeS hierarchy is kept and only the underlying toolkit
+        nodes are replaced. This is only possible if the node tree of the new
+        toolkit device (including the node information) did not change.
+
+        Args:
+            tk_object: New toolkit device object of the same device.
+
+        Returns:
+            Flag if the instrument could be bound to the new toolkit device.
+        """
+        if tk_object.root.raw_dict != self._tk_object.root.raw_dict:
+            return False
+        rebind_nodetree(self, tk_object)
+        self._tk_object = tk_object
+        return True
+
     def factory_reset(self, deep: bool = True) -> None:
         """Load the factory default settings.
 
+        Clears the write cache of the set-if-changed mode.
+
         Arguments:
             deep (bool): A flag that specifies if a synchronization
                 should be performed between the device and the data
                 server after loading the factory preset (default: True).
         """
-        return self._tk_object.factory_reset(deep=deep)
+        try:
+            return self._tk_object.factory_reset(deep=deep)
+        finally:
+            invalidate_caches(self)
 
     def check_compatibility(self) -> None:
         """Check if the software stack is compatible.
@@ -89,6 +150,7 @@ class ZIBaseInstrument(ZIInstrument):
         """Create a dictionary with all streaming nodes available."""
         return self._tk_object.get_streamingnodes()
 
+    @contextmanager
     def set_transaction(self):
         """Context manager for a transactional set.
 
@@ -109,7 +171,11 @@ class ZIBaseInstrument(ZIInstrument):
                     device.test[0].a(1)
                     device.test[1].a(2)
         """
-        return self._tk_object.set_transaction()
+        try:
+            with self._tk_object.set_transaction():
+                yield
+        finally:
+            self._snapshot_cache.invalidate()
 
     @property
     def serial(self) -> str:
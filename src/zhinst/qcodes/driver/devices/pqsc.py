@@ -1,6 +1,11 @@
 """Autogenerated module for the PQSC QCoDeS driver."""
 from typing import List, Union
 from zhinst.qcodes.driver.devices.base import ZIBaseInstrument
+from zhinst.qcodes.qcodes_adaptions import (
+    invalidate_caches,
+    run_async,
+    wait_async,
+)
 
 
 class PQSC(ZIBaseInstrument):
@@ -35,7 +40,12 @@ class PQSC(ZIBaseInstrument):
                 (default: None).
 
         """
-        return self._tk_object.arm(deep=deep, repetitions=repetitions, holdoff=holdoff)
+        try:
+            return self._tk_object.arm(
+                deep=deep, repetitions=repetitions, holdoff=holdoff
+            )
+        finally:
+            invalidate_caches(self)
 
     def run(self, *, deep: bool = True) -> None:
         """Start sending out triggers.
@@ -49,7 +59,10 @@ class PQSC(ZIBaseInstrument):
                 server after enabling the PQSC (default: True).
 
         """
-        return self._tk_object.run(deep=deep)
+        try:
+            return self._tk_object.run(deep=deep)
+        finally:
+            invalidate_caches(self)
 
     def arm_and_run(self, *, repetitions: int = None, holdoff: float = None) -> None:
         """Arm the PQSC and start sending out triggers.
@@ -67,7 +80,10 @@ class PQSC(ZIBaseInstrument):
                 (default: None).
 
         """
-        return self._tk_object.arm_and_run(repetitions=repetitions, holdoff=holdoff)
+        try:
+            return self._tk_object.arm_and_run(repetitions=repetitions, holdoff=holdoff)
+        finally:
+            invalidate_caches(self)
 
     def stop(self, *, deep: bool = True) -> None:
         """Stop the trigger generation.
@@ -78,7 +94,19 @@ class PQSC(ZIBaseInstrument):
                 server after disabling the PQSC (default: True).
 
         """
-        return self._tk_object.stop(deep=deep)
+        try:
+            return self._tk_object.stop(deep=deep)
+        finally:
+            invalidate_caches(self)
+
+    async def stop_async(self, *, deep: bool = True) -> None:
+        """Asynchronous version of ``stop``.
+
+        Does not block the event loop. The call is executed in order with the
+        other asynchronous operations of the instrument (see
+        ``zhinst.qcodes.qcodes_adaptions.run_async``).
+        """
+        return await run_async(self, self.stop, deep=deep)
 
     def wait_done(self, *, timeout: float = 10, sleep_time: float = 0.005) -> None:
         """Wait until trigger generation and feedback processing is done.
@@ -95,6 +123,19 @@ class PQSC(ZIBaseInstrument):
         """
         return self._tk_object.wait_done(timeout=timeout, sleep_time=sleep_time)
 
+    async def wait_done_async(
+        self, *, timeout: float = 10, sleep_time: float = 0.005
+    ) -> None:
+        """Asynchronous version of ``wait_done``.
+
+        Does not block the event loop and does not delay the other asynchronous
+        operations of the instrument (see
+        ``zhinst.qcodes.qcodes_adaptions.wait_async``).
+        """
+        return await wait_async(
+            self, self.wait_done, timeout=timeout, sleep_time=sleep_time
+        )
+
     def check_ref_clock(self, *, timeout: int = 30, sleep_time: int = 1) -> bool:
         """Check if reference clock is locked successfully.
 
@@ -5,7 +5,13 @@ from zhinst.toolkit import Sequence, Waveforms
 from zhinst.toolkit.interface import AveragingMode, SHFQAChannelMode
 from zhinst.utils.shfqa.multistate import QuditSettings
 from zhinst.qcodes.driver.devices.base import ZIBaseInstrument
-from zhinst.qcodes.qcodes_adaptions import ZINode, ZIChannelList
+from zhinst.qcodes.qcodes_adaptions import (
+    invalidate_caches,
+    run_async,
+    wait_async,
+    ZIChannelList,
+    ZINode,
+)
 
 
 class Generator(ZINode):
@@ -56,7 +62,10 @@ class Generator(ZINode):
 
             Check the acknowledged value instead of using `wait_for_state_change`.
         """
-        return self._tk_object.enable_sequencer(single=single)
+        try:
+            return self._tk_object.enable_sequencer(single=single)
+        finally:
+            invalidate_caches(self)
 
     def wait_done(self, *, timeout: float = 10, sleep_time: float = 0.005) -> None:
         """Wait until the AWG is finished.
@@ -74,6 +83,19 @@ class Generator(ZINode):
         """
         return self._tk_object.wait_done(timeout=timeout, sleep_time=sleep_time)
 
+    async def wait_done_async(
+        self, *, timeout: float = 10, sleep_time: float = 0.005
+    ) -> None:
+        """Asynchronous version of ``wait_done``.
+
+        Does not block the event loop and does not delay the other asynchronous
+        operations of the instrument (see
+        ``zhinst.qcodes.qcodes_adaptions.wait_async``).
+        """
+        return await wait_async(
+            self, self.wait_done, timeout=timeout, sleep_time=sleep_time
+        )
+
     def compile_sequencer_program(
         self, sequencer_program: Union[str, Sequence], **kwargs: Union[str, int]
     ) -> Tuple[bytes, Dict[str, Any]]:
@@ -161,9 +183,12 @@ class Generator(ZINode):
             program. This speeds of the compilation and also enables parallel
             compilation/upload.
         """
-        return self._tk_object.load_sequencer_program(
-            sequencer_program=sequencer_program, **kwargs
-        )
+        try:
+            return self._tk_object.load_sequencer_program(
+                sequencer_program=sequencer_program, **kwargs
+            )
+        finally:
+            invalidate_caches(self)
 
     def write_to_waveform_memory(
         self, pulses: Union[Waveforms, dict], *, clear_existing: bool = True
@@ -175,9 +200,12 @@ class Generator(ZINode):
             clear_existing: Flag whether to clear the waveform memory before the
                 present upload. (default = True)
         """
-        return self._tk_object.write_to_waveform_memory(
-            pulses=pulses, clear_existing=clear_existing
-        )
+        try:
+            return self._tk_object.write_to_waveform_memory(
+                pulses=pulses, clear_existing=clear_existing
+            )
+        finally:
+            invalidate_caches(self)
 
     def read_from_waveform_memory(self, slots: List[int] = None) -> Waveforms:
         """Read pulses from the waveform memory.
@@ -201,9 +229,12 @@ class Generator(ZINode):
                 For the list of available values, use `available_aux_trigger_inputs`
             play_pulse_delay: Delay in seconds before the start of waveform playback.
         """
-        return self._tk_object.configure_sequencer_triggering(
-            aux_trigger=aux_trigger, play_pulse_delay=play_pulse_delay
-        )
+        try:
+            return self._tk_object.configure_sequencer_triggering(
+                aux_trigger=aux_trigger, play_pulse_delay=play_pulse_delay
+            )
+        finally:
+            invalidate_caches(self)
 
     @property
     def available_aux_trigger_inputs(self) -> List:
@@ -242,7 +273,12 @@ class Qudit(ZINode):
             enable: Whether to enable the qudit. (default: True)
 
         """
-        return self._tk_object.configure(qudit_settings=qudit_settings, enable=enable)
+        try:
+            return self._tk_object.configure(
+                qudit_settings=qudit_settings, enable=enable
+            )
+        finally:
+            invalidate_caches(self)
 
 
 class MultiState(ZINode):
@@ -346,16 +382,22 @@ class Readout(ZINode):
             averaging_mode: Select the averaging order of the result, with
                 0 = cyclic and 1 = sequential.
         """
-        return self._tk_object.configure_result_logger(
-            result_source=result_source,
-            result_length=result_length,
-            num_averages=num_averages,
-            averaging_mode=averaging_mode,
-        )
+        try:
+            return self._tk_object.configure_result_logger(
+                result_source=result_source,
+                result_length=result_length,
+                num_averages=num_averages,
+                averaging_mode=averaging_mode,
+            )
+        finally:
+            invalidate_caches(self)
 
     def run(self) -> None:
         """Reset and enable the result logger."""
-        return self._tk_object.run()
+        try:
+            return self._tk_object.run()
+        finally:
+            invalidate_caches(self)
 
     def stop(self, *, timeout: float = 10, sleep_time: float = 0.05) -> None:
         """Stop the result logger.
@@ -369,7 +411,21 @@ class Readout(ZINode):
             TimeoutError: The result logger could not been stopped within the
                 given time.
         """
-        return self._tk_object.stop(timeout=timeout, sleep_time=sleep_time)
+        try:
+            return self._tk_object.stop(timeout=timeout, sleep_time=sleep_time)
+        finally:
+            invalidate_caches(self)
+
+    async def stop_async(
+        self, *, timeout: float = 10, sleep_time: float = 0.05
+    ) -> None:
+        """Asynchronous version of ``stop``.
+
+        Does not block the event loop. The call is executed in order with the
+        other asynchronous operations of the instrument (see
+        ``zhinst.qcodes.qcodes_adaptions.run_async``).
+        """
+        return await run_async(self, self.stop, timeout=timeout, sleep_time=sleep_time)
 
     def wait_done(self, *, timeout: float = 10, sleep_time: float = 0.05) -> None:
         """Wait until the readout is finished.
@@ -385,6 +441,19 @@ class Readout(ZINode):
         """
         return self._tk_object.wait_done(timeout=timeout, sleep_time=sleep_time)
 
+    async def wait_done_async(
+        self, *, timeout: float = 10, sleep_time: float = 0.05
+    ) -> None:
+        """Asynchronous version of ``wait_done``.
+
+        Does not block the event loop and does not delay the other asynchronous
+        operations of the instrument (see
+        ``zhinst.qcodes.qcodes_adaptions.wait_async``).
+        """
+        return await wait_async(
+            self, self.wait_done, timeout=timeout, sleep_time=sleep_time
+        )
+
     def read(self, *, timeout: float = 10) -> np.array:
         """Waits until the logger finished recording and returns the measured data.
 
@@ -414,11 +483,14 @@ class Readout(ZINode):
             clear_existing: Flag whether to clear the waveform memory before
                 the present upload. (default = True)
         """
-        return self._tk_object.write_integration_weights(
-            weights=weights,
-            integration_delay=integration_delay,
-            clear_existing=clear_existing,
-        )
+        try:
+            return self._tk_object.write_integration_weights(
+                weights=weights,
+                integration_delay=integration_delay,
+                clear_existing=clear_existing,
+            )
+        finally:
+            invalidate_caches(self)
 
     def read_integration_weights(self, slots: List[int] = None) -> Waveforms:
         """Read integration weights from the waveform memory.
@@ -466,15 +538,21 @@ class Spectroscopy(ZINode):
             num_averages: Number of averages, will be rounded to 2^n.
             averaging_mode: Averaging order of the result.
         """
-        return self._tk_object.configure_result_logger(
-            result_length=result_length,
-            num_averages=num_averages,
-            averaging_mode=averaging_mode,
-        )
+        try:
+            return self._tk_object.configure_result_logger(
+                result_length=result_length,
+                num_averages=num_averages,
+                averaging_mode=averaging_mode,
+            )
+        finally:
+            invalidate_caches(self)
 
     def run(self) -> None:
         """Resets and enables the spectroscopy result logger."""
-        return self._tk_object.run()
+        try:
+            return self._tk_object.run()
+        finally:
+            invalidate_caches(self)
 
     def stop(self, *, timeout: float = 10, sleep_time: float = 0.05) -> None:
         """Stop the result logger.
@@ -489,7 +567,21 @@ class Spectroscopy(ZINode):
                 given time.
 
         """
-        return self._tk_object.stop(timeout=timeout, sleep_time=sleep_time)
+        try:
+            return self._tk_object.stop(timeout=timeout, sleep_time=sleep_time)
+        finally:
+            invalidate_caches(self)
+
+    async def stop_async(
+        self, *, timeout: float = 10, sleep_time: float = 0.05
+    ) -> None:
+        """Asynchronous version of ``stop``.
+
+        Does not block the event loop. The call is executed in order with the
+        other asynchronous operations of the instrument (see
+        ``zhinst.qcodes.qcodes_adaptions.run_async``).
+        """
+        return await run_async(self, self.stop, timeout=timeout, sleep_time=sleep_time)
 
     def wait_done(self, *, timeout: float = 10, sleep_time: float = 0.05) -> None:
         """Wait until spectroscopy is finished.
@@ -507,6 +599,19 @@ class Spectroscopy(ZINode):
         """
         return self._tk_object.wait_done(timeout=timeout, sleep_time=sleep_time)
 
+    async def wait_done_async(
+        self, *, timeout: float = 10, sleep_time: float = 0.05
+    ) -> None:
+        """Asynchronous version of ``wait_done``.
+
+        Does not block the event loop and does not delay the other asynchronous
+        operations of the instrument (see
+        ``zhinst.qcodes.qcodes_adaptions.wait_async``).
+        """
+        return await wait_async(
+            self, self.wait_done, timeout=timeout, sleep_time=sleep_time
+        )
+
     def read(self, *, timeout: float = 10) -> np.array:
         """Waits until the logger finished recording and returns the measured data.
 
@@ -595,12 +700,15 @@ class QAChannel(ZINode):
             center_frequency: Center frequency of the analysis band [Hz]
             mode: Select between spectroscopy and readout mode.
         """
-        return self._tk_object.configure_channel(
-            input_range=input_range,
-            output_range=output_range,
-            center_frequency=center_frequency,
-            mode=mode,
-        )
+        try:
+            return self._tk_object.configure_channel(
+                input_range=input_range,
+                output_range=output_range,
+                center_frequency=center_frequency,
+                mode=mode,
+            )
+        finally:
+            invalidate_caches(self)
 
 
 class SHFScope(ZINode):
@@ -641,9 +749,12 @@ class SHFScope(ZINode):
             TimeoutError: The scope did not start within the specified
                 timeout.
         """
-        return self._tk_object.run(
-            single=single, timeout=timeout, sleep_time=sleep_time
-        )
+        try:
+            return self._tk_object.run(
+                single=single, timeout=timeout, sleep_time=sleep_time
+            )
+        finally:
+            invalidate_caches(self)
 
     def stop(self, *, timeout: float = 10, sleep_time: float = 0.005) -> None:
         """Stop the scope recording.
@@ -658,7 +769,21 @@ class SHFScope(ZINode):
             TimeoutError: The scope did not stop within the specified
                 timeout.
         """
-        return self._tk_object.stop(timeout=timeout, sleep_time=sleep_time)
+        try:
+            return self._tk_object.stop(timeout=timeout, sleep_time=sleep_time)
+        finally:
+            invalidate_caches(self)
+
+    async def stop_async(
+        self, *, timeout: float = 10, sleep_time: float = 0.005
+    ) -> None:
+        """Asynchronous version of ``stop``.
+
+        Does not block the event loop. The call is executed in order with the
+        other asynchronous operations of the instrument (see
+        ``zhinst.qcodes.qcodes_adaptions.run_async``).
+        """
+        return await run_async(self, self.stop, timeout=timeout, sleep_time=sleep_time)
 
     def wait_done(self, *, timeout: float = 10, sleep_time: float = 0.005) -> None:
         """Wait until the scope recording is finished.
@@ -675,6 +800,19 @@ class SHFScope(ZINode):
         """
         return self._tk_object.wait_done(timeout=timeout, sleep_time=sleep_time)
 
+    async def wait_done_async(
+        self, *, timeout: float = 10, sleep_time: float = 0.005
+    ) -> None:
+        """Asynchronous version of ``wait_done``.
+
+        Does not block the event loop and does not delay the other asynchronous
+        operations of the instrument (see
+        ``zhinst.qcodes.qcodes_adaptions.wait_async``).
+        """
+        return await wait_async(
+            self, self.wait_done, timeout=timeout, sleep_time=sleep_time
+        )
+
     def configure(
         self,
         *,
@@ -705,14 +843,17 @@ class SHFScope(ZINode):
             trigger_delay: delay in samples specifying the time between the
                 start of data acquisition and reception of a trigger.
         """
-        return self._tk_object.configure(
-            input_select=input_select,
-            num_samples=num_samples,
-            trigger_input=trigger_input,
-            num_segments=num_segments,
-            num_averages=num_averages,
-            trigger_delay=trigger_delay,
-        )
+        try:
+            return self._tk_object.configure(
+                input_select=input_select,
+                num_samples=num_samples,
+                trigger_input=trigger_input,
+                num_segments=num_segments,
+                num_averages=num_averages,
+                trigger_delay=trigger_delay,
+            )
+        finally:
+            invalidate_caches(self)
 
     def read(self, *, timeout: float = 10) -> tuple:
         """Read out the recorded data from the scope.
@@ -790,16 +931,6 @@ class SHFQA(ZIBaseInstrument):
             # channel_list.lock()
             self.add_submodule("scopes", channel_list)
 
-    def factory_reset(self, *, deep: bool = True) -> None:
-        """Load the factory default settings.
-
-        Args:
-            deep: A flag that specifies if a synchronization
-                should be performed between the device and the data
-                server after loading the factory preset (default: True).
-        """
-        return self._tk_object.factory_reset(deep=deep)
-
     def start_continuous_sw_trigger(
         self, *, num_triggers: int, wait_time: float
     ) -> None:
@@ -815,9 +946,12 @@ class SHFQA(ZIBaseInstrument):
             num_triggers: Number of triggers to be issued
             wait_time: Time between triggers in seconds
         """
-        return self._tk_object.start_continuous_sw_trigger(
-            num_triggers=num_triggers, wait_time=wait_time
-        )
+        try:
+            return self._tk_object.start_continuous_sw_trigger(
+                num_triggers=num_triggers, wait_time=wait_time
+            )
+        finally:
+            invalidate_caches(self)
 
     @property
     def max_qubits_per_channel(self) -> int:
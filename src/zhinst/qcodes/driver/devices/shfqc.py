@@ -5,7 +5,13 @@ from zhinst.toolkit import CommandTable, Waveforms, Sequence
 from zhinst.toolkit.interface import AveragingMode, SHFQAChannelMode
 from zhinst.utils.shfqa.multistate import QuditSettings
 from zhinst.qcodes.driver.devices.base import ZIBaseInstrument
-from zhinst.qcodes.qcodes_adaptions import ZINode, ZIChannelList
+from zhinst.qcodes.qcodes_adaptions import (
+    invalidate_caches,
+    run_async,
+    wait_async,
+    ZIChannelList,
+    ZINode,
+)
 
 
 class CommandTableNode(ZINode):
@@ -84,9 +90,12 @@ class CommandTableNode(ZINode):
             New Flag `check_upload` that makes the upload check optional.
             `check_status` is only called when not in a ongoing transaction.
         """
-        return self._tk_object.upload_to_device(
-            ct=ct, validate=validate, check_upload=check_upload
-        )
+        try:
+            return self._tk_object.upload_to_device(
+                ct=ct, validate=validate, check_upload=check_upload
+            )
+        finally:
+            invalidate_caches(self)
 
     def load_from_device(self) -> CommandTable:
         """Load command table from the device.
@@ -138,7 +147,10 @@ class AWGCore(ZINode):
 
             Check the acknowledged value instead of using `wait_for_state_change`.
         """
-        return self._tk_object.enable_sequencer(single=single)
+        try:
+            return self._tk_object.enable_sequencer(single=single)
+        finally:
+            invalidate_caches(self)
 
     def wait_done(self, *, timeout: float = 10, sleep_time: float = 0.005) -> None:
         """Wait until the AWG is finished.
@@ -156,6 +168,19 @@ class AWGCore(ZINode):
         """
         return self._tk_object.wait_done(timeout=timeout, sleep_time=sleep_time)
 
+    async def wait_done_async(
+        self, *, timeout: float = 10, sleep_time: float = 0.005
+    ) -> None:
+        """Asynchronous version of ``wait_done``.
+
+        Does not block the event loop and does not delay the other asynchronous
+        operations of the instrument (see
+        ``zhinst.qcodes.qcodes_adaptions.wait_async``).
+        """
+        return await wait_async(
+            self, self.wait_done, timeout=timeout, sleep_time=sleep_time
+        )
+
     def compile_sequencer_program(
         self, sequencer_program: Union[str, Sequence], **kwargs: Union[str, int]
     ) -> Tuple[bytes, Dict[str, Any]]:
@@ -243,9 +268,12 @@ class AWGCore(ZINode):
             program. This speeds of the compilation and also enables parallel
             compilation/upload.
         """
-        return self._tk_object.load_sequencer_program(
-            sequencer_program=sequencer_program, **kwargs
-        )
+        try:
+            return self._tk_object.load_sequencer_program(
+                sequencer_program=sequencer_program, **kwargs
+            )
+        finally:
+            invalidate_caches(self)
 
     def write_to_waveform_memory(
         self, waveforms: Waveforms, indexes: list = None
@@ -265,9 +293,12 @@ class AWGCore(ZINode):
             Removed `validate` flag and functionality. The validation check is
             now done in the `Waveforms.validate` function.
         """
-        return self._tk_object.write_to_waveform_memory(
-            waveforms=waveforms, indexes=indexes
-        )
+        try:
+            return self._tk_object.write_to_waveform_memory(
+                waveforms=waveforms, indexes=indexes
+            )
+        finally:
+            invalidate_caches(self)
 
     def read_from_waveform_memory(self, indexes: List[int] = None) -> Waveforms:
         """Read waveforms from the waveform memory.
@@ -297,11 +328,14 @@ class AWGCore(ZINode):
                 the sequencer. For a list of available values use
                 `available_trigger_slopes`
         """
-        return self._tk_object.configure_marker_and_trigger(
-            trigger_in_source=trigger_in_source,
-            trigger_in_slope=trigger_in_slope,
-            marker_out_source=marker_out_source,
-        )
+        try:
+            return self._tk_object.configure_marker_and_trigger(
+                trigger_in_source=trigger_in_source,
+                trigger_in_slope=trigger_in_slope,
+                marker_out_source=marker_out_source,
+            )
+        finally:
+            invalidate_caches(self)
 
     @property
     def available_trigger_inputs(self) -> List:
@@ -364,12 +398,15 @@ class SGChannel(ZINode):
             rf_path: Flag if the RF(True) or LF(False) path should be
                 configured.
         """
-        return self._tk_object.configure_channel(
-            enable=enable,
-            output_range=output_range,
-            center_frequency=center_frequency,
-            rf_path=rf_path,
-        )
+        try:
+            return self._tk_object.configure_channel(
+                enable=enable,
+                output_range=output_range,
+                center_frequency=center_frequency,
+                rf_path=rf_path,
+            )
+        finally:
+            invalidate_caches(self)
 
     def configure_pulse_modulation(
         self,
@@ -400,15 +437,18 @@ class SGChannel(ZINode):
             sine_generator_index: Selects which sine generator to use on a
                 given channel.
         """
-        return self._tk_object.configure_pulse_modulation(
-            enable=enable,
-            osc_index=osc_index,
-            osc_frequency=osc_frequency,
-            phase=phase,
-            global_amp=global_amp,
-            gains=gains,
-            sine_generator_index=sine_generator_index,
-        )
+        try:
+            return self._tk_object.configure_pulse_modulation(
+                enable=enable,
+                osc_index=osc_index,
+                osc_frequency=osc_frequency,
+                phase=phase,
+                global_amp=global_amp,
+                gains=gains,
+                sine_generator_index=sine_generator_index,
+            )
+        finally:
+            invalidate_caches(self)
 
     def configure_sine_generation(
         self,
@@ -439,14 +479,17 @@ class SGChannel(ZINode):
             sine_generator_index: Selects which sine generator to use on a given
                 channel
         """
-        return self._tk_object.configure_sine_generation(
-            enable=enable,
-            osc_index=osc_index,
-            osc_frequency=osc_frequency,
-            phase=phase,
-            gains=gains,
-            sine_generator_index=sine_generator_index,
-        )
+        try:
+            return self._tk_object.configure_sine_generation(
+                enable=enable,
+                osc_index=osc_index,
+                osc_frequency=osc_frequency,
+                phase=phase,
+                gains=gains,
+                sine_generator_index=sine_generator_index,
+            )
+        finally:
+            invalidate_caches(self)
 
     @property
     def awg_modulation_freq(self) -> float:
@@ -505,7 +548,10 @@ class Generator(ZINode):
 
             Check the acknowledged value instead of using `wait_for_state_change`.
         """
-        return self._tk_object.enable_sequencer(single=single)
+        try:
+            return self._tk_object.enable_sequencer(single=single)
+        finally:
+            invalidate_caches(self)
 
     def wait_done(self, *, timeout: float = 10, sleep_time: float = 0.005) -> None:
         """Wait until the AWG is finished.
@@ -523,6 +569,19 @@ class Generator(ZINode):
         """
         return self._tk_object.wait_done(timeout=timeout, sleep_time=sleep_time)
 
+    async def wait_done_async(
+        self, *, timeout: float = 10, sleep_time: float = 0.005
+    ) -> None:
+        """Asynchronous version of ``wait_done``.
+
+        Does not block the event loop and does not delay the other asynchronous
+        operations of the instrument (see
+        ``zhinst.qcodes.qcodes_adaptions.wait_async``).
+        """
+        return await wait_async(
+            self, self.wait_done, timeout=timeout, sleep_time=sleep_time
+        )
+
     def compile_sequencer_program(
         self, sequencer_program: Union[str, Sequence], **kwargs: Union[str, int]
     ) -> Tuple[bytes, Dict[str, Any]]:
@@ -610,9 +669,12 @@ class Generator(ZINode):
             program. This speeds of the compilation and also enables parallel
             compilation/upload.
         """
-        return self._tk_object.load_sequencer_program(
-            sequencer_program=sequencer_program, **kwargs
-        )
+        try:
+            return self._tk_object.load_sequencer_program(
+                sequencer_program=sequencer_program, **kwargs
+            )
+        finally:
+            invalidate_caches(self)
 
     def write_to_waveform_memory(
         self, pulses: Union[Waveforms, dict], *, clear_existing: bool = True
@@ -624,9 +686,12 @@ class Generator(ZINode):
             clear_existing: Flag whether to clear the waveform memory before the
                 present upload. (default = True)
         """
-        return self._tk_object.write_to_waveform_memory(
-            pulses=pulses, clear_existing=clear_existing
-        )
+        try:
+            return self._tk_object.write_to_waveform_memory(
+                pulses=pulses, clear_existing=clear_existing
+            )
+        finally:
+            invalidate_caches(self)
 
     def read_from_waveform_memory(self, slots: List[int] = None) -> Waveforms:
         """Read pulses from the waveform memory.
@@ -650,9 +715,12 @@ class Generator(ZINode):
                 For the list of available values, use `available_aux_trigger_inputs`
             play_pulse_delay: Delay in seconds before the start of waveform playback.
         """
-        return self._tk_object.configure_sequencer_triggering(
-            aux_trigger=aux_trigger, play_pulse_delay=play_pulse_delay
-        )
+        try:
+            return self._tk_object.configure_sequencer_triggering(
+                aux_trigger=aux_trigger, play_pulse_delay=play_pulse_delay
+            )
+        finally:
+            invalidate_caches(self)
 
     @property
     def available_aux_trigger_inputs(self) -> List:
@@ -691,7 +759,12 @@ class Qudit(ZINode):
             enable: Whether to enable the qudit. (default: True)
 
         """
-        return self._tk_object.configure(qudit_settings=qudit_settings, enable=enable)
+        try:
+            return self._tk_object.configure(
+                qudit_settings=qudit_settings, enable=enable
+            )
+        finally:
+            invalidate_caches(self)
 
 
 class MultiState(ZINode):
@@ -795,16 +868,22 @@ class Readout(ZINode):
             averaging_mode: Select the averaging order of the result, with
                 0 = cyclic and 1 = sequential.
         """
-        return self._tk_object.configure_result_logger(
-            result_source=result_source,
-            result_length=result_length,
-            num_averages=num_averages,
-            averaging_mode=averaging_mode,
-        )
+        try:
+            return self._tk_object.configure_result_logger(
+                result_source=result_source,
+                result_length=result_length,
+                num_averages=num_averages,
+                averaging_mode=averaging_mode,
+            )
+        finally:
+            invalidate_caches(self)
 
     def run(self) -> None:
         """Reset and enable the result logger."""
-        return self._tk_object.run()
+        try:
+            return self._tk_object.run()
+        finally:
+            invalidate_caches(self)
 
     def stop(self, *, timeout: float = 10, sleep_time: float = 0.05) -> None:
         """Stop the result logger.
@@ -818,7 +897,21 @@ class Readout(ZINode):
             TimeoutError: The result logger could not been stopped within the
                 given time.
         """
-        return self._tk_object.stop(timeout=timeout, sleep_time=sleep_time)
+        try:
+            return self._tk_object.stop(timeout=timeout, sleep_time=sleep_time)
+        finally:
+            invalidate_caches(self)
+
+    async def stop_async(
+        self, *, timeout: float = 10, sleep_time: float = 0.05
+    ) -> None:
+        """Asynchronous version of ``stop``.
+
+        Does not block the event loop. The call is executed in order with the
+        other asynchronous operations of the instrument (see
+        ``zhinst.qcodes.qcodes_adaptions.run_async``).
+        """
+        return await run_async(self, self.stop, timeout=timeout, sleep_time=sleep_time)
 
     def wait_done(self, *, timeout: float = 10, sleep_time: float = 0.05) -> None:
         """Wait until the readout is finished.
@@ -834,6 +927,19 @@ class Readout(ZINode):
         """
         return self._tk_object.wait_done(timeout=timeout, sleep_time=sleep_time)
 
+    async def wait_done_async(
+        self, *, timeout: float = 10, sleep_time: float = 0.05
+    ) -> None:
+        """Asynchronous version of ``wait_done``.
+
+        Does not block the event loop and does not delay the other asynchronous
+        operations of the instrument (see
+        ``zhinst.qcodes.qcodes_adaptions.wait_async``).
+        """
+        return await wait_async(
+            self, self.wait_done, timeout=timeout, sleep_time=sleep_time
+        )
+
     def read(self, *, timeout: float = 10) -> np.array:
         """Waits until the logger finished recording and returns the measured data.
 
@@ -863,11 +969,14 @@ class Readout(ZINode):
             clear_existing: Flag whether to clear the waveform memory before
                 the present upload. (default = True)
         """
-        return self._tk_object.write_integration_weights(
-            weights=weights,
-            integration_delay=integration_delay,
-            clear_existing=clear_existing,
-        )
+        try:
+            return self._tk_object.write_integration_weights(
+                weights=weights,
+                integration_delay=integration_delay,
+                clear_existing=clear_existing,
+            )
+        finally:
+            invalidate_caches(self)
 
     def read_integration_weights(self, slots: List[int] = None) -> Waveforms:
         """Read integration weights from the waveform memory.
@@ -915,15 +1024,21 @@ class Spectroscopy(ZINode):
             num_averages: Number of averages, will be rounded to 2^n.
             averaging_mode: Averaging order of the result.
         """
-        return self._tk_object.configure_result_logger(
-            result_length=result_length,
-            num_averages=num_averages,
-            averaging_mode=averaging_mode,
-        )
+        try:
+            return self._tk_object.configure_result_logger(
+                result_length=result_length,
+                num_averages=num_averages,
+                averaging_mode=averaging_mode,
+            )
+        finally:
+            invalidate_caches(self)
 
     def run(self) -> None:
         """Resets and enables the spectroscopy result logger."""
-        return self._tk_object.run()
+        try:
+            return self._tk_object.run()
+        finally:
+            invalidate_caches(self)
 
     def stop(self, *, timeout: float = 10, sleep_time: float = 0.05) -> None:
         """Stop the result logger.
@@ -938,7 +1053,21 @@ class Spectroscopy(ZINode):
                 given time.
 
         """
-        return self._tk_object.stop(timeout=timeout, sleep_time=sleep_time)
+        try:
+            return self._tk_object.stop(timeout=timeout, sleep_time=sleep_time)
+        finally:
+            invalidate_caches(self)
+
+    async def stop_async(
+        self, *, timeout: float = 10, sleep_time: float = 0.05
+    ) -> None:
+        """Asynchronous version of ``stop``.
+
+        Does not block the event loop. The call is executed in order with the
+        other asynchronous operations of the instrument (see
+        ``zhinst.qcodes.qcodes_adaptions.run_async``).
+        """
+        return await run_async(self, self.stop, timeout=timeout, sleep_time=sleep_time)
 
     def wait_done(self, *, timeout: float = 10, sleep_time: float = 0.05) -> None:
         """Wait until spectroscopy is finished.
@@ -956,6 +1085,19 @@ class Spectroscopy(ZINode):
         """
         return self._tk_object.wait_done(timeout=timeout, sleep_time=sleep_time)
 
+    async def wait_done_async(
+        self, *, timeout: float = 10, sleep_time: float = 0.05
+    ) -> None:
+        """Asynchronous version of ``wait_done``.
+
+        Does not block the event loop and does not delay the other asynchronous
+        operations of the instrument (see
+        ``zhinst.qcodes.qcodes_adaptions.wait_async``).
+        """
+        return await wait_async(
+            self, self.wait_done, timeout=timeout, sleep_time=sleep_time
+        )
+
     def read(self, *, timeout: float = 10) -> np.array:
         """Waits until the logger finished recording and returns the measured data.
 
@@ -1044,12 +1186,15 @@ class QAChannel(ZINode):
             center_frequency: Center frequency of the analysis band [Hz]
             mode: Select between spectroscopy and readout mode.
         """
-        return self._tk_object.configure_channel(
-            input_range=input_range,
-            output_range=output_range,
-            center_frequency=center_frequency,
-            mode=mode,
-        )
+        try:
+            return self._tk_object.configure_channel(
+                input_range=input_range,
+                output_range=output_range,
+                center_frequency=center_frequency,
+                mode=mode,
+            )
+        finally:
+            invalidate_caches(self)
 
 
 class SHFScope(ZINode):
@@ -1090,9 +1235,12 @@ class SHFScope(ZINode):
             TimeoutError: The scope did not start within the specified
                 timeout.
         """
-        return self._tk_object.run(
-            single=single, timeout=timeout, sleep_time=sleep_time
-        )
+        try:
+            return self._tk_object.run(
+                single=single, timeout=timeout, sleep_time=sleep_time
+            )
+        finally:
+            invalidate_caches(self)
 
     def stop(self, *, timeout: float = 10, sleep_time: float = 0.005) -> None:
         """Stop the scope recording.
@@ -1107,7 +1255,21 @@ class SHFScope(ZINode):
             TimeoutError: The scope did not stop within the specified
                 timeout.
         """
-        return self._tk_object.stop(timeout=timeout, sleep_time=sleep_time)
+        try:
+            return self._tk_object.stop(timeout=timeout, sleep_time=sleep_time)
+        finally:
+            invalidate_caches(self)
+
+    async def stop_async(
+        self, *, timeout: float = 10, sleep_time: float = 0.005
+    ) -> None:
+        """Asynchronous version of ``stop``.
+
+        Does not block the event loop. The call is executed in order with the
+        other asynchronous operations of the instrument (see
+        ``zhinst.qcodes.qcodes_adaptions.run_async``).
+        """
+        return await run_async(self, self.stop, timeout=timeout, sleep_time=sleep_time)
 
     def wait_done(self, *, timeout: float = 10, sleep_time: float = 0.005) -> None:
         """Wait until the scope recording is finished.
@@ -1124,6 +1286,19 @@ class SHFScope(ZINode):
         """
         return self._tk_object.wait_done(timeout=timeout, sleep_time=sleep_time)
 
+    async def wait_done_async(
+        self, *, timeout: float = 10, sleep_time: float = 0.005
+    ) -> None:
+        """Asynchronous version of ``wait_done``.
+
+        Does not block the event loop and does not delay the other asynchronous
+        operations of the instrument (see
+        ``zhinst.qcodes.qcodes_adaptions.wait_async``).
+        """
+        return await wait_async(
+            self, self.wait_done, timeout=timeout, sleep_time=sleep_time
+        )
+
     def configure(
         self,
         *,
@@ -1154,14 +1329,17 @@ class SHFScope(ZINode):
             trigger_delay: delay in samples specifying the time between the
                 start of data acquisition and reception of a trigger.
         """
-        return self._tk_object.configure(
-            input_select=input_select,
-            num_samples=num_samples,
-            trigger_input=trigger_input,
-            num_segments=num_segments,
-            num_averages=num_averages,
-            trigger_delay=trigger_delay,
-        )
+        try:
+            return self._tk_object.configure(
+                input_select=input_select,
+                num_samples=num_samples,
+                trigger_input=trigger_input,
+                num_segments=num_segments,
+                num_averages=num_averages,
+                trigger_delay=trigger_delay,
+            )
+        finally:
+            invalidate_caches(self)
 
     def read(self, *, timeout: float = 10) -> tuple:
         """Read out the recorded data from the scope.
@@ -1261,16 +1439,6 @@ class SHFQC(ZIBaseInstrument):
             # channel_list.lock()
             self.add_submodule("scopes", channel_list)
 
-    def factory_reset(self, *, deep: bool = True) -> None:
-        """Load the factory default settings.
-
-        Args:
-            deep: A flag that specifies if a synchronization
-                should be performed between the device and the data
-                server after loading the factory preset (default: True).
-        """
-        return self._tk_object.factory_reset(deep=deep)
-
     def start_continuous_sw_trigger(
         self, *, num_triggers: int, wait_time: float
     ) -> None:
@@ -1286,9 +1454,12 @@ class SHFQC(ZIBaseInstrument):
             num_triggers: Number of triggers to be issued
             wait_time: Time between triggers in seconds
         """
-        return self._tk_object.start_continuous_sw_trigger(
-            num_triggers=num_triggers, wait_time=wait_time
-        )
+        try:
+            return self._tk_object.start_continuous_sw_trigger(
+                num_triggers=num_triggers, wait_time=wait_time
+            )
+        finally:
+            invalidate_caches(self)
 
     @property
     def max_qubits_per_channel(self) -> int:
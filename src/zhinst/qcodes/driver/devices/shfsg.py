@@ -2,7 +2,12 @@
 from typing import Any, Dict, List, Tuple, Union
 from zhinst.toolkit import CommandTable, Waveforms, Sequence
 from zhinst.qcodes.driver.devices.base import ZIBaseInstrument
-from zhinst.qcodes.qcodes_adaptions import ZINode, ZIChannelList
+from zhinst.qcodes.qcodes_adaptions import (
+    invalidate_caches,
+    wait_async,
+    ZIChannelList,
+    ZINode,
+)
 
 
 class CommandTableNode(ZINode):
@@ -81,9 +86,12 @@ class CommandTableNode(ZINode):
             New Flag `check_upload` that makes the upload check optional.
             `check_status` is only called when not in a ongoing transaction.
         """
-        return self._tk_object.upload_to_device(
-            ct=ct, validate=validate, check_upload=check_upload
-        )
+        try:
+            return self._tk_object.upload_to_device(
+                ct=ct, validate=validate, check_upload=check_upload
+            )
+        finally:
+            invalidate_caches(self)
 
     def load_from_device(self) -> CommandTable:
         """Load command table from the device.
@@ -135,7 +143,10 @@ class AWGCore(ZINode):
 
             Check the acknowledged value instead of using `wait_for_state_change`.
         """
-        return self._tk_object.enable_sequencer(single=single)
+        try:
+            return self._tk_object.enable_sequencer(single=single)
+        finally:
+            invalidate_caches(self)
 
     def wait_done(self, *, timeout: float = 10, sleep_time: float = 0.005) -> None:
         """Wait until the AWG is finished.
@@ -153,6 +164,19 @@ class AWGCore(ZINode):
         """
         return self._tk_object.wait_done(timeout=timeout, sleep_time=sleep_time)
 
+    async def wait_done_async(
+        self, *, timeout: float = 10, sleep_time: float = 0.005
+    ) -> None:
+        """Asynchronous version of ``wait_done``.
+
+        Does not block the event loop and does not delay the other asynchronous
+        operations of the instrument (see
+        ``zhinst.qcodes.qcodes_adaptions.wait_async``).
+        """
+        return await wait_async(
+            self, self.wait_done, timeout=timeout, sleep_time=sleep_time
+        )
+
     def compile_sequencer_program(
         self, sequencer_program: Union[str, Sequence], **kwargs: Union[str, int]
     ) -> Tuple[bytes, Dict[str, Any]]:
@@ -240,9 +264,12 @@ class AWGCore(ZINode):
             program. This speeds of the compilation and also enables parallel
             compilation/upload.
         """
-        return self._tk_object.load_sequencer_program(
-            sequencer_program=sequencer_program, **kwargs
-        )
+        try:
+            return self._tk_object.load_sequencer_program(
+                sequencer_program=sequencer_program, **kwargs
+            )
+        finally:
+            invalidate_caches(self)
 
     def write_to_waveform_memory(
         self, waveforms: Waveforms, indexes: list = None
@@ -262,9 +289,12 @@ class AWGCore(ZINode):
             Removed `validate` flag and functionality. The validation check is
             now done in the `Waveforms.validate` function.
         """
-        return self._tk_object.write_to_waveform_memory(
-            waveforms=waveforms, indexes=indexes
-        )
+        try:
+            return self._tk_object.write_to_waveform_memory(
+                waveforms=waveforms, indexes=indexes
+            )
+        finally:
+            invalidate_caches(self)
 
     def read_from_waveform_memory(self, indexes: List[int] = None) -> Waveforms:
         """Read waveforms from the waveform memory.
@@ -294,11 +324,14 @@ class AWGCore(ZINode):
                 the sequencer. For a list of available values use
                 `available_trigger_slopes`
         """
-        return self._tk_object.configure_marker_and_trigger(
-            trigger_in_source=trigger_in_source,
-            trigger_in_slope=trigger_in_slope,
-            marker_out_source=marker_out_source,
-        )
+        try:
+            return self._tk_object.configure_marker_and_trigger(
+                trigger_in_source=trigger_in_source,
+                trigger_in_slope=trigger_in_slope,
+                marker_out_source=marker_out_source,
+            )
+        finally:
+            invalidate_caches(self)
 
     @property
     def available_trigger_inputs(self) -> List:
@@ -361,12 +394,15 @@ class SGChannel(ZINode):
             rf_path: Flag if the RF(True) or LF(False) path should be
                 configured.
         """
-        return self._tk_object.configure_channel(
-            enable=enable,
-            output_range=output_range,
-            center_frequency=center_frequency,
-            rf_path=rf_path,
-        )
+        try:
+            return self._tk_object.configure_channel(
+                enable=enable,
+                output_range=output_range,
+                center_frequency=center_frequency,
+                rf_path=rf_path,
+            )
+        finally:
+            invalidate_caches(self)
 
     def configure_pulse_modulation(
         self,
@@ -397,15 +433,18 @@ class SGChannel(ZINode):
             sine_generator_index: Selects which sine generator to use on a
                 given channel.
         """
-        return self._tk_object.configure_pulse_modulation(
-            enable=enable,
-            osc_index=osc_index,
-            osc_frequency=osc_frequency,
-            phase=phase,
-            global_amp=global_amp,
-            gains=gains,
-            sine_generator_index=sine_generator_index,
-        )
+        try:
+            return self._tk_object.configure_pulse_modulation(
+                enable=enable,
+                osc_index=osc_index,
+                osc_frequency=osc_frequency,
+                phase=phase,
+                global_amp=global_amp,
+                gains=gains,
+                sine_generator_index=sine_generator_index,
+            )
+        finally:
+            invalidate_caches(self)
 
     def configure_sine_generation(
         self,
@@ -436,14 +475,17 @@ class SGChannel(ZINode):
             sine_generator_index: Selects which sine generator to use on a given
                 channel
         """
-        return self._tk_object.configure_sine_generation(
-            enable=enable,
-            osc_index=osc_index,
-            osc_frequency=osc_frequency,
-            phase=phase,
-            gains=gains,
-            sine_generator_index=sine_generator_index,
-        )
+        try:
+            return self._tk_object.configure_sine_generation(
+                enable=enable,
+                osc_index=osc_index,
+                osc_frequency=osc_frequency,
+                phase=phase,
+                gains=gains,
+                sine_generator_index=sine_generator_index,
+            )
+        finally:
+            invalidate_caches(self)
 
     @property
     def awg_modulation_freq(self) -> float:
@@ -480,13 +522,3 @@ class SHFSG(ZIBaseInstrument):
                 )
             # channel_list.lock()
             self.add_submodule("sgchannels", channel_list)
-
-    def factory_reset(self, *, deep: bool = True) -> None:
-        """Load the factory default settings.
-
-        Args:
-            deep: A flag that specifies if a synchronization
-                should be performed between the device and the data
-                server after loading the factory preset (default: True).
-        """
-        return self._tk_object.factory_reset(deep=deep)
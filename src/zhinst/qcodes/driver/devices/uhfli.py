@@ -2,7 +2,12 @@
 from typing import Any, Dict, List, Tuple, Union
 from zhinst.toolkit import CommandTable, Waveforms, Sequence
 from zhinst.qcodes.driver.devices.base import ZIBaseInstrument
-from zhinst.qcodes.qcodes_adaptions import ZINode, ZIChannelList
+from zhinst.qcodes.qcodes_adaptions import (
+    invalidate_caches,
+    wait_async,
+    ZIChannelList,
+    ZINode,
+)
 
 
 class CommandTableNode(ZINode):
@@ -81,9 +86,12 @@ class CommandTableNode(ZINode):
             New Flag `check_upload` that makes the upload check optional.
             `check_status` is only called when not in a ongoing transaction.
         """
-        return self._tk_object.upload_to_device(
-            ct=ct, validate=validate, check_upload=check_upload
-        )
+        try:
+            return self._tk_object.upload_to_device(
+                ct=ct, validate=validate, check_upload=check_upload
+            )
+        finally:
+            invalidate_caches(self)
 
     def load_from_device(self) -> CommandTable:
         """Load command table from the device.
@@ -149,7 +157,10 @@ class AWG(ZINode):
 
             Check the acknowledged value instead of using `wait_for_state_change`.
         """
-        return self._tk_object.enable_sequencer(single=single)
+        try:
+            return self._tk_object.enable_sequencer(single=single)
+        finally:
+            invalidate_caches(self)
 
     def wait_done(self, *, timeout: float = 10, sleep_time: float = 0.005) -> None:
         """Wait until the AWG is finished.
@@ -167,6 +178,19 @@ class AWG(ZINode):
         """
         return self._tk_object.wait_done(timeout=timeout, sleep_time=sleep_time)
 
+    async def wait_done_async(
+        self, *, timeout: float = 10, sleep_time: float = 0.005
+    ) -> None:
+        """Asynchronous version of ``wait_done``.
+
+        Does not block the event loop and does not delay the other asynchronous
+        operations of the instrument (see
+        ``zhinst.qcodes.qcodes_adaptions.wait_async``).
+        """
+        return await wait_async(
+            self, self.wait_done, timeout=timeout, sleep_time=sleep_time
+        )
+
     def compile_sequencer_program(
         self, sequencer_program: Union[str, Sequence], **kwargs: Union[str, int]
     ) -> Tuple[bytes, Dict[str, Any]]:
@@ -254,9 +278,12 @@ class AWG(ZINode):
             program. This speeds of the compilation and also enables parallel
             compilation/upload.
         """
-        return self._tk_object.load_sequencer_program(
-            sequencer_program=sequencer_program, **kwargs
-        )
+        try:
+            return self._tk_object.load_sequencer_program(
+                sequencer_program=sequencer_program, **kwargs
+            )
+        finally:
+            invalidate_caches(self)
 
     def write_to_waveform_memory(
         self, waveforms: Waveforms, indexes: list = None
@@ -276,9 +303,12 @@ class AWG(ZINode):
             Removed `validate` flag and functionality. The validation check is
             now done in the `Waveforms.validate` function.
         """
-        return self._tk_object.write_to_waveform_memory(
-            waveforms=waveforms, indexes=indexes
-        )
+        try:
+            return self._tk_object.write_to_waveform_memory(
+                waveforms=waveforms, indexes=indexes
+            )
+        finally:
+            invalidate_caches(self)
 
     def read_from_waveform_memory(self, indexes: List[int] = None) -> Waveforms:
         """Read waveforms from the waveform memory.
@@ -4,6 +4,7 @@ from zhinst.toolkit.driver.modules import ModuleType as TKModuleType
 from zhinst.toolkit.driver.modules.base_module import BaseModule as TKBaseModule
 from zhinst.toolkit.driver.modules.base_module import ZIModule
 from zhinst.toolkit.nodetree import Node as TKNode
+from zhinst.qcodes.latency import record_latency
 
 from zhinst.qcodes.qcodes_adaptions import (
     ZIParameter,
@@ -11,6 +12,7 @@ from zhinst.qcodes.qcodes_adaptions import (
     ZIInstrument,
     init_nodetree,
     tk_node_to_parameter,
+    wait_async,
 )
 
 if t.TYPE_CHECKING:
@@ -38,7 +40,10 @@ class ZIBaseModule(ZIInstrument):
         self._tk_object = tk_object
         self._session = session
         super().__init__(
-            f"zi_{name}_{len(self.instances())}", tk_object.root, is_module=True
+            f"zi_{name}_{len(self.instances())}",
+            tk_object.root,
+            is_module=True,
+            latency_stats=session._latency_stats,
         )
         init_nodetree(self, self._tk_object, self._snapshot_cache)
 
@@ -66,6 +71,17 @@ class ZIBaseModule(ZIInstrument):
         except (RuntimeError, KeyError):
             return serial
 
+    def _invalidate_write_cache(self, device: t.Union["DeviceType", str]) -> None:
+        """Clear the write cache of a device whose nodes were changed.
+
+        Args:
+            device: QCoDeS device object or serial of the device.
+        """
+        if isinstance(device, str):
+            device = self._session.devices._devices.get(device.lower(), device)
+        if not isinstance(device, str):
+            device.invalidate_write_cache()
+
     def _get_node(self, node: str) -> t.Union[ZIParameter, str]:
         """Convert a raw node string into a qcodes node.
 
@@ -146,6 +162,19 @@ class ZIBaseModule(ZIInstrument):
         """
         return self._tk_object.wait_done(timeout=timeout, sleep_time=sleep_time)
 
+    async def wait_done_async(
+        self, *, timeout: float = 20.0, sleep_time: float = 0.5
+    ) -> None:
+        """Asynchronous version of ``wait_done``.
+
+        Does not block the event loop and does not delay the other asynchronous
+        operations of the module (see
+        ``zhinst.qcodes.qcodes_adaptions.wait_async``).
+        """
+        return await wait_async(
+            self, self.wait_done, timeout=timeout, sleep_time=sleep_time
+        )
+
     def progress(self) -> float:
         """Progress of the execution.
 
@@ -164,6 +193,7 @@ class ZIBaseModule(ZIInstrument):
         """
         return self._tk_object.execute()
 
+    @record_latency("read")
     def read(self) -> NodeDict:
         """Read scope data.
 
@@ -3,6 +3,7 @@ import typing as t
 from zhinst.toolkit.driver.modules.daq_module import DAQModule as TKDAQModule
 
 from zhinst.qcodes.driver.modules.base_module import ZIBaseModule
+from zhinst.qcodes.latency import record_latency
 
 from zhinst.qcodes.qcodes_adaptions import (
     NodeDict,
@@ -71,6 +72,7 @@ class ZIDAQModule(ZIBaseModule):
         """
         return self._tk_object.trigger()
 
+    @record_latency("read")
     def read(self, *, raw: bool = False, clk_rate: float = 60000000.0) -> NodeDict:
         """Read the acquired data from the module.
 
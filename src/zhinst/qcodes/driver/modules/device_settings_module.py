@@ -7,6 +7,7 @@ from zhinst.toolkit.driver.modules.device_settings_module import (
 )
 
 from zhinst.qcodes.driver.modules.base_module import ZIBaseModule
+from zhinst.qcodes.latency import record_latency
 
 from zhinst.qcodes.qcodes_adaptions import (
     NodeDict,
@@ -69,9 +70,12 @@ class ZIDeviceSettingsModule(ZIBaseModule):
         Raises:
             TimeoutError: If the loading of the settings timed out.
         """
-        return self._tk_object.load_from_file(
-            filename=filename, device=device, timeout=timeout
-        )
+        try:
+            return self._tk_object.load_from_file(
+                filename=filename, device=device, timeout=timeout
+            )
+        finally:
+            self._invalidate_write_cache(device)
 
     def save_to_file(
         self,
@@ -97,6 +101,7 @@ class ZIDeviceSettingsModule(ZIBaseModule):
             filename=filename, device=device, timeout=timeout
         )
 
+    @record_latency("read")
     def read(self) -> NodeDict:
         """Read device settings.
 
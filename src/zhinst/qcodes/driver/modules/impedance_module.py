@@ -7,6 +7,9 @@ from zhinst.toolkit.driver.modules.impedance_module import (
 
 from zhinst.qcodes.driver.modules.base_module import ZIBaseModule
 
+from zhinst.qcodes.qcodes_adaptions import (
+    wait_async,
+)
 
 if t.TYPE_CHECKING:
     from zhinst.qcodes.session import Session
@@ -60,6 +63,23 @@ class ZIImpedanceModule(ZIBaseModule):
             step=step, timeout=timeout, sleep_time=sleep_time
         )
 
+    async def wait_done_async(
+        self,
+        step: Optional[int] = None,
+        *,
+        timeout: float = 20.0,
+        sleep_time: float = 0.5,
+    ) -> None:
+        """Asynchronous version of ``wait_done``.
+
+        Does not block the event loop and does not delay the other asynchronous
+        operations of the module (see
+        ``zhinst.qcodes.qcodes_adaptions.wait_async``).
+        """
+        return await wait_async(
+            self, self.wait_done, step=step, timeout=timeout, sleep_time=sleep_time
+        )
+
     def finish(self) -> None:
         """Stop the module."""
         return self._tk_object.finish()
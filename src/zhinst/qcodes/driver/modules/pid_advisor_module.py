@@ -6,6 +6,9 @@ from zhinst.toolkit.driver.modules.pid_advisor_module import (
 
 from zhinst.qcodes.driver.modules.base_module import ZIBaseModule
 
+from zhinst.qcodes.qcodes_adaptions import (
+    wait_async,
+)
 
 if t.TYPE_CHECKING:
     from zhinst.qcodes.session import Session
@@ -54,3 +57,16 @@ class ZIPIDAdvisorModule(ZIBaseModule):
                 timeout.
         """
         return self._tk_object.wait_done(timeout=timeout, sleep_time=sleep_time)
+
+    async def wait_done_async(
+        self, *, timeout: float = 20.0, sleep_time: float = 2
+    ) -> None:
+        """Asynchronous version of ``wait_done``.
+
+        Does not block the event loop and does not delay the other asynchronous
+        operations of the module (see
+        ``zhinst.qcodes.qcodes_adaptions.wait_async``).
+        """
+        return await wait_async(
+            self, self.wait_done, timeout=timeout, sleep_time=sleep_time
+        )
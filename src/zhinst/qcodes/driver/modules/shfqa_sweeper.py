@@ -41,7 +41,10 @@ class ZISHFQASweeper(ZIInstrument):
 
     def __init__(self, tk_object: TKSHFQASweeper, session: "Session"):
         super().__init__(
-            f"zi_shfqasweeper_{len(self.instances())}", tk_object.root, is_module=True
+            f"zi_shfqasweeper_{len(self.instances())}",
+            tk_object.root,
+            is_module=True,
+            latency_stats=session._latency_stats,
         )
         self._tk_object = tk_object
         self._session = session
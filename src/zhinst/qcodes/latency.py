@@ -0,0 +1,185 @@
+"""Opt-in latency statistics of the node operations.
+
+When enabled, the duration of every get and set of a ``ZIParameter``, of
+``Session.poll`` and of the reads of LabOne modules is recorded in a
+histogram per operation and node path. Operations that do not belong to a
+single node (poll, module reads) are recorded under the name of the session or
+module. The histograms have logarithmic buckets with 8 buckets per factor of
+two, i.e. the percentiles are accurate to about 6%.
+
+Every session has its own statistics, into which its devices and modules
+record. They are enabled, queried and reset through the session (see
+``Session.latency_tracking``). While disabled the instrumentation only costs
+a single flag check per call.
+"""
+import functools
+import threading
+import time
+import typing as t
+
+# Number of bits of the bucket index below the most significant bit
+_SUB_BITS = 3
+_MANTISSA_BITS = _SUB_BITS + 1
+
+
+def _bucket(duration: int) -> int:
+    """Index of the histogram bucket of a duration.
+
+    The index increases monotonically with the duration.
+
+    Args:
+        duration: Duration in nanoseconds.
+
+    Returns:
+        Bucket index.
+    """
+    shift = duration.bit_length() - _MANTISSA_BITS
+    if shift <= 0:
+        return duration
+    return (shift << _MANTISSA_BITS) | (duration >> shift)
+
+
+def _bucket_value(bucket: int) -> int:
+    """Center of a histogram bucket in nanoseconds (see ``_bucket``)."""
+    shift = bucket >> _MANTISSA_BITS
+    if shift <= 0:
+        return bucket
+    mantissa = bucket & ((1 << _MANTISSA_BITS) - 1)
+    return (mantissa << shift) + (1 << (shift - 1))
+
+
+class _Histogram:
+    """Histogram of the durations of an operation."""
+
+    __slots__ = ("count", "total", "maximum", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.maximum = 0
+        self.buckets: t.Dict[int, int] = {}
+
+    def add(self, duration: int) -> None:
+        """Add a duration in nanoseconds."""
+        self.count += 1
+        self.total += duration
+        self.maximum = max(self.maximum, duration)
+        bucket = _bucket(duration)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def percentile(self, fraction: float) -> int:
+        """Duration in nanoseconds below which a fraction of the calls lies."""
+        threshold = fraction * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= threshold:
+                return min(_bucket_value(bucket), self.maximum)
+        return self.maximum
+
+
+class LatencyStats:
+    """Latency histograms of the node operations.
+
+    Attributes:
+        enabled: Flag if the durations are recorded. (default = False)
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._histograms: t.Dict[t.Tuple[str, str], _Histogram] = {}
+
+    def record(self, operation: str, path: str, duration: int) -> None:
+        """Record the duration of an operation.
+
+        Args:
+            operation: Name of the operation (e.g. ``get``).
+            path: Lowercase node path (or name of the session or module).
+            duration: Duration in nanoseconds.
+        """
+        with self._lock:
+            histogram = self._histograms.get((operation, path))
+            if histogram is None:
+                histogram = self._histograms[operation, path] = _Histogram()
+            histogram.add(duration)
+
+    def reset(self) -> None:
+        """Remove all recorded durations."""
+        with self._lock:
+            self._histograms = {}
+
+    def summary(self) -> t.Dict[str, t.Dict[str, t.Dict[str, float]]]:
+        """Statistics of the recorded durations.
+
+        Returns:
+            Statistics by node path and operation. The statistics consist of
+            the number of calls (``count``) and the ``mean``, ``p50``,
+            ``p95``, ``p99`` and ``max`` duration in seconds.
+        """
+        with self._lock:
+            histograms = list(self._histograms.items())
+            summary: t.Dict[str, t.Dict[str, t.Dict[str, float]]] = {}
+            for (operation, path), histogram in histograms:
+                summary.setdefault(path, {})[operation] = {
+                    "count": histogram.count,
+                    "mean": histogram.total / histogram.count * 1e-9,
+                    "p50": histogram.percentile(0.5) * 1e-9,
+                    "p95": histogram.percentile(0.95) * 1e-9,
+                    "p99": histogram.percentile(0.99) * 1e-9,
+                    "max": histogram.maximum * 1e-9,
+                }
+        return summary
+
+
+def timed(
+    stats: LatencyStats,
+    operation: str,
+    path: str,
+    function: t.Callable,
+    *args,
+    **kwargs,
+):
+    """Call a function and record its duration if the statistics are enabled.
+
+    Args:
+        stats: Statistics into which the duration is recorded.
+        operation: Name of the operation.
+        path: Lowercase node path (or name of the session or module).
+        function: Function to call.
+        *args: Positional arguments of the function.
+        **kwargs: Keyword arguments of the function.
+
+    Returns:
+        Return value of the function.
+    """
+    if not stats.enabled:
+        return function(*args, **kwargs)
+    start = time.perf_counter_ns()
+    try:
+        return function(*args, **kwargs)
+    finally:
+        stats.record(operation, path, time.perf_counter_ns() - start)
+
+
+def record_latency(operation: str) -> t.Callable:
+    """Decorator that records the duration of a method of a module.
+
+    The duration is recorded under the name of the module into the
+    statistics of the module (``_latency_stats``).
+
+    Args:
+        operation: Name of the operation.
+    """
+
+    def decorator(function: t.Callable) -> t.Callable:
+        @functools.wraps(function)
+        def wrapper(self, *args, **kwargs):
+            stats = self._latency_stats
+            if not stats.enabled:
+                return function(self, *args, **kwargs)
+            return timed(stats, operation, self.name, function, self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -1,18 +1,92 @@
 """Base modules for the Zurich Instrument specific QCoDeS driver."""
+import asyncio
+import fnmatch
+import copy
+import functools
 import re
+import threading
+import time
+import uuid
 from datetime import datetime
 import typing as t
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager, nullcontext
+from collections import OrderedDict, deque
 from collections.abc import Mapping
 
 import numpy as np
 from qcodes.instrument.base import Instrument
 from qcodes.instrument.channel import ChannelList, InstrumentChannel
 from qcodes.instrument.parameter import Parameter
-from qcodes.utils.validators import ComplexNumbers
+from qcodes.utils.validators import ComplexNumbers, Validator
+from zhinst.core import ziDAQServer
 from zhinst.toolkit.nodetree import Node, NodeTree
 from zhinst.toolkit.nodetree.helper import NodeDict as TKNodeDict
 from zhinst.toolkit.nodetree.node import NodeInfo
+from zhinst.qcodes.latency import LatencyStats, timed
+
+# Toolkit node that is not yet converted into a QCoDeS parameter.
+# (QCoDeS path, toolkit node, node information)
+_PendingNode = t.Tuple[t.List[str], Node, t.Dict[str, t.Any]]
+
+
+class ZINodeMetadata(t.NamedTuple):
+    """Immutable metadata of a node.
+
+    The metadata is shared between all parameters of devices from the same
+    model whose node has the same node information. It is computed once and
+    passed to the parameters, which reference the same description, unit and
+    validator objects.
+    """
+
+    description: t.Optional[str]
+    unit: t.Optional[str]
+    vals: t.Optional[Validator]
+    snapshot: bool
+
+
+# Mapping of the node information (relative path, description, unit, type and
+# properties) to the metadata of the node.
+NodeMetadataTable = t.Dict[t.Tuple[t.Any, ...], ZINodeMetadata]
+
+_COMPLEX_NUMBERS = ComplexNumbers()
+_IS_COMPLEX = re.compile("demods/./sample")
+_SNAPSHOT_BLACKLIST = ["fwlog", "values"]
+_NODE_METADATA_TABLES: t.Dict[str, NodeMetadataTable] = {}
+
+
+def node_metadata_table(model: str) -> NodeMetadataTable:
+    """Shared node metadata table of a device model.
+
+    The entries are keyed by the node information, so devices of the same
+    model with a different firmware or options only share the metadata of
+    the nodes that did not change.
+
+    Args:
+        model: Device model (e.g. HDAWG).
+
+    Returns:
+        Metadata table that is shared by all devices of the model.
+    """
+    return _NODE_METADATA_TABLES.setdefault(model.upper(), {})
+
+
+class _SnapshotState(threading.local):
+    """Snapshot state of a single thread.
+
+    Attributes:
+        depth: Number of nested snapshot contexts of the thread.
+        values: Converted values of the running snapshot.
+        start: Time at which the values of the running snapshot were fetched.
+        parameter: Parameter whose snapshot is taken by the thread. Only its
+            get uses the values of the running snapshot.
+    """
+
+    def __init__(self):
+        self.depth = 0
+        self.values: t.Dict[str, t.Any] = {}
+        self.start = datetime.now()
+        self.parameter: t.Optional[Parameter] = None
 
 
 class ZISnapshotHelper:
@@ -21,63 +95,515 @@ class ZISnapshotHelper:
     Instead of getting each node with a single get command this class bundles
     the get into a single command and stores the returned values into a
     temporary dictionary.
+
+    In the incremental mode the helper subscribes to all nodes of the snapshot
+    and keeps a local mirror of their values. A snapshot then only polls the
+    changes since the last snapshot instead of getting all nodes again.
+
+    With a time to live (``ttl``) the values of a snapshot are reused by all
+    following snapshots within that time, unless a node of the device was set
+    in between.
+
+    The helper is thread-safe. Every thread has its own snapshot context,
+    which can be nested. Threads that request the same subtree at the same
+    time share a single get command instead of issuing one each.
     """
 
-    def __init__(self, nodetree: NodeTree, is_module: bool = False):
-        self._is_running = False
-        self._value_dict: t.Dict[str, t.Any] = {}
-        self._start = datetime.now()
+    # Throw an EOFError if data loss is detected (DETECT | THROW)
+    _MIRROR_POLL_FLAGS = 0x000C
+    # Arguments of the get command for all nodes of a device
+    _DEVICE_GET_KWARGS: t.Dict[str, t.Any] = {
+        "excludestreaming": True,
+        "settingsonly": False,
+        "excludevectors": True,
+        "flat": True,
+    }
+
+    def __init__(
+        self,
+        nodetree: NodeTree,
+        is_module: bool = False,
+        parameter_index: t.Optional["ZIParameterIndex"] = None,
+        write_cache: t.Optional["ZIWriteCache"] = None,
+    ):
+        self._state = _SnapshotState()
+        self._lock = threading.Lock()
+        self._inflight: t.Dict[t.Optional[str], Future] = {}
+        self._generation = 0
         self._nodetree = nodetree
         self._is_module = is_module
+        self._mirror_connection: t.Optional[ziDAQServer] = None
+        self._mirror: t.Dict[str, t.Any] = {}
+        self._mirror_stale = True
+        self.ttl = 0.0
+        self._last_values: t.Optional[t.Dict[str, t.Any]] = None
+        self._last_name: t.Optional[str] = None
+        self._last_time = 0.0
+        self._last_start = datetime.now()
+        self._hits = 0
+        self._misses = 0
+        self._parameter_index = parameter_index
+        self._write_cache = write_cache
+
+    @property
+    def hits(self) -> int:
+        """Number of snapshots that reused the values of another one.
+
+        Includes the snapshots that waited for the get command of a concurrent
+        snapshot of the same subtree.
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of snapshots that fetched the values from the device."""
+        return self._misses
+
+    def invalidate(self) -> None:
+        """Prevent the reuse of the values of previous snapshots.
+
+        Called automatically whenever a ``ZIParameter`` is set.
+        """
+        with self._lock:
+            self._last_values = None
+            # Values of get commands in flight must not be reused either
+            self._generation += 1
+
+    def rebind(self, nodetree: NodeTree) -> None:
+        """Bind the helper to a new node tree (e.g. after a reconnect).
+
+        Invalidates the values of previous snapshots. In the incremental mode
+        the dedicated connection is reopened and subscribed to the nodes of
+        the new node tree.
+
+        Args:
+            nodetree: Node tree that replaces the current one.
+        """
+        incremental = self.incremental
+        self._close_mirror()
+        self._nodetree = nodetree
+        self.invalidate()
+        self.incremental = incremental
+
+    @property
+    def _is_running(self) -> bool:
+        """Flag if a snapshot is in progress in the current thread."""
+        return self._state.depth > 0
+
+    def _reusable(self, name: t.Optional[str]) -> bool:
+        """Check if the last snapshot values can be reused.
+
+        Must be called with the lock held.
+
+        Args:
+            name: Key of the subtree of the new snapshot.
+
+        Returns:
+            Flag if the values of the last snapshot cover the new snapshot and
+            are not older than the time to live.
+        """
+        return (
+            self._last_values is not None
+            and time.monotonic() - self._last_time < self.ttl
+            and self._last_name in (None, name)
+        )
+
+    @property
+    def incremental(self) -> bool:
+        """Flag if the incremental snapshot mode is enabled.
+
+        In the incremental mode the helper uses a dedicated connection to the
+        data server that is subscribed to all nodes of the snapshot. The
+        snapshot values are taken from a local mirror that is updated with
+        the polled changes. If the subscription overflows, the mirror is
+        marked as stale and refreshed with a full get on the next snapshot.
+        Disabling the mode closes the dedicated connection.
+
+        Not supported for LabOne modules.
+        """
+        return self._mirror_connection is not None
+
+    @incremental.setter
+    def incremental(self, value: bool) -> None:
+        if value == self.incremental:
+            return
+        if not value:
+            self._close_mirror()
+            return
+        if self._is_module:
+            raise RuntimeError("Incremental snapshots are not supported for modules.")
+        connection = self._nodetree.connection
+        self._mirror_connection = ziDAQServer(
+            connection.host, connection.port, getattr(connection, "api_level", 6)
+        )
+        self._mirror_connection.subscribe(
+            [
+                info["Node"].lower()
+                for node, info in self._nodetree
+                if _node_metadata(node, info).snapshot
+            ]
+        )
+        self._mirror_stale = True
+
+    def _close_mirror(self) -> None:
+        """Unsubscribe and close the connection of the incremental mode.
+
+        Errors of a connection that is already lost are ignored.
+        """
+        connection = self._mirror_connection
+        self._mirror_connection = None
+        self._mirror = {}
+        self._mirror_stale = True
+        if connection is None:
+            return
+        try:
+            try:
+                connection.unsubscribe("*")
+            finally:
+                connection.disconnect()
+        except RuntimeError:
+            pass
+
+    @property
+    def mirror_stale(self) -> bool:
+        """Flag if the local mirror needs a full refresh on the next snapshot."""
+        return self._mirror_stale
+
+    def _update_mirror(self) -> t.Dict[str, t.Any]:
+        """Update the local mirror with the changes since the last update.
+
+        Returns:
+            Flat dictionary with the raw values of the mirror.
+        """
+        try:
+            changes = self._mirror_connection.poll(  # type: ignore[union-attr]
+                0, 0, flags=self._MIRROR_POLL_FLAGS, flat=True
+            )
+        except EOFError:
+            self._mirror_stale = True
+            changes = {}
+        if self._mirror_stale:
+            self._mirror_stale = False
+            self._mirror = self._get_all(self._nodetree.prefix_hide or "")
+            return self._mirror
+        for path, data in changes.items():
+            try:
+                self._mirror[path] = {
+                    "timestamp": data["timestamp"][-1:],
+                    "value": data["value"][-1:],
+                }
+            except (KeyError, IndexError, TypeError):
+                # HF2 has no timestamp -> no dict
+                self._mirror[path] = data[-1:]
+        return self._mirror
 
     @contextmanager
-    def snapshot(self, name: t.Optional[str] = None):
-        """Context manager for a optimized snapshot with ZI devices."""
-        is_owner = not self._is_running
-        if is_owner:
-            self._start_snapshot(name)
+    def snapshot(
+        self, name: t.Optional[str] = None, paths: t.Optional[t.List[str]] = None
+    ):
+        """Context manager for a optimized snapshot with ZI devices.
+
+        The context is reentrant. Nested contexts of the same thread use the
+        values of the outermost one.
+        """
+        started = self._start_snapshot(name, paths)
         try:
             yield
         finally:
-            if is_owner:
+            if started:
                 self._stop_snapshot()
 
-    def _start_snapshot(self, name: t.Optional[str] = None) -> bool:
+    def _start_snapshot(
+        self, name: t.Optional[str] = None, paths: t.Optional[t.List[str]] = None
+    ) -> bool:
         """Start a snapshot and make a single get to the device.
 
         Args:
             name: Name of the subnode which the snapshot should
                 be taken. If not specified a snapshot of all nodes will be taken.
                 (default = None)
+            paths: Absolute node paths of the subtrees which the snapshot
+                should be taken. Takes precedence over ``name``.
+                (default = None)
 
         Returns:
             bool: Flag if a new snapshot was started.
         """
-        if not self._nodetree or self._is_running:
+        fetched = self._fetch_snapshot(name, paths)
+        if fetched is None:
             return False
-        self._is_running = True
-        if not self._is_module:
-            kwargs = {
-                "excludestreaming": True,
-                "settingsonly": False,
-                "excludevectors": True,
-                "flat": True,
-            }
-        else:
-            kwargs = {"flat": True}
-        prefix = self._nodetree.prefix_hide
-        if not name:
-            name = prefix if prefix else ""
+        self._state.values, self._state.start = fetched
+        self._state.depth = 1
+        return True
+
+    def _fetch_snapshot(
+        self, name: t.Optional[str] = None, paths: t.Optional[t.List[str]] = None
+    ) -> t.Optional[t.Tuple[t.Dict[str, t.Any], datetime]]:
+        """Fetch the values of a snapshot without starting it.
+
+        Args:
+            name: Name of the subnode of the snapshot. (default = None)
+            paths: Absolute node paths of the subtrees of the snapshot.
+                (default = None)
+
+        Returns:
+            Converted values and the time at which they were fetched. None if
+            a snapshot is already running in the current thread.
+        """
+        if not self._nodetree or self._is_running:
+            return None
+        if self.incremental:
+            key = None
         else:
-            name = "/" + prefix + "/" + name
-        self._value_dict = self._nodetree.connection.get(f"{name}/*", **kwargs)
-        self._start = datetime.now()
+            key = ",".join(paths) if paths else name
+        return self._fetch(key, name, paths)
+
+    @contextmanager
+    def _snapshot_values(self, values: t.Dict[str, t.Any], start: datetime):
+        """Context of a snapshot with values fetched before.
+
+        Args:
+            values: Converted values (see ``_fetch_snapshot``).
+            start: Time at which the values were fetched.
+        """
+        if self._is_running:
+            yield
+            return
+        self._state.values = values
+        self._state.start = start
+        self._state.depth = 1
+        try:
+            yield
+        finally:
+            self._stop_snapshot()
+
+    def _fetch(
+        self,
+        key: t.Optional[str],
+        name: t.Optional[str],
+        paths: t.Optional[t.List[str]],
+    ) -> t.Tuple[t.Dict[str, t.Any], datetime]:
+        """Fetch the values of a snapshot or reuse them if possible.
+
+        Only one get command per subtree is in flight at a time. Threads that
+        request a subtree that is already fetched wait for its result.
+
+        Args:
+            key: Key of the subtree of the snapshot.
+            name: Name of the subnode of the snapshot.
+            paths: Absolute node paths of the subtrees of the snapshot.
+
+        Returns:
+            Converted values and the time at which they were fetched.
+        """
+        with self._lock:
+            if self._reusable(key):
+                self._hits += 1
+                return self._last_values, self._last_start  # type: ignore[return-value]
+            future = self._inflight.get(key)
+            if future is None:
+                future = self._inflight[key] = Future()
+                generation = self._generation
+                self._misses += 1
+                is_fetcher = True
+            else:
+                self._hits += 1
+                is_fetcher = False
+        if not is_fetcher:
+            return future.result()
+        try:
+            start = datetime.now()
+            if self.incremental:
+                raw_values = self._update_mirror()
+            elif paths:
+                raw_values = self._get_all(*paths)
+            else:
+                prefix = self._nodetree.prefix_hide
+                if not name:
+                    path = prefix if prefix else ""
+                else:
+                    path = "/" + prefix + "/" + name
+                raw_values = self._get_all(path)
+            values = self._use_values(raw_values, key, start, generation)
+            future.set_result((values, start))
+            return values, start
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+    def _get_all(self, *names: str) -> t.Dict[str, t.Any]:
+        """Get the values of all nodes below nodes with a single command.
+
+        Args:
+            names: Node paths of the parent nodes.
+
+        Returns:
+            Flat dictionary with the raw values of the nodes.
+        """
+        kwargs = self._DEVICE_GET_KWARGS if not self._is_module else {"flat": True}
+        return self._nodetree.connection.get(
+            ",".join(f"{name}/*" for name in names), **kwargs
+        )
+
+    def _start_shared_snapshot(
+        self, values: t.Dict[str, t.Any], start: datetime, generation: int
+    ) -> bool:
+        """Start a snapshot with values fetched by a shared snapshot.
+
+        Args:
+            values: Flat dictionary with the raw values of the device nodes.
+            start: Time at which the get command was issued.
+            generation: Generation of the helper when the get command was
+                issued.
+
+        Returns:
+            bool: Flag if a new snapshot was started.
+        """
+        if not self._nodetree or self._is_running:
+            return False
+        with self._lock:
+            self._misses += 1
+        self._state.values = self._use_values(values, None, start, generation)
+        self._state.start = start
+        self._state.depth = 1
         return True
 
+    def _use_values(
+        self,
+        raw_values: t.Dict[str, t.Any],
+        key: t.Optional[str],
+        start: datetime,
+        generation: int,
+    ) -> t.Dict[str, t.Any]:
+        """Use freshly fetched values for a snapshot.
+
+        The raw values are converted once into python scalars and the caches
+        of the indexed parameters of the fetched nodes are updated in a single
+        pass. The converted
+        values are kept for the reuse by following snapshots, unless a node
+        was set while they were fetched.
+
+        Args:
+            raw_values: Flat dictionary with the raw values of the nodes.
+            key: Key of the subtree of the snapshot.
+            start: Time at which the get command was issued.
+            generation: Generation of the helper when the get command was
+                issued.
+
+        Returns:
+            Converted values.
+        """
+        values = self._convert_values(raw_values)
+        index = self._parameter_index
+        if index is not None:
+            for path, value in values.items():
+                parameter = index.get(path)
+                if parameter is not None and value is not None:
+                    parameter.cache._update_with(
+                        value=value, raw_value=value, timestamp=start
+                    )
+        if self._write_cache is not None:
+            self._write_cache.observe(values)
+        with self._lock:
+            if generation == self._generation:
+                self._last_values = values
+                self._last_name = key
+                self._last_time = time.monotonic()
+                self._last_start = start
+        return values
+
+    @staticmethod
+    def _convert_values(raw_values: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
+        """Convert the raw values of a get command into python scalars.
+
+        Args:
+            raw_values: Flat dictionary with the raw values of the nodes.
+
+        Returns:
+            Dictionary with the lowercase node paths and their latest value.
+            Complex values are converted into strings.
+        """
+        values = {}
+        for path, data in raw_values.items():
+            # HF2 has no timestamp -> no dict
+            value = data["value"][0] if isinstance(data, dict) else data[0]
+            # convert numpy types to standart types
+            value = value.item() if hasattr(value, "item") else value
+            # convert complex into string
+            values[path.lower()] = str(value) if isinstance(value, complex) else value
+        return values
+
+    @staticmethod
+    @contextmanager
+    def shared_snapshot(
+        helpers: t.Iterable["ZISnapshotHelper"],
+        connection: ziDAQServer,
+        batch_size: t.Optional[int] = None,
+    ):
+        """Context manager for a snapshot of multiple devices at once.
+
+        Gets the nodes of all devices with a single command (or one command
+        per batch of devices) and hands the values to the helpers of the
+        devices. All snapshots of these devices within the context use these
+        values instead of getting them again.
+
+        Helpers with an ongoing snapshot, in the incremental mode or of
+        LabOne modules are left untouched.
+
+        Args:
+            helpers: Snapshot helpers of the devices.
+            connection: Connection to the data server of all devices.
+            batch_size: Maximum number of devices per get command. If not
+                specified all devices are fetched with a single command.
+                (default = None)
+        """
+        selected = {
+            helper._nodetree.prefix_hide.lower(): helper
+            for helper in helpers
+            if helper._nodetree
+            and helper._nodetree.prefix_hide
+            and not helper._is_running
+            and not helper._is_module
+            and not helper.incremental
+        }
+        prefixes = list(selected)
+        batch_size = batch_size if batch_size else max(len(prefixes), 1)
+        started = []
+        try:
+            batches = [
+                prefixes[i:][:batch_size] for i in range(0, len(prefixes), batch_size)
+            ]
+            for batch in batches:
+                start = datetime.now()
+                generations = {prefix: selected[prefix]._generation for prefix in batch}
+                values = connection.get(
+                    ",".join(f"/{prefix}/*" for prefix in batch),
+                    **ZISnapshotHelper._DEVICE_GET_KWARGS,
+                )
+                slices: t.Dict[str, t.Dict[str, t.Any]] = {
+                    prefix: {} for prefix in batch
+                }
+                for path, value in values.items():
+                    device_slice = slices.get(path.split("/", 2)[1])
+                    if device_slice is not None:
+                        device_slice[path] = value
+                for prefix in batch:
+                    if selected[prefix]._start_shared_snapshot(
+                        slices[prefix], start, generations[prefix]
+                    ):
+                        started.append(selected[prefix])
+            yield
+        finally:
+            for helper in started:
+                helper._stop_snapshot()
+
     def _stop_snapshot(self) -> None:
         """Stop a snapshot to prevent use of outdate data by accident."""
-        self._is_running = False
-        self._value_dict = {}
+        self._state.depth = 0
+        self._state.values = {}
 
     def get(self, parameter: Parameter, fallback_get: t.Callable) -> t.Any:
         """Get the value for a specific QCoDeS Parameter.
@@ -92,22 +618,15 @@ class ZISnapshotHelper:
         Returns:
             Value for the Node
         """
-        value = self._value_dict.get(parameter.zi_node.lower())
-        if value is not None:
-            try:
-                value = value["value"][0]
-            except (IndexError, TypeError):
-                # HF2 has no timestamp -> no dict
-                value = value[0]
-            # convert numpy types to standart types
-            value = value.item() if hasattr(value, "item") else value
-            # convert complex into string
-            value = str(value) if isinstance(value, complex) else value
+        state = self._state
+        value = state.values.get(parameter.zi_node.lower())
+        if value is None:  # fallback is normal get
+            return fallback_get()
+        # The caches of indexed parameters are already updated in bulk
+        if parameter.cache.timestamp != state.start:
             parameter.cache._update_with(
-                value=value, raw_value=value, timestamp=self._start
+                value=value, raw_value=value, timestamp=state.start
             )
-        else:  # fallback is normal get
-            value = fallback_get()
         return value
 
     @staticmethod
@@ -121,6 +640,10 @@ class ZISnapshotHelper:
         A convenience function to quickly get an overview of the
         status of an instrument.
 
+        The lines are printed while walking through the submodules (see
+        ``readable_snapshot``). With ``update`` the values are fetched with a
+        single get command.
+
         Args:
             qcodes_object (object): Object for which the snapshot should be printed.
             update (bool): Flag if the state should be queried from the
@@ -129,54 +652,229 @@ class ZISnapshotHelper:
                 readable snapshot will be cropped if this value is exceeded.
                 Defaults to 80 to be consistent with default terminal width.
         """
-        floating_types = (float, np.integer, np.floating)
-        snapshot = qcodes_object.snapshot(update=update)
-        snapshot_parameters = snapshot.get("parameters")
-
-        if snapshot_parameters:
-            # Min of 50 is to prevent a super long parameter name to break this
-            # function
-            par_lengths = [len(p) for p in snapshot_parameters]
-            par_field_len = min(max(par_lengths) + 1, 50) if par_lengths else 0
-
-            print(qcodes_object.name + ":")
-            print(f"\t{'parameter':<{par_field_len}}: value")
-            print("\t" + "-" * (max_chars - 8))
-            for parameter in sorted(snapshot_parameters):
-                parameter = snapshot_parameters[parameter]
-                name = parameter["name"]
-                msg = f"\t{name:<{par_field_len}}:"
-
-                # in case of e.g. ArrayParameters, that usually have
-                # snapshot_value == False, the parameter may not have
-                # a value in the snapshot
-                val = parameter.get("value", "Not available")
-
-                unit = parameter.get("unit", None)
-                if unit is None:
-                    # this may be a multi parameter
-                    unit = parameter.get("units", None)
-                if isinstance(val, floating_types):
-                    msg += f"\t{val:.5g} "
-                    # numpy float and int types format like builtins
-                else:
-                    msg += f"\t{val} "
-                if unit != "":  # corresponds to no unit
-                    msg += f"({unit})"
-                # Truncate the message if it is longer than max length
-                if len(msg) > max_chars and max_chars != -1:
-                    msg = msg[0 : max_chars - 3] + "..."  # noqa: E203
-                print(msg)
+        for line in ZISnapshotHelper.readable_snapshot(
+            qcodes_object, update, max_chars
+        ):
+            print(line)
+
+    @staticmethod
+    def readable_snapshot(
+        qcodes_object: t.Any,
+        update: bool = False,
+        max_chars: int = 80,
+        snapshot_filter: t.Optional["_SnapshotFilter"] = None,
+        context: t.Optional[t.Callable[[], t.ContextManager]] = None,
+    ) -> t.Iterator[str]:
+        """Lines of the readable version of the snapshot.
+
+        Only the snapshot of the parameters of a single submodule is held at a
+        time. The lines of a submodule are generated before its children are
+        visited.
+
+        With ``update`` the values of all nodes are fetched with a single get
+        command when the first line is requested. The snapshot context with
+        these values is entered for the parameters of every submodule and is
+        never held while a line is yielded, i.e. the iteration can be stopped
+        at any time.
+
+        Args:
+            qcodes_object (object): Object for which the snapshot should be
+                generated.
+            update (bool): Flag if the state should be queried from the
+                           instrument.
+            max_chars (int): The maximum number of characters per line.
+            snapshot_filter: Filter of the parameters and submodules.
+                (default = None)
+            context: Context in which the parameter snapshots of a submodule
+                are taken. By default the values are fetched from the
+                snapshot helper of the object. (default = None)
+
+        Returns:
+            Lines of the readable snapshot.
+        """
+        if context is None:
+            context = ZISnapshotHelper._readable_snapshot_context(
+                qcodes_object, update, snapshot_filter
+            )
+        if isinstance(qcodes_object, ChannelList):
+            submodules: t.Iterable[t.Any] = qcodes_object
+        else:
+            with context():
+                snapshot_parameters = {
+                    name: parameter.snapshot(update=update)
+                    for name, parameter in qcodes_object.parameters.items()
+                    if not parameter.snapshot_exclude
+                    and (snapshot_filter is None or snapshot_filter.matches(parameter))
+                }
+            yield from _readable_parameter_lines(
+                qcodes_object.name, snapshot_parameters, max_chars
+            )
+            submodules = qcodes_object.submodules.values()
+        for submodule in submodules:
+            if snapshot_filter is None or snapshot_filter.covers(submodule):
+                yield from ZISnapshotHelper.readable_snapshot(
+                    submodule, update, max_chars, snapshot_filter, context
+                )
+
+    @staticmethod
+    def _readable_snapshot_context(
+        qcodes_object: t.Any,
+        update: bool,
+        snapshot_filter: t.Optional["_SnapshotFilter"],
+    ) -> t.Callable[[], t.ContextManager]:
+        """Snapshot context of a readable snapshot.
+
+        Args:
+            qcodes_object: Object for which the snapshot is generated.
+            update: Flag if the state should be queried from the instrument.
+            snapshot_filter: Filter of the parameters and submodules.
 
-        for submodule in qcodes_object.submodules.values():
-            submodule.print_readable_snapshot(update=update, max_chars=max_chars)
+        Returns:
+            Factory of the context with the values fetched by a single get
+            command. A ``nullcontext`` if nothing needs to be fetched.
+        """
+        helper = getattr(qcodes_object, "_snapshot_cache", None)
+        paths = snapshot_filter.roots if snapshot_filter is not None else None
+        if not update or helper is None or paths == []:
+            return nullcontext
+        fetched = helper._fetch_snapshot(
+            getattr(qcodes_object, "_zi_node", None), paths
+        )
+        if fetched is None:
+            return nullcontext
+        return functools.partial(helper._snapshot_values, *fetched)
 
     @property
     def is_running(self) -> bool:
-        """Flag if a snapshot is in progress."""
+        """Flag if a snapshot is in progress in the current thread."""
         return self._is_running
 
 
+class ZIWriteCache:
+    """Last acknowledged values of the nodes of an instrument.
+
+    Used for the set-if-changed mode of an instrument (see
+    ``ZIInstrument.suppress_redundant_writes``). The set of a parameter is
+    skipped if the cache holds the same value for its node. Only values that
+    the device acknowledged in a deep set are recorded. The value of a node
+    is removed as soon as a different value is observed for it (e.g. in a
+    snapshot, a poll or ``get_many``), since the node was changed by someone
+    else in that case.
+
+    Only scalar values and strings are cached.
+    """
+
+    def __init__(self):
+        self._enabled = False
+        self._values: t.Dict[str, t.Any] = {}
+        self.suppressed = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Flag if redundant writes are suppressed."""
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self._enabled = value
+        self._values = {}
+
+    def is_unchanged(self, path: str, value: t.Any) -> bool:
+        """Check if a value matches the last acknowledged value of a node.
+
+        Args:
+            path: Lowercase node path.
+            value: Value that should be set.
+
+        Returns:
+            Flag if the set of the value is redundant.
+        """
+        old = self._values.get(path, _NOT_CACHED)
+        return old is not _NOT_CACHED and _same_value(old, value)
+
+    def record(self, path: str, value: t.Any) -> None:
+        """Record the acknowledged value of a node.
+
+        Args:
+            path: Lowercase node path.
+            value: Value of the node.
+        """
+        if isinstance(value, (int, float, complex, str)):
+            self._values[path] = value
+        else:
+            self._values.pop(path, None)
+
+    def discard(self, path: str) -> None:
+        """Remove the value of a node from the cache.
+
+        Args:
+            path: Lowercase node path.
+        """
+        self._values.pop(path, None)
+
+    def observe(self, values: t.Mapping[str, t.Any]) -> None:
+        """Remove the nodes whose observed value differs from the cached one.
+
+        Args:
+            values: Observed values by their lowercase node path.
+        """
+        for path, old in list(self._values.items()):
+            new = values.get(path, _NOT_CACHED)
+            if new is not _NOT_CACHED and not _same_value(old, new):
+                self._values.pop(path, None)
+
+    def clear(self) -> None:
+        """Remove all values from the cache."""
+        self._values = {}
+
+
+# Placeholder for a node without cached value.
+_NOT_CACHED = object()
+
+
+def _same_value(old: t.Any, new: t.Any) -> bool:
+    """Check if two node values are the same.
+
+    Numbers are compared by their value (e.g. an enum and its integer value
+    are the same), strings only match other strings.
+    """
+    if isinstance(old, str) != isinstance(new, str):
+        return False
+    return not _changed(old, new)
+
+
+def _write_cache(layer) -> t.Optional[ZIWriteCache]:
+    """Write cache of the instrument a layer belongs to.
+
+    Args:
+        layer: Layer or parameter of the instrument.
+
+    Returns:
+        Write cache of the root instrument or None if it has none.
+    """
+    return getattr(layer.root_instrument, "_write_cache", None)
+
+
+def invalidate_caches(layer) -> None:
+    """Invalidate the caches of the instrument a layer belongs to.
+
+    Needed after operations that change nodes of the instrument without
+    setting its parameters (e.g. the toolkit functions ``configure_channel``
+    or ``enable_sequencer``). Clears the write cache of the set-if-changed
+    mode and prevents the reuse of previous snapshot values.
+
+    Args:
+        layer: Layer of the instrument.
+    """
+    root = layer.root_instrument
+    write_cache = getattr(root, "_write_cache", None)
+    if write_cache is not None:
+        write_cache.clear()
+    snapshot_cache = getattr(root, "_snapshot_cache", None)
+    if snapshot_cache is not None:
+        snapshot_cache.invalidate()
+
+
 class ZIParameter(Parameter):
     """Zurich Instrument specific QCoDeS Parameter.
 
@@ -186,6 +884,10 @@ class ZIParameter(Parameter):
     Args:
         snapshot_cache (ZISnapshotHelper): ZI specific SnapshotHelper object
         zi_node (Node): ZI specific node object of the nodetree
+        tk_node (Node): Toolkit node of the parameter
+        zi_metadata (ZINodeMetadata): Metadata of the node. The description,
+            unit and validator of the parameter are taken from the metadata
+            unless they are passed explicitly.
     """
 
     def __init__(
@@ -194,16 +896,24 @@ class ZIParameter(Parameter):
         snapshot_cache: ZISnapshotHelper,
         zi_node: str,
         tk_node: Node,
+        zi_metadata: ZINodeMetadata,
         **kwargs,
     ):
-        super().__init__(*args, **kwargs)
-        self.get_raw = kwargs["get_cmd"]
-        self.set_raw = kwargs["set_cmd"]
-        self.get = self._wrap_get(self.get_raw)
-        self.set = self._set_zi
+        self._metadata = zi_metadata
         self._snapshot_cache = snapshot_cache
         self._zi_node = zi_node
         self._tk_node = tk_node
+        kwargs.setdefault("docstring", zi_metadata.description)
+        kwargs.setdefault("unit", zi_metadata.unit)
+        kwargs.setdefault("vals", zi_metadata.vals)
+        super().__init__(*args, **kwargs)
+        # Resolved once, a lookup through the root instrument per get and set
+        # would exceed the cost of the disabled latency statistics.
+        latency_stats = getattr(self.root_instrument, "_latency_stats", None)
+        self._latency_stats = latency_stats or LatencyStats()
+        self._get_wrapped = self.get
+        self.get = self._get_zi
+        self.set = self._set_zi
 
     def __call__(self, *args, **kwargs):
         """Call operator that either gets (empty) or gets the value of a node.
@@ -244,6 +954,20 @@ class ZIParameter(Parameter):
             return self.set(*args, **kwargs)
         raise NotImplementedError("no set cmd found in" + f" Parameter {self.name}")
 
+    def _get_zi(self, *args, **kwargs):
+        """ZI specific get that takes part in the snapshot of the parameter.
+
+        Within the snapshot of this parameter (see ``snapshot_base``) the
+        value is taken from the running snapshot of the current thread. All
+        other gets are normal QCoDeS gets.
+        """
+        snapshot_cache = self._snapshot_cache
+        if snapshot_cache._state.parameter is self:
+            return snapshot_cache.get(
+                self, functools.partial(self._get_wrapped, *args, **kwargs)
+            )
+        return self._get_wrapped(*args, **kwargs)
+
     def _set_zi(self, *args, **kwargs):
         """ZI specific set that supports returning values.
 
@@ -257,8 +981,48 @@ class ZIParameter(Parameter):
         get functionality with the returned value. Thus is acts as a set and
         get within on single command without overwriting the QCoDeS specific
         implementation.
+
+        In the set-if-changed mode of the instrument a set of the last
+        acknowledged value is skipped (see ``ZIWriteCache``).
+        """
+        write_cache = _write_cache(self)
+        if write_cache is not None and write_cache.enabled:
+            return self._set_if_changed(write_cache, *args, **kwargs)
+        return self._set_uncached(*args, **kwargs)
+
+    def _set_if_changed(self, write_cache: ZIWriteCache, *args, **kwargs):
+        """Set that skips the last acknowledged value of the node.
+
+        Sets with additional arguments (e.g. ``deep``) are always executed.
+        Only the value acknowledged by the device in a deep set is recorded,
+        all other sets remove the node from the write cache. Sets within a
+        transaction are always buffered.
+
+        Args:
+            write_cache: Write cache of the instrument.
         """
+        path = self._zi_node.lower()
+        if self._tk_node.root.transaction.in_progress():
+            write_cache.discard(path)
+            return self._set_uncached(*args, **kwargs)
+        if len(args) == 1 and not kwargs and write_cache.is_unchanged(path, args[0]):
+            write_cache.suppressed += 1
+            return None
+        try:
+            set_return = self._set_uncached(*args, **kwargs)
+        except BaseException:
+            write_cache.discard(path)
+            raise
+        if set_return is not None:
+            write_cache.record(path, set_return)
+        else:
+            write_cache.discard(path)
+        return set_return
+
+    def _set_uncached(self, *args, **kwargs):
+        """Set without the set-if-changed mode (see ``set``)."""
         set_return = None
+        self._snapshot_cache.invalidate()
 
         def set_wrapper(*args, **kwargs) -> None:
             nonlocal set_return
@@ -267,10 +1031,59 @@ class ZIParameter(Parameter):
         self._wrap_set(set_wrapper)(*args, **kwargs)
         return self._wrap_get(lambda: set_return)() if set_return is not None else None
 
-    def snapshot_base(
-        self, update: bool = True, params_to_skip_update: t.List[str] = None
-    ) -> dict:
-        """State of the parameter as a JSON-compatible dict.
+    def get_raw(self, *args, **kwargs):
+        """Get the value of the toolkit node.
+
+        The duration is recorded if enabled (see ``zhinst.qcodes.latency``).
+        """
+        stats = self._latency_stats
+        if not stats.enabled:
+            return self._tk_node._get(*args, **kwargs)
+        path = self._zi_node.lower()
+        return timed(stats, "get", path, self._tk_node._get, *args, **kwargs)
+
+    def set_raw(self, *args, **kwargs):
+        """Set the value of the toolkit node.
+
+        The duration is recorded if enabled (see ``zhinst.qcodes.latency``).
+        """
+        stats = self._latency_stats
+        if not stats.enabled:
+            return self._tk_node._set(*args, **kwargs)
+        path = self._zi_node.lower()
+        return timed(stats, "set", path, self._tk_node._set, *args, **kwargs)
+
+    async def get_async(self, **kwargs) -> t.Any:
+        """Get the value of the node without blocking the event loop.
+
+        Takes the same arguments as a normal get. The get is executed in order
+        with the other asynchronous operations of the instrument (see
+        ``run_async``).
+
+        Returns:
+            Value of the node.
+        """
+        return await run_async(self, self.get, **kwargs)
+
+    async def set_async(self, value: t.Any, **kwargs) -> t.Any:
+        """Set the value of the node without blocking the event loop.
+
+        Takes the same arguments as a normal set. The set is executed in order
+        with the other asynchronous operations of the instrument (see
+        ``run_async``).
+
+        Args:
+            value: Value that should be set to the node.
+
+        Returns:
+            Acknowledged value of the node for a deep set, else None.
+        """
+        return await run_async(self, self.set, value, **kwargs)
+
+    def snapshot_base(
+        self, update: bool = True, params_to_skip_update: t.List[str] = None
+    ) -> dict:
+        """State of the parameter as a JSON-compatible dict.
 
         (everything that the custom JSON encoder class
         :class:`qcodes.utils.helpers.NumpyJSONEncoder` supports)
@@ -279,7 +1092,10 @@ class ZIParameter(Parameter):
         the snapshot will NOT include the ``value`` and ``raw_value`` of the
         parameter.
 
-        Overwrite base class function to use the snapshot_cache.
+        Overwrite base class function to use the snapshot_cache. The get of
+        the parameter uses the values of the running snapshot as long as the
+        current thread is within this function (see ``get``). The
+        parameter itself is left untouched, so other threads are unaffected.
 
         Args:
             update: If True, update the state by calling ``parameter.get()``
@@ -292,14 +1108,15 @@ class ZIParameter(Parameter):
         Returns:
             base snapshot
         """
-        get = self.__dict__["get"]
+        state = self._snapshot_cache._state
+        parameter = state.parameter
+        state.parameter = self
         try:
-            self.get = lambda: self._snapshot_cache.get(self, get)
             return super().snapshot_base(
                 update=update, params_to_skip_update=params_to_skip_update
             )
         finally:
-            self.get = get
+            state.parameter = parameter
 
     def subscribe(self) -> None:
         """Subscribe to nodes. Fetch data with the poll command.
@@ -349,6 +1166,36 @@ class ZIParameter(Parameter):
             value, invert=invert, timeout=timeout, sleep_time=sleep_time
         )
 
+    async def wait_for_state_change_async(
+        self,
+        value: t.Union[int, str],
+        *,
+        invert: bool = False,
+        timeout: float = 2,
+        sleep_time: float = 0.005,
+    ) -> None:
+        """Asynchronous version of ``wait_for_state_change``.
+
+        Does not block the event loop and does not delay the other
+        asynchronous operations of the instrument (see ``wait_async``).
+        """
+        await wait_async(
+            self,
+            self.wait_for_state_change,
+            value,
+            invert=invert,
+            timeout=timeout,
+            sleep_time=sleep_time,
+        )
+
+    def _rebind(self, tk_node: Node) -> None:
+        """Bind the parameter to another toolkit node.
+
+        Args:
+            tk_node: Toolkit node that replaces the current one.
+        """
+        self._tk_node = tk_node
+
     @property
     def node_info(self) -> NodeInfo:
         """Zurich Instrument node representation of the Parameter."""
@@ -365,7 +1212,243 @@ class ZIParameter(Parameter):
         return self._tk_node
 
 
-class ZINode(InstrumentChannel):
+class ZIParameterIndex(Mapping):
+    """Bidirectional index between node paths and QCoDeS parameters.
+
+    Maps the lowercase node path of every created ``ZIParameter`` of an
+    instrument to the parameter and back. This avoids walking the submodules
+    of the instrument when a raw node path (e.g. from a poll) needs to be
+    converted into the corresponding parameter.
+    """
+
+    def __init__(self):
+        self._parameters: t.Dict[str, ZIParameter] = {}
+        self._paths: t.Dict[ZIParameter, str] = {}
+
+    def __getitem__(self, path: str) -> ZIParameter:
+        return self._parameters[path]
+
+    def __iter__(self):
+        return iter(self._parameters)
+
+    def __len__(self):
+        return len(self._parameters)
+
+    def items(self):
+        """Node paths and parameters of the index."""
+        return self._parameters.items()
+
+    def get(self, path: str, default: t.Any = None) -> t.Any:
+        """Parameter of a lowercase node path or the default if not indexed."""
+        return self._parameters.get(path, default)
+
+    def add(self, parameter: ZIParameter) -> None:
+        """Add a parameter to the index.
+
+        Args:
+            parameter: Parameter that should be added.
+        """
+        path = parameter.zi_node.lower()
+        self._parameters[path] = parameter
+        self._paths[parameter] = path
+
+    def discard(self, parameter: ZIParameter) -> None:
+        """Remove a parameter from the index if it is present.
+
+        Args:
+            parameter: Parameter that should be removed.
+        """
+        path = self._paths.pop(parameter, None)
+        if path is not None and self._parameters.get(path) is parameter:
+            del self._parameters[path]
+
+    def path(self, parameter: ZIParameter) -> str:
+        """Lowercase node path of a parameter.
+
+        Args:
+            parameter: Parameter of the index.
+
+        Returns:
+            Node path of the parameter.
+
+        Raises:
+            KeyError: If the parameter is not part of the index.
+        """
+        return self._paths[parameter]
+
+
+def _indexed_parameters(layer) -> t.Iterator[ZIParameter]:
+    """Already created ``ZIParameter`` of a layer and all its submodules.
+
+    Layers with pending nodes are not materialized. Their parameters are
+    added to the index once they are created.
+
+    Args:
+        layer: Layer (ZINode or ZIChannelList) to search.
+
+    Yields:
+        Parameters of the layer.
+    """
+    state = vars(layer)
+    for parameter in state.get("_zi_parameters", {}).values():
+        if isinstance(parameter, ZIParameter):
+            yield parameter
+    for submodule in state.get("_zi_submodules", {}).values():
+        yield from _indexed_parameters(submodule)
+    for channel in state.get("_zi_channels", ()):
+        yield from _indexed_parameters(channel)
+
+
+def _parameter_index(layer) -> t.Optional[ZIParameterIndex]:
+    """Parameter index of the instrument a layer belongs to.
+
+    Args:
+        layer: Layer of the instrument.
+
+    Returns:
+        Index of the root instrument or None if it has no index.
+    """
+    return getattr(layer.root_instrument, "_parameter_index", None)
+
+
+def _lazy_attribute(name: str) -> property:
+    """Create a property that materializes pending nodes before access.
+
+    Args:
+        name: Name of the attribute in the QCoDeS base class.
+
+    Returns:
+        Property that replaces the plain attribute of the base class.
+    """
+    key = "_zi_" + name.lstrip("_")
+
+    def getter(self):
+        self._zi_materialize()
+        try:
+            return self.__dict__[key]
+        except KeyError as error:
+            raise AttributeError(name) from error
+
+    def setter(self, value):
+        self.__dict__[key] = value
+
+    return property(getter, setter)
+
+
+def _materialize_lock(layer) -> threading.RLock:
+    """Lock of the instrument that guards the materialization of its layers.
+
+    Args:
+        layer: Lazy layer (submodule or channel list) of the instrument.
+    """
+    parent = layer._parent if isinstance(layer, ChannelList) else layer
+    return parent.root_instrument._zi_lock
+
+
+def _materialize_pending(layer, build: t.Callable[[t.Any], None]) -> None:
+    """Create the pending nodes of a layer exactly once.
+
+    The pending nodes are only removed after the layer is complete. Other
+    threads that access the layer in the meantime wait for the materialization
+    to finish instead of seeing a partially filled layer. The accesses of the
+    materializing thread itself (e.g. by ``add_parameter``) see the layer as it
+    is being built.
+
+    Args:
+        layer: Lazy layer with pending nodes.
+        build: Function that creates the layer from its pending nodes.
+    """
+    state = layer.__dict__
+    if "_zi_pending" not in state:
+        return
+    with _materialize_lock(layer):
+        pending = state.get("_zi_pending")
+        if pending is None or state.get("_zi_building"):
+            return
+        state["_zi_building"] = True
+        try:
+            build(pending)
+        finally:
+            del state["_zi_pending"]
+            del state["_zi_building"]
+
+
+class _ZILazyLayer:
+    """Mixin that defers the creation of parameters and submodules.
+
+    Instead of creating all parameters during the initialization the toolkit
+    nodes are stored as pending entries. They are only converted into QCoDeS
+    objects, one layer at a time, when ``parameters`` or ``submodules`` (and
+    therefore also the attribute access and the snapshot) are accessed for
+    the first time.
+    """
+
+    parameters = _lazy_attribute("parameters")  # type: ignore[assignment]
+    submodules = _lazy_attribute("submodules")  # type: ignore[assignment]
+    instrument_modules = _lazy_attribute(
+        "instrument_modules"
+    )  # type: ignore[assignment]
+    _channel_lists = _lazy_attribute("_channel_lists")  # type: ignore[assignment]
+    _snapshot_cache: ZISnapshotHelper
+
+    def _zi_defer(
+        self,
+        depth: int,
+        entries: t.List[_PendingNode],
+        metadata_table: t.Optional[NodeMetadataTable] = None,
+    ) -> None:
+        """Add nodes that should be created on the first access.
+
+        Args:
+            depth: Position of this layer within the QCoDeS path of the nodes.
+            entries: Pending nodes that belong to this layer.
+            metadata_table: Shared metadata table for the parameters.
+        """
+        pending = self.__dict__.setdefault("_zi_pending", (depth, [], metadata_table))
+        pending[1].extend(entries)
+
+    def _zi_materialize(self) -> None:
+        """Create the parameters and direct submodules of all pending nodes."""
+        _materialize_pending(self, self._zi_build)
+
+    def _zi_build(self, pending) -> None:
+        """Create the layer from its pending nodes (see ``_zi_defer``)."""
+        depth, entries, metadata_table = pending
+        _materialize_layer(self, depth, entries, self._snapshot_cache, metadata_table)
+
+    def add_parameter(self, name: str, parameter_class=None, **kwargs) -> None:
+        """Add a parameter and register it in the parameter index.
+
+        Forwards all arguments to the QCoDeS ``add_parameter``.
+        """
+        super().add_parameter(  # type: ignore[misc]
+            name, parameter_class=parameter_class, **kwargs
+        )
+        parameter = self.parameters[name]
+        if isinstance(parameter, ZIParameter):
+            index = _parameter_index(self)
+            if index is not None:
+                index.add(parameter)
+
+    def _is_abstract(self) -> bool:
+        """Check for abstract parameters without materializing the layer.
+
+        Pending nodes are always converted into ``ZIParameter`` which are
+        never abstract.
+        """
+        if "_zi_pending" not in self.__dict__:
+            return super()._is_abstract()  # type: ignore[misc]
+        with _materialize_lock(self):
+            building = self.__dict__.get("_zi_building", False)
+            self.__dict__["_zi_building"] = True
+            try:
+                return super()._is_abstract()  # type: ignore[misc]
+            finally:
+                if not building:
+                    del self.__dict__["_zi_building"]
+
+
+class ZINode(_ZILazyLayer, InstrumentChannel):
     """Zurich Instrument specific QCoDeS InstrumentChannel.
 
     Overwrite the snapshot functionality to use the ZISnapshotHelper.
@@ -433,11 +1516,95 @@ class ZIChannelList(ChannelList):
         zi_node (Node): ZI specific node object of the nodetree
     """
 
+    _channels = _lazy_attribute("_channels")  # type: ignore[assignment]
+    _channel_mapping = _lazy_attribute("_channel_mapping")  # type: ignore[assignment]
+
     def __init__(self, *args, snapshot_cache=None, zi_node=None, **kwargs):
         super().__init__(*args, **kwargs)
         self._snapshot_cache = snapshot_cache
         self._zi_node = zi_node
 
+    def _zi_defer(
+        self,
+        index: int,
+        depth: int,
+        entries: t.List[_PendingNode],
+        metadata_table: t.Optional[NodeMetadataTable] = None,
+    ) -> None:
+        """Add nodes of a list item that should be created on the first access.
+
+        Args:
+            index: Index of the list item the nodes belong to.
+            depth: Position of the list items within the QCoDeS path.
+            entries: Pending nodes that belong to the list item.
+            metadata_table: Shared metadata table for the parameters.
+        """
+        pending = self.__dict__.setdefault("_zi_pending", (depth, {}, metadata_table))
+        pending[1].setdefault(index, []).extend(entries)
+
+    def _zi_materialize(self) -> None:
+        """Create all missing list items and pass the pending nodes to them."""
+        _materialize_pending(self, self._zi_build)
+
+    def _zi_build(self, pending) -> None:
+        """Create the list items from the pending nodes (see ``_zi_defer``)."""
+        depth, items, metadata_table = pending
+        for index in range(len(self), max(items) + 1):
+            self.append(
+                ZINode(
+                    self._parent,
+                    self._name + str(index),
+                    zi_node=f"{self._zi_node}/{index}",
+                    snapshot_cache=self._snapshot_cache,
+                )
+            )
+        for index, entries in items.items():
+            self[index]._zi_defer(depth, entries, metadata_table)
+
+    def _zi_update_index(self, channels, add: bool) -> None:
+        """Add or remove the parameters of channels to the parameter index.
+
+        Args:
+            channels: Channels that were added to or removed from the list.
+            add: Flag if the parameters should be added or removed.
+        """
+        index = _parameter_index(self._parent)
+        if index is None:
+            return
+        for channel in channels:
+            for parameter in _indexed_parameters(channel):
+                if add:
+                    index.add(parameter)
+                else:
+                    index.discard(parameter)
+
+    def append(self, obj) -> None:
+        """Append a channel to the list and index its parameters."""
+        super().append(obj)
+        self._zi_update_index([obj], add=True)
+
+    def extend(self, objects) -> None:
+        """Append channels to the list and index their parameters."""
+        objects = tuple(objects)
+        super().extend(objects)
+        self._zi_update_index(objects, add=True)
+
+    def insert(self, index: int, obj) -> None:
+        """Insert a channel into the list and index its parameters."""
+        super().insert(index, obj)
+        self._zi_update_index([obj], add=True)
+
+    def remove(self, obj) -> None:
+        """Remove a channel from the list and from the parameter index."""
+        super().remove(obj)
+        self._zi_update_index([obj], add=False)
+
+    def clear(self) -> None:
+        """Remove all channels from the list and from the parameter index."""
+        channels = tuple(self)
+        super().clear()
+        self._zi_update_index(channels, add=False)
+
     def snapshot(self, update: bool = True) -> dict:
         """Decorate a snapshot dictionary with metadata.
 
@@ -473,7 +1640,7 @@ class ZIChannelList(ChannelList):
             return super().print_readable_snapshot(update, max_chars)
 
 
-class ZIInstrument(Instrument):
+class ZIInstrument(_ZILazyLayer, Instrument):
     """Zurich Instrument specific Qcodes Instrument.
 
     Overwrite the snapshot functionality to use the ZISnapshotHelper.
@@ -482,28 +1649,282 @@ class ZIInstrument(Instrument):
         name: Name of
         snapshot_cache (ZISnapshotHelper): ZI specific SnapshotHelper object
         zi_node (Node): ZI specific node object of the nodetree
+        latency_stats: Latency statistics into which the node operations are
+            recorded, e.g. the ones of the session. (default = None, own
+            statistics)
     """
 
-    def __init__(self, name, nodetree: NodeTree, is_module=False):
+    # Number of snapshot tokens that can be used as reference for a delta
+    _MAX_SNAPSHOT_TOKENS = 16
+
+    def __init__(
+        self,
+        name,
+        nodetree: NodeTree,
+        is_module=False,
+        latency_stats: t.Optional[LatencyStats] = None,
+    ):
+        # Guards the creation of the pending nodes of all layers
+        self._zi_lock = threading.RLock()
+        self._latency_stats = latency_stats or LatencyStats()
+        self._parameter_index = ZIParameterIndex()
+        self._write_cache = ZIWriteCache()
+        self._snapshot_states: "OrderedDict[str, t.Dict[str, t.Any]]" = OrderedDict()
         super().__init__(name)
-        self._snapshot_cache = ZISnapshotHelper(nodetree, is_module=is_module)
+        self._snapshot_cache = ZISnapshotHelper(
+            nodetree,
+            is_module=is_module,
+            parameter_index=self._parameter_index,
+            write_cache=self._write_cache,
+        )
 
-    def snapshot(self, update: bool = True) -> dict:
+    @property
+    def snapshot_ttl(self) -> float:
+        """Time in seconds for which snapshot values are reused.
+
+        Consecutive snapshots within this time (e.g. from the station and from
+        the instrument itself) reuse the values of the first one instead of
+        getting them from the device again. Setting a parameter of the
+        instrument invalidates the values. (default = 0, no reuse)
+        """
+        return self._snapshot_cache.ttl
+
+    @snapshot_ttl.setter
+    def snapshot_ttl(self, value: float) -> None:
+        self._snapshot_cache.ttl = value
+
+    @property
+    def incremental_snapshot(self) -> bool:
+        """Flag if the incremental snapshot mode is enabled.
+
+        Instead of getting all nodes on every snapshot, the values are kept
+        in a local mirror that is updated through a subscription to the
+        nodes. This makes repeated snapshots considerably faster.
+        (see ``ZISnapshotHelper.incremental``)
+        """
+        return self._snapshot_cache.incremental
+
+    @incremental_snapshot.setter
+    def incremental_snapshot(self, value: bool) -> None:
+        self._snapshot_cache.incremental = value
+
+    def close(self) -> None:
+        """Close the instrument.
+
+        Also closes the dedicated connection of the incremental snapshots.
+        """
+        # QCoDeS strips the attributes of closed instruments
+        snapshot_cache = vars(self).get("_snapshot_cache")
+        if snapshot_cache is not None:
+            snapshot_cache.incremental = False
+        super().close()
+
+    @property
+    def suppress_redundant_writes(self) -> bool:
+        """Flag if the set-if-changed mode is enabled.
+
+        In this mode the set of a parameter is skipped if the value matches
+        the last value the device acknowledged for its node in a deep set
+        (``parameter(value, deep=True)``). The cache of these values is
+        cleared by a factory reset, the load of a settings file, the toolkit
+        functions of the instrument (e.g. ``enable_sequencer``) and a
+        reconnect. A node is removed from it as soon as a different value is
+        observed for it (e.g. in a snapshot or poll). Changes by other clients
+        that are not observed this way are not detected. (default = False)
+        """
+        return self._write_cache.enabled
+
+    @suppress_redundant_writes.setter
+    def suppress_redundant_writes(self, value: bool) -> None:
+        self._write_cache.enabled = value
+
+    @property
+    def suppressed_writes(self) -> int:
+        """Number of sets skipped by the set-if-changed mode."""
+        return self._write_cache.suppressed
+
+    def invalidate_write_cache(self) -> None:
+        """Clear the last acknowledged values of the set-if-changed mode.
+
+        Needed whenever the nodes of the instrument were changed by other
+        means (e.g. by another client).
+        """
+        self._write_cache.clear()
+
+    @property
+    def parameter_index(self) -> ZIParameterIndex:
+        """Index between the lowercase node paths and the QCoDeS parameters.
+
+        Only contains parameters that are already created, i.e. in the lazy
+        mode parameters that were not accessed yet are missing.
+        """
+        return self._parameter_index
+
+    def get_many(
+        self, params_or_paths: t.Iterable[t.Union[ZIParameter, str]]
+    ) -> "NodeDict":
+        """Get the values of multiple parameters with a single command.
+
+        The caches of all parameters are updated with a common timestamp.
+
+        Args:
+            params_or_paths: Parameters or node paths of the parameters. Node
+                paths without leading slash are relative to the instrument
+                (e.g. ``demods/0/rate``).
+
+        Returns:
+            Values of the parameters that can be accessed with both the
+            parameters and their lowercase absolute node paths.
+
+        Raises:
+            KeyError: If a node path does not match a parameter or the data
+                server did not return a value for it.
+        """
+        return _get_many(
+            self._snapshot_cache._nodetree.connection,
+            [self._zi_parameter(item) for item in params_or_paths],
+        )
+
+    def _zi_parameter(self, param_or_path: t.Union[ZIParameter, str]) -> ZIParameter:
+        """Resolve a parameter or a node path into a parameter.
+
+        Args:
+            param_or_path: Parameter or node path of the parameter. Node paths
+                without leading slash are relative to the instrument.
+
+        Returns:
+            Parameter of the instrument.
+
+        Raises:
+            KeyError: If the node path does not match a parameter.
+        """
+        if isinstance(param_or_path, ZIParameter):
+            return param_or_path
+        nodetree = self._snapshot_cache._nodetree
+        path = param_or_path.lower().rstrip("/")
+        if not path.startswith("/"):
+            path = f"/{nodetree.prefix_hide}/{path}"
+        parameter = self._parameter_index.get(path)
+        if parameter is None:
+            try:
+                parameter = tk_node_to_parameter(self, nodetree.raw_path_to_node(path))
+            except (KeyError, IndexError) as error:
+                raise KeyError(param_or_path) from error
+        return parameter
+
+    def snapshot(
+        self,
+        update: bool = True,
+        include: t.Optional[t.Iterable[str]] = None,
+        exclude: t.Optional[t.Iterable[str]] = None,
+    ) -> dict:
         """Decorate a snapshot dictionary with metadata.
 
         Override base method to make update default True and use the
         ZISnapshotHelper.
 
+        With ``include`` only the subtrees of the device that can contain
+        matching nodes are fetched and only the matching parameters are part
+        of the snapshot. Submodules without matching parameters are omitted.
+
         Args:
             update: Passed to snapshot_base.
+            include: Glob patterns of the node paths that should be part of
+                the snapshot. Patterns without leading ``/`` are relative to
+                the device (e.g. ["sigouts/*", "qachannels/*/oscs/*"]).
+                (default = None)
+            exclude: Glob patterns of the node paths that should not be part
+                of the snapshot. Takes precedence over ``include``.
+                (default = None)
 
         Returns:
             dict: Base snapshot.
         """
-        with self._snapshot_cache.snapshot() if update else nullcontext():
-            return super().snapshot(update)
+        if include is None and exclude is None:
+            with self._snapshot_cache.snapshot() if update else nullcontext():
+                return super().snapshot(update)
+        snapshot_filter = _SnapshotFilter(
+            self._snapshot_cache._nodetree.prefix_hide, include, exclude
+        )
+        paths = snapshot_filter.roots
+        fetch = update and paths != []
+        with self._snapshot_cache.snapshot(paths=paths) if fetch else nullcontext():
+            return _filtered_snapshot(self, update, snapshot_filter)
 
-    def print_readable_snapshot(self, update: bool = True, max_chars: int = 80) -> None:
+    def snapshot_async(self, update: bool = True) -> "Future[dict]":
+        """Take a snapshot in the background.
+
+        The snapshot is taken on a worker thread that is shared by all
+        background snapshots. All values of the snapshot originate from the
+        single get command that is issued first on the worker thread and have
+        its time as timestamp. This allows e.g. a measurement to start while
+        the snapshot is still collected.
+
+        Args:
+            update: Passed to snapshot. (default = True)
+
+        Returns:
+            Future that resolves to the snapshot dictionary.
+        """
+        return submit_snapshot(self.snapshot, update)
+
+    def snapshot_delta(
+        self, since: t.Optional[str] = None, update: bool = True
+    ) -> dict:
+        """Snapshot that only contains the parameters changed since a reference.
+
+        Each call returns a token that can be used as reference for the next
+        call. The full snapshot is returned if no reference is specified. It
+        is the base from which ``rebuild_snapshot`` restores the full snapshot
+        of every following delta.
+
+        Only the latest snapshot tokens are kept as reference.
+
+        Args:
+            since: Token of the reference snapshot. (default = None)
+            update: Passed to snapshot. (default = True)
+
+        Returns:
+            Dictionary with the ``token`` of the snapshot, the token of the
+            reference (``since``) and either the full ``snapshot`` or the
+            snapshots of the changed ``parameters`` by their path within the
+            full snapshot.
+
+        Raises:
+            KeyError: If the reference token is unknown or expired.
+        """
+        reference = self._snapshot_states.get(since) if since is not None else {}
+        if reference is None:
+            raise KeyError(f"Unknown or expired snapshot token {since}")
+        snapshot = self.snapshot(update)
+        parameters = dict(_snapshot_parameters(snapshot))
+        state = {
+            path: (parameter.get("value"), parameter.get("raw_value"))
+            for path, parameter in parameters.items()
+        }
+        token = uuid.uuid4().hex
+        self._snapshot_states[token] = state
+        while len(self._snapshot_states) > self._MAX_SNAPSHOT_TOKENS:
+            self._snapshot_states.popitem(last=False)
+        if since is None:
+            return {"token": token, "since": None, "snapshot": snapshot}
+        return {
+            "token": token,
+            "since": since,
+            "parameters": {
+                path: parameter
+                for path, parameter in parameters.items()
+                if _changed(reference.get(path), state[path])
+            },
+        }
+
+    def print_readable_snapshot(
+        self,
+        update: bool = True,
+        max_chars: int = 80,
+        include: t.Optional[t.Iterable[str]] = None,
+        exclude: t.Optional[t.Iterable[str]] = None,
+    ) -> None:
         """Prints a readable version of the snapshot.
 
         The readable snapshot includes the name, value and unit of each
@@ -518,9 +1939,528 @@ class ZIInstrument(Instrument):
             max_chars: the maximum number of characters per line. The
                 readable snapshot will be cropped if this value is exceeded.
                 Defaults to 80 to be consistent with default terminal width.
+            include: Glob patterns of the node paths that should be printed
+                (see ``snapshot``). (default = None)
+            exclude: Glob patterns of the node paths that should not be
+                printed (see ``snapshot``). (default = None)
         """
-        with self._snapshot_cache.snapshot() if update else nullcontext():
-            return super().print_readable_snapshot(update, max_chars)
+        for line in self.readable_snapshot(update, max_chars, include, exclude):
+            print(line)
+
+    def readable_snapshot(
+        self,
+        update: bool = True,
+        max_chars: int = 80,
+        include: t.Optional[t.Iterable[str]] = None,
+        exclude: t.Optional[t.Iterable[str]] = None,
+    ) -> t.Iterator[str]:
+        """Lines of the readable version of the snapshot.
+
+        The values of all nodes are fetched with a single get command when the
+        first line is requested. The lines are then generated submodule by
+        submodule, without building the snapshot of the whole instrument. No
+        snapshot context is held between the lines, i.e. the iteration can be
+        stopped at any time.
+
+        Args:
+            update: If ``True``, update the state by querying the
+                instrument. If ``False``, just use the latest values in memory.
+            max_chars: the maximum number of characters per line.
+            include: Glob patterns of the node paths that should be part of
+                the readable snapshot (see ``snapshot``). (default = None)
+            exclude: Glob patterns of the node paths that should not be part
+                of the readable snapshot (see ``snapshot``). (default = None)
+
+        Returns:
+            Lines of the readable snapshot.
+        """
+        snapshot_filter = None
+        if include is not None or exclude is not None:
+            snapshot_filter = _SnapshotFilter(
+                self._snapshot_cache._nodetree.prefix_hide, include, exclude
+            )
+        yield from ZISnapshotHelper.readable_snapshot(
+            self, update, max_chars, snapshot_filter
+        )
+
+    def write_readable_snapshot(
+        self,
+        file: t.TextIO,
+        update: bool = True,
+        max_chars: int = 80,
+        include: t.Optional[t.Iterable[str]] = None,
+        exclude: t.Optional[t.Iterable[str]] = None,
+    ) -> None:
+        """Write the readable version of the snapshot into a file.
+
+        The lines are written while they are generated (see
+        ``readable_snapshot``).
+
+        Args:
+            file: Text file handle (e.g. ``sys.stdout``).
+            update: If ``True``, update the state by querying the
+                instrument. If ``False``, just use the latest values in memory.
+            max_chars: the maximum number of characters per line.
+            include: Glob patterns of the node paths that should be written
+                (see ``snapshot``). (default = None)
+            exclude: Glob patterns of the node paths that should not be
+                written (see ``snapshot``). (default = None)
+        """
+        for line in self.readable_snapshot(update, max_chars, include, exclude):
+            file.write(line + "\n")
+
+
+class _SnapshotFilter:
+    """Node path filter of a snapshot.
+
+    Args:
+        prefix: Node path prefix of the device (e.g. the serial).
+        include: Glob patterns of the node paths that should be part of the
+            snapshot. Relative patterns are prefixed with the device.
+        exclude: Glob patterns of the node paths that should not be part of
+            the snapshot.
+    """
+
+    def __init__(
+        self,
+        prefix: str,
+        include: t.Optional[t.Iterable[str]],
+        exclude: t.Optional[t.Iterable[str]],
+    ):
+        self._prefix = f"/{prefix.lower()}" if prefix else ""
+        include = self._absolute(include)
+        self._include = _compile_globs(include)
+        self._exclude = _compile_globs(self._absolute(exclude))
+        self.roots = self._roots(include) if include else [self._prefix]
+
+    def _absolute(
+        self, patterns: t.Optional[t.Iterable[str]]
+    ) -> t.Optional[t.List[str]]:
+        """Prefix relative patterns with the device."""
+        if patterns is None:
+            return None
+        return [
+            (pattern if pattern.startswith("/") else f"{self._prefix}/{pattern}")
+            .lower()
+            .rstrip("/")
+            for pattern in patterns
+        ]
+
+    def _roots(self, patterns: t.List[str]) -> t.List[str]:
+        """Paths of the subtrees that can contain nodes matching the patterns.
+
+        The roots never leave the device. The device element of the patterns
+        (e.g. ``/*/sigouts/*``) is resolved to the device itself and patterns
+        of other devices are skipped.
+
+        Args:
+            patterns: Absolute glob patterns.
+
+        Returns:
+            Paths of the parents of the patterns up to the first wildcard.
+            Subtrees of other roots are omitted.
+        """
+        roots: t.List[str] = []
+        for pattern in patterns:
+            if self._prefix:
+                device, _, path = pattern[1:].partition("/")
+                if not fnmatch.fnmatchcase(self._prefix[1:], device):
+                    continue
+                pattern = f"{self._prefix}/{path}"
+            literal = re.split(r"[*?\[]", pattern, maxsplit=1)[0]
+            roots.append(max(literal.rsplit("/", 1)[0], self._prefix, key=len))
+        result: t.List[str] = []
+        for root in sorted(set(roots)):
+            if not any(root.startswith(parent + "/") for parent in result):
+                result.append(root)
+        return result
+
+    def matches(self, parameter: Parameter) -> bool:
+        """Check if a parameter is part of the snapshot."""
+        path = getattr(parameter, "zi_node", None)
+        if path is None:
+            return self._include is None
+        path = path.lower()
+        if self._include and not self._include.match(path):
+            return False
+        return not (self._exclude and self._exclude.match(path))
+
+    def covers(self, layer: t.Any) -> bool:
+        """Check if a submodule can contain parameters of the snapshot."""
+        zi_node = getattr(layer, "_zi_node", None)
+        if zi_node is None or self._include is None:
+            return True
+        path = f"{self._prefix}/{zi_node}".lower()
+        return any(
+            path == root or path.startswith(root + "/") or root.startswith(path + "/")
+            for root in self.roots
+        )
+
+
+def _filtered_parameters(
+    layer: t.Any, snapshot_filter: _SnapshotFilter
+) -> t.Iterator[Parameter]:
+    """Parameters of a layer and its submodules that are part of a filter.
+
+    Submodules and channels that are not covered by the filter are not
+    accessed.
+
+    Args:
+        layer: Instrument, submodule or channel list.
+        snapshot_filter: Filter of the snapshot.
+
+    Returns:
+        Parameters of the filter.
+    """
+    if isinstance(layer, ChannelList):
+        submodules: t.Iterable[t.Any] = layer
+    else:
+        for parameter in layer.parameters.values():
+            if not parameter.snapshot_exclude and snapshot_filter.matches(parameter):
+                yield parameter
+        submodules = layer.submodules.values()
+    for submodule in submodules:
+        if snapshot_filter.covers(submodule):
+            yield from _filtered_parameters(submodule, snapshot_filter)
+
+
+def _prune_snapshot(
+    layer: t.Any, snapshot: dict, snapshot_filter: _SnapshotFilter
+) -> bool:
+    """Remove everything that is not part of a filter from a snapshot.
+
+    Args:
+        layer: Instrument, submodule or channel list of the snapshot.
+        snapshot: QCoDeS snapshot of the layer. Modified in place.
+        snapshot_filter: Filter of the snapshot.
+
+    Returns:
+        Flag if the snapshot still contains a parameter of the filter.
+    """
+    if isinstance(layer, ChannelList):
+        channels = {channel.name: channel for channel in layer}
+        snapshot_channels = snapshot.get("channels", {})
+        for name in list(snapshot_channels):
+            channel = channels[name]
+            if not (
+                snapshot_filter.covers(channel)
+                and _prune_snapshot(channel, snapshot_channels[name], snapshot_filter)
+            ):
+                del snapshot_channels[name]
+        return bool(snapshot_channels)
+    parameters = snapshot["parameters"]
+    for name in list(parameters):
+        if not snapshot_filter.matches(layer.parameters[name]):
+            del parameters[name]
+    submodules = snapshot["submodules"]
+    for name in list(submodules):
+        submodule = layer.submodules[name]
+        if not (
+            snapshot_filter.covers(submodule)
+            and _prune_snapshot(submodule, submodules[name], snapshot_filter)
+        ):
+            del submodules[name]
+    return bool(parameters or submodules)
+
+
+def _filtered_snapshot(
+    instrument: Instrument, update: bool, snapshot_filter: _SnapshotFilter
+) -> dict:
+    """Snapshot of an instrument that only contains the parameters of a filter.
+
+    Only the parameters of the filter are updated. The snapshot itself is the
+    QCoDeS snapshot of the instrument without update, pruned to these
+    parameters. Submodules without any parameter of the filter are removed.
+
+    Args:
+        instrument: Instrument of the snapshot.
+        update: Flag if the parameters of the filter should be updated.
+        snapshot_filter: Filter of the snapshot.
+
+    Returns:
+        Snapshot of the instrument.
+    """
+    if update:
+        for parameter in _filtered_parameters(instrument, snapshot_filter):
+            parameter.snapshot(update=True)
+    snapshot = instrument.snapshot(update=False)
+    _prune_snapshot(instrument, snapshot, snapshot_filter)
+    return snapshot
+
+
+def _readable_parameter_lines(
+    name: str, snapshot_parameters: t.Dict[str, dict], max_chars: int
+) -> t.Iterator[str]:
+    """Lines of the readable snapshot of the parameters of a single submodule.
+
+    Args:
+        name: Name of the submodule.
+        snapshot_parameters: Snapshots of the parameters by their name.
+        max_chars: The maximum number of characters per line.
+
+    Returns:
+        Lines of the readable snapshot. No lines if there are no parameters.
+    """
+    if not snapshot_parameters:
+        return
+    floating_types = (float, np.integer, np.floating)
+    # Min of 50 is to prevent a super long parameter name to break this
+    # function
+    par_field_len = min(max(len(p) for p in snapshot_parameters) + 1, 50)
+
+    yield name + ":"
+    yield f"\t{'parameter':<{par_field_len}}: value"
+    yield "\t" + "-" * (max_chars - 8)
+    for parameter_name in sorted(snapshot_parameters):
+        parameter = snapshot_parameters[parameter_name]
+        msg = f"\t{parameter['name']:<{par_field_len}}:"
+
+        # in case of e.g. ArrayParameters, that usually have
+        # snapshot_value == False, the parameter may not have
+        # a value in the snapshot
+        val = parameter.get("value", "Not available")
+
+        unit = parameter.get("unit", None)
+        if unit is None:
+            # this may be a multi parameter
+            unit = parameter.get("units", None)
+        if isinstance(val, floating_types):
+            msg += f"\t{val:.5g} "
+            # numpy float and int types format like builtins
+        else:
+            msg += f"\t{val} "
+        if unit != "":  # corresponds to no unit
+            msg += f"({unit})"
+        # Truncate the message if it is longer than max length
+        if len(msg) > max_chars and max_chars != -1:
+            msg = msg[0 : max_chars - 3] + "..."  # noqa: E203
+        yield msg
+
+
+def _snapshot_parameters(
+    snapshot: dict, prefix: t.Tuple[str, ...] = ()
+) -> t.Iterator[t.Tuple[str, dict]]:
+    """Snapshots of all parameters within a snapshot.
+
+    Args:
+        snapshot: Snapshot of an instrument, submodule or channel list.
+        prefix: Keys of the snapshot within the full snapshot.
+
+    Returns:
+        Path of every parameter within the full snapshot (keys joined by
+        ``/``) and its snapshot.
+    """
+    for name, parameter in snapshot.get("parameters", {}).items():
+        yield "/".join((*prefix, "parameters", name)), parameter
+    for key in ("submodules", "channels"):
+        for name, submodule in snapshot.get(key, {}).items():
+            yield from _snapshot_parameters(submodule, (*prefix, key, name))
+
+
+def _changed(old: t.Any, new: t.Any) -> bool:
+    """Check if a value of a snapshot changed.
+
+    Args:
+        old: Old value.
+        new: New value.
+
+    Returns:
+        Flag if the values differ. Values that can not be compared are
+        treated as changed.
+    """
+    try:
+        return bool(old != new)
+    except ValueError:
+        return True
+
+
+def rebuild_snapshot(base: dict, deltas: t.Iterable[dict]) -> dict:
+    """Rebuild a full snapshot from a base and a chain of snapshot deltas.
+
+    Args:
+        base: Full snapshot or the snapshot delta without reference that
+            contains it.
+        deltas: Consecutive snapshot deltas (see
+            ``ZIInstrument.snapshot_delta``), each referencing the previous.
+
+    Returns:
+        Full snapshot after applying all deltas.
+
+    Raises:
+        ValueError: If the deltas do not form a chain.
+    """
+    token = base.get("token")
+    snapshot = copy.deepcopy(base["snapshot"] if "snapshot" in base else base)
+    for delta in deltas:
+        if token is not None and delta["since"] != token:
+            raise ValueError(
+                f"Snapshot delta {delta['token']} does not follow {token}."
+            )
+        token = delta["token"]
+        for path, parameter in delta["parameters"].items():
+            *keys, name = path.split("/")
+            layer = snapshot
+            for key in keys:
+                layer = layer.setdefault(key, {})
+            layer[name] = copy.deepcopy(parameter)
+    return snapshot
+
+
+_snapshot_executor: t.Optional[ThreadPoolExecutor] = None
+_snapshot_executor_lock = threading.Lock()
+
+
+def submit_snapshot(function: t.Callable, *args, **kwargs) -> Future:
+    """Run a snapshot function on the background snapshot thread.
+
+    All background snapshots share a single worker thread. Snapshots of the
+    same instrument are therefore never taken concurrently.
+
+    Args:
+        function: Function that takes the snapshot.
+        *args: Positional arguments of the function.
+        **kwargs: Keyword arguments of the function.
+
+    Returns:
+        Future that resolves to the return value of the function.
+    """
+    global _snapshot_executor
+    with _snapshot_executor_lock:
+        if _snapshot_executor is None:
+            _snapshot_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="zi-snapshot"
+            )
+    return _snapshot_executor.submit(function, *args, **kwargs)
+
+
+class _OrderedExecutor:
+    """Bounded thread pool that keeps the order of calls with the same key.
+
+    Calls with different keys run concurrently on up to ``max_workers``
+    threads. Calls with the same key run one after another in the order of
+    their submission. Waiting calls do not occupy a thread.
+
+    Args:
+        max_workers: Maximum number of threads.
+        thread_name_prefix: Prefix of the thread names.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=thread_name_prefix
+        )
+        self._lock = threading.Lock()
+        self._queues: t.Dict[t.Hashable, t.Deque[t.Tuple[Future, t.Callable]]] = {}
+
+    def submit(self, key: t.Hashable, function: t.Callable, *args, **kwargs) -> Future:
+        """Schedule a call after all pending calls with the same key.
+
+        Args:
+            key: Key of the call (e.g. the instrument).
+            function: Function to call.
+            *args: Positional arguments of the function.
+            **kwargs: Keyword arguments of the function.
+
+        Returns:
+            Future that resolves to the return value of the function.
+        """
+        future: Future = Future()
+        call = functools.partial(function, *args, **kwargs)
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue is not None:
+                queue.append((future, call))
+                return future
+            self._queues[key] = deque()
+        self._executor.submit(self._run, key, future, call)
+        return future
+
+    def _run(self, key: t.Hashable, future: Future, call: t.Callable) -> None:
+        """Run a call and schedule the next pending call with the same key."""
+        if future.set_running_or_notify_cancel():
+            try:
+                result = call()
+            except BaseException as error:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+        with self._lock:
+            queue = self._queues[key]
+            if not queue:
+                del self._queues[key]
+                return
+            future, call = queue.popleft()
+        self._executor.submit(self._run, key, future, call)
+
+
+# Maximum number of threads per executor of the asynchronous API
+_ASYNC_MAX_WORKERS = 8
+_async_executors: t.Dict[str, _OrderedExecutor] = {}
+_async_executor_lock = threading.Lock()
+
+
+def _async_executor(lane: str) -> _OrderedExecutor:
+    """Executor of a lane of the asynchronous API (created on first use).
+
+    Args:
+        lane: Name of the lane.
+    """
+    with _async_executor_lock:
+        executor = _async_executors.get(lane)
+        if executor is None:
+            executor = _async_executors[lane] = _OrderedExecutor(
+                _ASYNC_MAX_WORKERS, f"zi-async-{lane}"
+            )
+        return executor
+
+
+async def run_async(layer: t.Any, function: t.Callable, *args, **kwargs) -> t.Any:
+    """Run a blocking function without blocking the event loop.
+
+    The function runs on the bounded executor of the asynchronous API (at most
+    ``_ASYNC_MAX_WORKERS`` threads). The operations of the same instrument
+    run in the order of their calls, the ones of different instruments
+    concurrently. Long waits use ``wait_async`` instead so that they do not
+    delay the other operations of the instrument.
+
+    Args:
+        layer: Instrument, submodule or parameter the operation belongs to.
+        function: Blocking function.
+        *args: Positional arguments of the function.
+        **kwargs: Keyword arguments of the function.
+
+    Returns:
+        Return value of the function.
+    """
+    future = _async_executor("operations").submit(
+        layer.root_instrument, function, *args, **kwargs
+    )
+    return await asyncio.wrap_future(future)
+
+
+async def wait_async(layer: t.Any, function: t.Callable, *args, **kwargs) -> t.Any:
+    """Run a blocking wait without blocking the event loop.
+
+    Waits (e.g. ``wait_done`` or ``wait_for_state_change``) can block for
+    their whole timeout. They therefore run on a separate executor of the
+    asynchronous API (at most ``_ASYNC_MAX_WORKERS`` threads) and do not
+    delay the operations of ``run_async``. The waits of the same layer run in
+    the order of their calls, the ones of different layers concurrently.
+    A wait is not ordered with respect to the other operations of the
+    instrument, i.e. it only sees the operations that were awaited before it
+    was started.
+
+    Args:
+        layer: Instrument, submodule or parameter the wait belongs to.
+        function: Blocking wait.
+        *args: Positional arguments of the function.
+        **kwargs: Keyword arguments of the function.
+
+    Returns:
+        Return value of the function.
+    """
+    future = _async_executor("waits").submit(layer, function, *args, **kwargs)
+    return await asyncio.wrap_future(future)
 
 
 class NodeDict(Mapping):
@@ -558,6 +2498,56 @@ class NodeDict(Mapping):
         return self._result.to_dict()
 
 
+def _get_many(connection: t.Any, parameters: t.Iterable[ZIParameter]) -> "NodeDict":
+    """Get the values of multiple parameters with a single get command.
+
+    The values are parsed like in a get of the parameter itself and the
+    caches of all parameters are updated with the time at which the command
+    was issued.
+
+    Args:
+        connection: Connection to the data server (or LabOne module) of the
+            parameters.
+        parameters: Parameters to get.
+
+    Returns:
+        Values of the parameters.
+
+    Raises:
+        KeyError: If the data server did not return a value for a parameter.
+    """
+    by_path = {parameter.zi_node.lower(): parameter for parameter in parameters}
+    if not by_path:
+        return NodeDict({})
+    paths = ",".join(by_path)
+    timestamp = datetime.now()
+    # modules don`t have settingsonly argument
+    try:
+        raw_values = connection.get(paths, settingsonly=False, flat=True)
+    except TypeError:
+        raw_values = connection.get(paths, flat=True)
+    result = {}
+    for raw_path, raw_value in raw_values.items():
+        path = raw_path.lower()
+        parameter = by_path.get(path)
+        if parameter is None:
+            continue
+        _, value = Node._parse_get_entry(raw_value)
+        # numpy scalars would bypass the enum parsing
+        value = value.item() if isinstance(value, np.generic) else value
+        value = parameter.tk_node._parse_get_value(value)
+        parameter.cache._update_with(value=value, raw_value=value, timestamp=timestamp)
+        result[path] = value
+    write_caches = {id(cache): cache for cache in map(_write_cache, by_path.values())}
+    for write_cache in write_caches.values():
+        if write_cache is not None:
+            write_cache.observe(result)
+    missing = [path for path in by_path if path not in result]
+    if missing:
+        raise KeyError(", ".join(missing))
+    return NodeDict(result)
+
+
 def tk_node_to_qcodes_list(tk_node: Node) -> t.List[str]:
     """Convert a toolkit node to a list of elements that form a QCoDeS object.
 
@@ -591,6 +2581,10 @@ def tk_node_to_qcodes_list(tk_node: Node) -> t.List[str]:
 def tk_node_to_parameter(root: t.Any, tk_node: Node) -> t.Any:
     """Convert a Toolkit node into a QCoDeS Parameter.
 
+    Uses the parameter index of the root if possible and only walks the
+    submodules if the parameter is not indexed (e.g. not yet created in the
+    lazy mode).
+
     Args:
         root: Root from which the node should be derived.
         tk_node: Toolkit node to convert.
@@ -598,21 +2592,130 @@ def tk_node_to_parameter(root: t.Any, tk_node: Node) -> t.Any:
     Returns:
         QCoDeS Parameter that matches the given tk node.
     """
-    qcodes_list = list(tk_node.raw_tree)
-    if qcodes_list[-1].isdigit():
-        qcodes_list.append("value")
+    index = getattr(root, "_parameter_index", None)
+    if index is not None:
+        parameter = index.get(tk_node.root.node_to_raw_path(tk_node).lower())
+        if parameter is not None:
+            return parameter
+    raw_tree = list(tk_node.raw_tree)
+    if raw_tree[-1].isdigit():
+        raw_tree.append("value")
+    name = tk_node_to_qcodes_list(tk_node)[-1]
     current_layer = root
-    for element in qcodes_list[:-1]:
-        qcodes_list = tk_node_to_qcodes_list(tk_node)
+    for element in raw_tree[:-1]:
         if element.isdigit():
             current_layer = current_layer[int(element)]
         else:
             current_layer = current_layer.submodules[element]
-    return current_layer.parameters[qcodes_list[-1]]
+    return current_layer.parameters[name]
+
+
+def _split_list_element(node: str) -> t.Optional[t.Tuple[str, int]]:
+    """Split a QCoDeS path element of a list item into name and index.
+
+    Args:
+        node: Element of the QCoDeS path (e.g. demods0).
+
+    Returns:
+        Name of the list and index of the item or None if the element does not
+        belong to a list.
+    """
+    weird_nodes = ["tamp0", "tamp1"]
+    if not node[-1].isdigit() or node in weird_nodes:
+        return None
+    offset = 0
+    for char in reversed(node):
+        if char.isdigit():
+            offset += 1
+        else:
+            break
+    return node[:-offset], int(node[-offset:])
+
+
+def _get_channel_list(
+    layer, name: str, zi_node: str, snapshot_cache: ZISnapshotHelper
+) -> ZIChannelList:
+    """Get the channel list of a layer and create it if it does not exist.
+
+    Args:
+        layer: Layer that holds the channel list.
+        name: Name of the channel list.
+        zi_node: Node path of the channel list.
+        snapshot_cache: Object of the snapshot cache.
+
+    Returns:
+        Channel list with the given name.
+    """
+    if not layer.submodules or name not in layer.submodules:
+        channel_list = ZIChannelList(
+            layer,
+            name,
+            ZINode,
+            zi_node=zi_node,
+            snapshot_cache=snapshot_cache,
+        )
+        layer.add_submodule(name, channel_list)
+    return layer.submodules[name]
+
+
+def _get_child(
+    layer, parents: t.List[str], index: int, snapshot_cache: ZISnapshotHelper
+) -> ZINode:
+    """Get the child of a layer for a single element of the nested parents.
+
+    Reuse the existing subnode and automatically create it if it doesn`t
+    exist.
+
+    Args:
+        layer: Layer that holds the child.
+        parents: Nested parents of a node as str.
+        index: Index of the element in ``parents`` that represents the child.
+        snapshot_cache: Object of the snapshot cache.
+
+    Returns:
+        ZINode: child of the layer
+    """
+    node = parents[index]
+    list_element = _split_list_element(node)
+    if list_element:
+        name, number = list_element
+        channel_list = _get_channel_list(
+            layer,
+            name,
+            "/".join(parents[:index] + [name]),
+            snapshot_cache,
+        )
+        if len(channel_list) <= number:
+            # Add new items to list until the required length is reached. (#31)
+            current_length = len(channel_list)
+            for item in range(number - current_length + 1):
+                module = ZINode(
+                    layer,
+                    name + str(current_length + item),
+                    zi_node="/".join(
+                        parents[:index] + [name, str(current_length + item)]
+                    ),
+                    snapshot_cache=snapshot_cache,
+                )
+                channel_list.append(module)
+        return channel_list[number]
+    if node not in layer.submodules:
+        module = ZINode(
+            layer,
+            node,
+            zi_node="/".join(parents[: index + 1]),
+            snapshot_cache=snapshot_cache,
+        )
+        layer.add_submodule(node, module)
+        return module
+    return layer.submodules.get(node)
 
 
 def _get_submodule(
-    layer, parents: t.List[str], snapshot_cache: ZISnapshotHelper
+    layer,
+    parents: t.List[str],
+    snapshot_cache: ZISnapshotHelper,
+    cache: t.Optional[t.Dict[t.Tuple[str, ...], t.Any]] = None,
 ) -> ZINode:
     """Get the nested parent element for a node.
 
@@ -622,58 +2725,251 @@ def _get_submodule(
     Args:
         parents: Nested parents of a node as str.
         snapshot_cache: Object of the snapshot cache.
+        cache: Optional mapping of already resolved parents to their layer.
+            Allows sibling nodes to reuse the resolved parents instead of
+            walking the tree from the layer again. Only valid as long as the
+            structure of the layer is not modified otherwise. (default = None)
 
     Returns:
         ZINode: direct parent of the node
     """
-    weird_nodes = ["tamp0", "tamp1"]
-    current_layer = layer
-    for i, node in enumerate(parents):
-        if node[-1].isdigit() and node not in weird_nodes:
-            offset = 0
-            for char in reversed(node):
-                if char.isdigit():
-                    offset += 1
-                else:
-                    break
-            number = int(node[-offset:])
-            name = node[:-offset]
-            if not current_layer.submodules or name not in current_layer.submodules:
-                # create channel_list
-                channel_list = ZIChannelList(
-                    current_layer,
-                    name,
-                    ZINode,
-                    zi_node="/".join(parents[:i] + [name]),
-                    snapshot_cache=snapshot_cache,
-                )
-                current_layer.add_submodule(name, channel_list)
-            if len(current_layer.submodules[name]) <= number:
-                # Add new items to list until the required length is reached. (#31)
-                current_length = len(current_layer.submodules[name])
-                for item in range(number - current_length + 1):
-                    module = ZINode(
-                        current_layer,
-                        name + str(current_length + item),
-                        zi_node="/".join(
-                            parents[:i] + [name, str(current_length + item)]
-                        ),
-                        snapshot_cache=snapshot_cache,
-                    )
-                    current_layer.submodules[name].append(module)
-            current_layer = current_layer.submodules[name][number]
-        elif node not in current_layer.submodules:
-            module = ZINode(
-                current_layer,
-                node,
-                zi_node="/".join(parents[: i + 1]),
-                snapshot_cache=snapshot_cache,
-            )
-            current_layer.add_submodule(node, module)
-            current_layer = module
+    if cache is None:
+        current_layer = layer
+        for i in range(len(parents)):
+            current_layer = _get_child(current_layer, parents, i, snapshot_cache)
+        return current_layer
+    key = tuple(parents)
+    submodule = cache.get(key)
+    if submodule is None:
+        if key:
+            parent = _get_submodule(layer, parents[:-1], snapshot_cache, cache)
+            submodule = _get_child(parent, parents, len(parents) - 1, snapshot_cache)
         else:
-            current_layer = current_layer.submodules.get(node)
-    return current_layer
+            submodule = layer
+        cache[key] = submodule
+    return submodule
+
+
+def _node_metadata(node: Node, info) -> ZINodeMetadata:
+    """Create the metadata of a toolkit node.
+
+    Args:
+        node: Toolkit node.
+        info: Node information of the toolkit node.
+
+    Returns:
+        Metadata of the node.
+    """
+    return ZINodeMetadata(
+        description=info.get("Description"),
+        unit=info.get("Unit")
+        if info.get("Unit") not in ["None", "Dependent"]
+        else None,
+        vals=_COMPLEX_NUMBERS if _IS_COMPLEX.match(info.get("Node").lower()) else None,
+        snapshot=(
+            "Stream" not in info.get("Properties")
+            and "ZIVector" not in info.get("Type")
+            and "Read" in info.get("Properties")
+            and not any(x in node.raw_tree for x in _SNAPSHOT_BLACKLIST)
+        ),
+    )
+
+
+def _add_parameter(
+    layer,
+    name: str,
+    node: Node,
+    info,
+    snapshot_cache: ZISnapshotHelper,
+    metadata_table: t.Optional[NodeMetadataTable] = None,
+) -> None:
+    """Add a single toolkit node as QCoDeS parameter to a layer.
+
+    Args:
+        layer: Layer to which the parameter is added.
+        name: Name of the parameter.
+        node: Toolkit node of the parameter.
+        info: Node information of the toolkit node.
+        snapshot_cache: Instance of the SnapshotHelper.
+        metadata_table: Shared metadata table. If specified the parameter
+            references the metadata of the table instead of its own copy.
+            (default = None)
+    """
+    if metadata_table is None:
+        metadata = _node_metadata(node, info)
+    else:
+        key = (
+            node.raw_tree,
+            info.get("Description"),
+            info.get("Unit"),
+            info.get("Type"),
+            info.get("Properties"),
+        )
+        shared_metadata = metadata_table.get(key)
+        if shared_metadata is None:
+            shared_metadata = metadata_table[key] = _node_metadata(node, info)
+        metadata = shared_metadata
+    layer.add_parameter(
+        parameter_class=ZIParameter,
+        name=name,
+        snapshot_value=metadata.snapshot,
+        snapshot_get=metadata.snapshot,
+        zi_metadata=metadata,
+        zi_node=info.get("Node"),
+        tk_node=node,
+        snapshot_cache=snapshot_cache,
+    )
+
+
+def _materialize_layer(
+    layer,
+    depth: int,
+    entries: t.List[_PendingNode],
+    snapshot_cache: ZISnapshotHelper,
+    metadata_table: t.Optional[NodeMetadataTable] = None,
+) -> None:
+    """Create the parameters and direct submodules for pending nodes of a layer.
+
+    Nodes that belong to a deeper layer are passed on to the corresponding
+    submodule, which again only creates them on its first access.
+
+    Args:
+        layer: Layer the pending nodes belong to.
+        depth: Position of the layer within the QCoDeS path of the nodes.
+        entries: Pending nodes of the layer.
+        snapshot_cache: Instance of the SnapshotHelper.
+        metadata_table: Shared metadata table for the parameters.
+    """
+    children: t.Dict[str, t.List[_PendingNode]] = {}
+    for entry in entries:
+        qcodes_list, node, info = entry
+        if len(qcodes_list) > depth + 1:
+            children.setdefault(qcodes_list[depth], []).append(entry)
+            continue
+        try:
+            _add_parameter(
+                layer, qcodes_list[-1], node, info, snapshot_cache, metadata_table
+            )
+        except ValueError as e:
+            print(f"Node {info.get('Node')} could not be added as parameter\n", e)
+    for element, child_entries in children.items():
+        parents = child_entries[0][0][: depth + 1]
+        list_element = _split_list_element(element)
+        try:
+            if list_element:
+                name, number = list_element
+                channel_list = _get_channel_list(
+                    layer, name, "/".join(parents[:-1] + [name]), snapshot_cache
+                )
+                channel_list._zi_defer(number, depth + 1, child_entries, metadata_table)
+            else:
+                child = _get_child(layer, parents, depth, snapshot_cache)
+                child._zi_defer(depth + 1, child_entries, metadata_table)
+        except ValueError as e:
+            print(f"Node {'/'.join(parents)} could not be added as submodule\n", e)
+
+
+def _compile_globs(patterns: t.Optional[t.Iterable[str]]) -> t.Optional[t.Pattern]:
+    """Compile case insensitive glob patterns for node paths into a regex.
+
+    Args:
+        patterns: Glob patterns (e.g. "/*/qachannels/*").
+
+    Returns:
+        Regex that matches any of the patterns or None if no pattern is given.
+    """
+    if not patterns:
+        return None
+    return re.compile(
+        "|".join(fnmatch.translate(pattern.lower()) for pattern in patterns)
+    )
+
+
+def _tk_object_at(tk_object: t.Any, raw_tree: t.Tuple[str, ...]) -> t.Any:
+    """Toolkit object at a relative node path.
+
+    The path is resolved through the attributes of the toolkit object so
+    that driver specific toolkit nodes (e.g. AWG) are returned as such.
+
+    Args:
+        tk_object: Toolkit object from which the path is resolved.
+        raw_tree: Relative node path.
+
+    Returns:
+        Toolkit object at the given path.
+    """
+    for element in raw_tree:
+        tk_object = (
+            tk_object[int(element)]
+            if element.isdigit()
+            else getattr(tk_object, element)
+        )
+    return tk_object
+
+
+def _rebind_pending(
+    entries: t.List[_PendingNode], nodetree: NodeTree
+) -> t.List[_PendingNode]:
+    """Bind pending nodes to another node tree.
+
+    Args:
+        entries: Pending nodes.
+        nodetree: Node tree the nodes should be bound to.
+
+    Returns:
+        Pending nodes of the node tree.
+    """
+    return [
+        (qcodes_list, Node(nodetree, node.raw_tree), info)
+        for qcodes_list, node, info in entries
+    ]
+
+
+def rebind_nodetree(layer, tk_object: t.Any) -> None:
+    """Bind an existing QCoDeS hierarchy to a new toolkit object.
+
+    Replaces the toolkit nodes of all created parameters, pending nodes and
+    driver specific submodules by the corresponding ones of the new toolkit
+    object. The node tree of the new toolkit object must have the same
+    structure as the one the hierarchy was created from.
+
+    Args:
+        layer: Root layer of the hierarchy.
+        tk_object: Toolkit object (e.g. device) the hierarchy should be
+            bound to.
+    """
+    nodetree = tk_object.root
+    layer._snapshot_cache.rebind(nodetree)
+    invalidate_caches(layer)
+    with layer._zi_lock:
+        _rebind_layers(layer, tk_object)
+
+
+def _rebind_layers(layer, tk_object: t.Any) -> None:
+    """Rebind the created layers and pending nodes (see ``rebind_nodetree``)."""
+    nodetree = tk_object.root
+    layers = [layer]
+    while layers:
+        current = layers.pop()
+        state = vars(current)
+        if current is not layer and isinstance(state.get("_tk_object"), Node):
+            current._tk_object = _tk_object_at(tk_object, current._tk_object.raw_tree)
+        pending = state.get("_zi_pending")
+        if pending is not None:
+            depth, entries, metadata_table = pending
+            if isinstance(entries, dict):
+                entries = {
+                    index: _rebind_pending(item_entries, nodetree)
+                    for index, item_entries in entries.items()
+                }
+            else:
+                entries = _rebind_pending(entries, nodetree)
+            state["_zi_pending"] = (depth, entries, metadata_table)
+        for parameter in state.get("_zi_parameters", {}).values():
+            if isinstance(parameter, ZIParameter):
+                parameter._rebind(Node(nodetree, parameter.tk_node.raw_tree))
+        layers.extend(state.get("_zi_submodules", {}).values())
+        layers.extend(state.get("_zi_channels", ()))
 
 
 def init_nodetree(
@@ -681,6 +2977,10 @@ def init_nodetree(
     nodetree: NodeTree,
     snapshot_cache: ZISnapshotHelper,
     blacklist: tuple = tuple(),
+    lazy: bool = False,
+    metadata_table: t.Optional[NodeMetadataTable] = None,
+    include: t.Optional[t.Iterable[str]] = None,
+    exclude: t.Optional[t.Iterable[str]] = None,
 ) -> None:
     """Generate nested qcodes parameter from the device nodetree.
 
@@ -689,41 +2989,43 @@ def init_nodetree(
         nodetree: underlying toolkit node tree.
         snapshot_cache: Instance of the SnapshotHelper.
         blacklist: nodes to be blacklisted.
+        lazy: Flag if the parameters should only be created on the first
+            access instead of during the initialization. (default = False)
+        metadata_table: Shared metadata table (see ``node_metadata_table``).
+            If specified the parameters reference the metadata of the table
+            instead of holding their own copy. (default = None)
+        include: Glob patterns of the node paths that should be added
+            (e.g. ["/*/qachannels/*", "/*/system/*"]). If not specified all
+            nodes are added. (default = None)
+        exclude: Glob patterns of the node paths that should not be added.
+            Takes precedence over ``include``. (default = None)
     """
-    snapshot_blacklist = ["fwlog", "values"]
-
-    is_complex = re.compile("demods/./sample")
-
+    include_regex = _compile_globs(include)
+    exclude_regex = _compile_globs(exclude)
+    entries = []
     for node, info in nodetree:
-        if info.get("Node", "") in blacklist:
+        raw_path = info.get("Node", "")
+        if raw_path in blacklist:
+            continue
+        if include_regex and not include_regex.match(raw_path.lower()):
+            continue
+        if exclude_regex and exclude_regex.match(raw_path.lower()):
             continue
         try:
             qcodes_list = tk_node_to_qcodes_list(node)
-            name = qcodes_list[-1]
-            parent = _get_submodule(layer, qcodes_list[:-1], snapshot_cache)
-            do_snapshot = (
-                "Stream" not in info.get("Properties")
-                and "ZIVector" not in info.get("Type")
-                and "Read" in info.get("Properties")
-                and not any(x in node.raw_tree for x in snapshot_blacklist)
-            )
-            parent.add_parameter(
-                parameter_class=ZIParameter,
-                name=name,
-                docstring=info.get("Description"),
-                unit=info.get("Unit")
-                if info.get("Unit") not in ["None", "Dependent"]
-                else None,
-                get_cmd=node._get,
-                set_cmd=node._set,
-                vals=ComplexNumbers()
-                if re.match(is_complex, info.get("Node").lower())
-                else None,
-                snapshot_value=do_snapshot,
-                snapshot_get=do_snapshot,
-                zi_node=info.get("Node"),
-                tk_node=node,
-                snapshot_cache=snapshot_cache,
+        except ValueError as e:
+            print(f"Node {raw_path} could not be added as parameter\n", e)
+            continue
+        entries.append((qcodes_list, node, info))
+    if lazy:
+        layer._zi_defer(0, entries, metadata_table)
+        return
+    submodules: t.Dict[t.Tuple[str, ...], t.Any] = {}
+    for qcodes_list, node, info in entries:
+        try:
+            parent = _get_submodule(layer, qcodes_list[:-1], snapshot_cache, submodules)
+            _add_parameter(
+                parent, qcodes_list[-1], node, info, snapshot_cache, metadata_table
             )
         except ValueError as e:
             print(f"Node {info.get('Node')} could not be added as parameter\n", e)
@@ -1,5 +1,8 @@
 """Connection Manager for the LabOne Python API."""
 from collections.abc import MutableMapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+import json
 import typing as t
 
 from zhinst.toolkit.session import Devices as TKDevices
@@ -11,14 +14,97 @@ from zhinst.core import ziDAQServer
 
 import zhinst.qcodes.driver.devices as ZIDevices
 import zhinst.qcodes.driver.modules as ZIModules
+from zhinst.qcodes.latency import timed
 from zhinst.qcodes.qcodes_adaptions import (
+    _get_many,
     init_nodetree,
+    NodeDict,
+    run_async,
     tk_node_to_parameter,
     ZIParameter,
     ZIInstrument,
+    ZISnapshotHelper,
+    submit_snapshot,
 )
 
 
+class DeviceConnectionError(RuntimeError):
+    """Connecting to one or more devices failed.
+
+    Args:
+        devices: Mapping of the serials to the successfully connected devices.
+        errors: Mapping of the serials to the error of the failed devices.
+    """
+
+    def __init__(
+        self,
+        devices: t.Dict[str, ZIDevices.DeviceType],
+        errors: t.Dict[str, Exception],
+    ):
+        self.devices = devices
+        self.errors = errors
+        super().__init__(
+            "Failed to connect to the following devices:\n"
+            + "\n".join(f"{serial}: {error!r}" for serial, error in errors.items())
+        )
+
+
+def _discovered_interface(connection: ziDAQServer, serial: str, hf2: bool) -> str:
+    """Interface of a device from the discovery of the data server.
+
+    Same selection as ``zhinst.toolkit.Session.connect_device``, i.e. the
+    interface the device is connected through or 1GbE if available.
+
+    Args:
+        connection: Connection to the data server.
+        serial: Serial number of the device.
+        hf2: Flag if the data server is a HF2 Data Server.
+
+    Returns:
+        Device interface.
+    """
+    if hf2:
+        return "USB"
+    dev_info = json.loads(connection.getString("/zi/devices"))[serial.upper()]
+    interface = dev_info["INTERFACE"]
+    if interface == "none":
+        interfaces = dev_info["INTERFACES"]
+        interface = "1GbE" if "1GbE" in interfaces else interfaces.split(",")[0]
+    return interface
+
+
+class SetTransactionError(RuntimeError):
+    """The data server rejected the set of a session wide transaction.
+
+    The error of the data server names the rejected node. All nodes of the
+    transaction are kept, grouped by device.
+
+    Args:
+        transaction: Node value pairs of the transaction.
+        error: Error of the data server.
+    """
+
+    def __init__(self, transaction: t.List[t.Tuple[str, t.Any]], error: Exception):
+        self.error = error
+        self.nodes: t.Dict[str, t.Dict[str, t.Any]] = {}
+        for node, value in transaction:
+            self.nodes.setdefault(_serial(node), {})[node] = value
+        super().__init__(
+            f"The data server rejected the transaction: {error}\n"
+            "Nodes of the transaction:\n"
+            + "\n".join(
+                f"{serial}: {node} = {value!r}"
+                for serial, nodes in self.nodes.items()
+                for node, value in nodes.items()
+            )
+        )
+
+
+def _serial(node: str) -> str:
+    """Serial of the device (or ``zi``) a raw node path belongs to."""
+    return node.split("/")[1].lower()
+
+
 class Devices(MutableMapping):
     """Mapping class for the connected devices.
 
@@ -36,19 +122,16 @@ class Devices(MutableMapping):
         self._tk_devices = tk_devices
         self._session = session
         self._devices: t.Dict[str, ZIDevices.DeviceType] = {}
-        self._default_properties: t.Dict[
-            str, t.Tuple[t.Optional[str], t.Optional[bool]]
-        ] = {}
+        self._default_properties: t.Dict[str, t.Dict[str, t.Any]] = {}
 
     def __getitem__(self, key) -> ZIDevices.DeviceType:
         key = key.lower()
         if key in self.connected():
             if key not in self._devices:
                 tk_device = self._tk_devices[key]
-                name, raw = self._default_properties.get(key, (None, False))
                 self._devices[key] = ZIDevices.DEVICE_CLASS_BY_MODEL.get(
                     tk_device.__class__.__name__, ZIDevices.ZIBaseInstrument
-                )(tk_device, self._session, name=name, raw=raw)
+                )(tk_device, self._session, **self._default_properties.get(key, {}))
             return self._devices[key]
         raise KeyError(key)
 
@@ -69,7 +152,13 @@ class Devices(MutableMapping):
         return len(self.connected())
 
     def update_device_properties(
-        self, serial: str, name: t.Optional[str], raw: t.Optional[bool]
+        self,
+        serial: str,
+        name: t.Optional[str],
+        raw: t.Optional[bool],
+        lazy: t.Optional[bool] = None,
+        include: t.Optional[t.Sequence[str]] = None,
+        exclude: t.Optional[t.Sequence[str]] = None,
     ) -> None:
         """Update the properties for a device.
 
@@ -81,6 +170,12 @@ class Devices(MutableMapping):
             name: Optional name of the QCoDeS device object
             raw: Flag if qcodes instance should only created with the nodes and
                 not forwarding the toolkit functions. (default = False)
+            lazy: Flag if the QCoDeS parameters should only be created on their
+                first access. (default = False)
+            include: Glob patterns of the node paths that should be added as
+                parameters. (default = None)
+            exclude: Glob patterns of the node paths that should not be added
+                as parameters. (default = None)
 
         Raises:
             RuntimeError: If the device is already created
@@ -90,7 +185,24 @@ class Devices(MutableMapping):
                 f"The Qcodes Instance of {serial} already exists.\n"
                 "The device properties can therfor no longer be changed"
             )
-        self._default_properties[serial.lower()] = (name, raw)
+        self._default_properties[serial.lower()] = {
+            "name": name,
+            "raw": bool(raw),
+            "lazy": bool(lazy),
+            "include": include,
+            "exclude": exclude,
+        }
+
+    def created(self, serial: str) -> bool:
+        """Check if the QCoDeS object of a device is already created.
+
+        Args:
+            serial: Serial of the device (e.g. dev1234)
+
+        Returns:
+            Flag if the QCoDeS object of the device exists.
+        """
+        return serial.lower() in self._devices
 
     def connected(self) -> t.List[str]:
         """Get a list of devices connected to the data server.
@@ -577,6 +689,9 @@ class Session(ZIInstrument):
         interface: t.Optional[str] = None,
         name: t.Optional[str] = None,
         raw: t.Optional[bool] = None,
+        lazy: t.Optional[bool] = None,
+        include: t.Optional[t.Sequence[str]] = None,
+        exclude: t.Optional[t.Sequence[str]] = None,
     ) -> ZIDevices.DeviceType:
         """Establish a connection to a device.
 
@@ -595,15 +710,163 @@ class Session(ZIInstrument):
                 (default = "zi_{dev_type}_{serial}")
             raw: Flag if qcodes instance should only created with the nodes and
                 not forwarding the toolkit functions. (default = False)
+            lazy: Flag if the QCoDeS parameters should only be created on their
+                first access instead of during the connection. This speeds up
+                the creation of the device object considerably.
+                (default = False)
+            include: Glob patterns of the node paths that should be added as
+                parameters (e.g. ["/*/qachannels/*", "/*/system/*"]). If not
+                specified all nodes are added. (default = None)
+            exclude: Glob patterns of the node paths that should not be added
+                as parameters. Takes precedence over ``include``.
+                (default = None)
 
         Returns:
             Device object
         """
-        if name or raw is not None:
-            self._devices.update_device_properties(serial, name, raw)
+        if name or any(x is not None for x in (raw, lazy, include, exclude)):
+            self._devices.update_device_properties(
+                serial, name, raw, lazy, include, exclude
+            )
         self._tk_object.connect_device(serial, interface=interface)
         return self._devices[serial]
 
+    def connect_devices(
+        self,
+        serials: t.Iterable[str],
+        *,
+        interfaces: t.Optional[t.Union[str, t.Mapping[str, str]]] = None,
+        raw: t.Optional[bool] = None,
+        lazy: t.Optional[bool] = None,
+        include: t.Optional[t.Sequence[str]] = None,
+        exclude: t.Optional[t.Sequence[str]] = None,
+        max_workers: t.Optional[int] = None,
+    ) -> t.Dict[str, ZIDevices.DeviceType]:
+        """Establish a connection to multiple devices at once.
+
+        The data server connects to the devices in parallel. Every parallel
+        connection attempt uses a dedicated client connection, since the
+        connection of the session must not be shared between threads. The
+        toolkit and QCoDeS device objects (including the download of their
+        node trees) are created afterwards one after another in the calling
+        thread.
+
+        Info:
+            It is allowed to pass already connected devices. In that case the
+            existing device object is returned. ``raw``, ``lazy``, ``include``
+            and ``exclude`` only apply to devices whose QCoDeS object is
+            created by this call and are ignored for existing objects.
+
+        Args:
+            serials: Serial numbers of the devices, e.g. *['dev12000']*.
+            interfaces: Device interface for all devices (e.g. = "1GbE") or a
+                mapping of the serials to their interface. Devices without an
+                interface use the default interface from the discover.
+            raw: Flag if qcodes instances should only created with the nodes
+                and not forwarding the toolkit functions. (default = False)
+            lazy: Flag if the QCoDeS parameters should only be created on their
+                first access instead of during the connection.
+                (default = False)
+            include: Glob patterns of the node paths that should be added as
+                parameters. (default = None)
+            exclude: Glob patterns of the node paths that should not be added
+                as parameters. (default = None)
+            max_workers: Maximal number of devices that are connected in
+                parallel. (default = number of devices)
+
+        Returns:
+            Mapping of the serials to the device objects.
+
+        Raises:
+            DeviceConnectionError: If the connection to at least one device
+                failed. The error holds the successfully connected devices and
+                the error for each failed device.
+        """
+        serials = list(dict.fromkeys(serial.lower() for serial in serials))
+        if interfaces is None or isinstance(interfaces, str):
+            interface_map = dict.fromkeys(serials, interfaces)
+        else:
+            interface_map = {
+                serial.lower(): interface for serial, interface in interfaces.items()
+            }
+        errors: t.Dict[str, Exception] = {}
+        if any(x is not None for x in (raw, lazy, include, exclude)):
+            for serial in serials:
+                if not self._devices.created(serial):
+                    self._devices.update_device_properties(
+                        serial, None, raw, lazy, include, exclude
+                    )
+
+        daq_server = self.daq_server
+        is_hf2_server = self.is_hf2_server
+
+        def connect(serial: str) -> str:
+            connection = ziDAQServer(
+                daq_server.host, daq_server.port, getattr(daq_server, "api_level", 6)
+            )
+            try:
+                interface = interface_map.get(serial)
+                if not interface:
+                    interface = _discovered_interface(connection, serial, is_hf2_server)
+                connection.connectDevice(serial, interface)  # type: ignore[arg-type]
+                return interface
+            finally:
+                connection.disconnect()
+
+        futures = {}
+        if serials:
+            with ThreadPoolExecutor(max_workers=max_workers or len(serials)) as pool:
+                futures = {serial: pool.submit(connect, serial) for serial in serials}
+        devices = {}
+        for serial, future in futures.items():
+            try:
+                self._tk_object.connect_device(serial, interface=future.result())
+                devices[serial] = self._devices[serial]
+            except Exception as error:
+                errors[serial] = error
+        if errors:
+            raise DeviceConnectionError(devices, errors)
+        return devices
+
+    def reconnect_device(
+        self, serial: str, *, interface: t.Optional[str] = None
+    ) -> ZIDevices.DeviceType:
+        """Reconnect to a device and keep its existing QCoDeS object.
+
+        Useful after a restart of the data server or a disconnect of the
+        device. The existing parameters are bound to the newly connected
+        device. Only if the node tree or the firmware revision of the device
+        changed, the QCoDeS object is recreated with the same class,
+        construction arguments and snapshot and write settings.
+
+        Args:
+            serial: Serial number of the device, e.g. *'dev12000'*.
+            interface: Device interface (e.g. = "1GbE"). If not specified
+                the default interface from the discover is used.
+
+        Returns:
+            Device object
+        """
+        serial = serial.lower()
+        device = self._devices._devices.get(serial)
+        del self._tk_object.devices[serial]
+        tk_device = self._tk_object.connect_device(serial, interface=interface)
+        if device is None or device._rebind(tk_device):
+            return self._devices[serial]
+        init_kwargs = device._init_kwargs
+        settings = {
+            "snapshot_ttl": device.snapshot_ttl,
+            "incremental_snapshot": device.incremental_snapshot,
+            "suppress_redundant_writes": device.suppress_redundant_writes,
+        }
+        device.close()
+        del self._devices[serial]
+        new_device = type(device)(tk_device, self, **init_kwargs)
+        for setting, value in settings.items():
+            setattr(new_device, setting, value)
+        self._devices._devices[serial] = new_device
+        return new_device
+
     def disconnect_device(self, serial: str) -> None:
         """Disconnect a device.
 
@@ -641,6 +904,43 @@ class Session(ZIInstrument):
         """
         self._tk_object.sync()
 
+    @contextmanager
+    def set_transaction(self):
+        """Context manager for a transactional set across all devices.
+
+        Wraps the session wide transaction of zhinst-toolkit
+        (``zhinst.toolkit.Session.set_transaction``). Within the with block
+        the set commands to the parameters of the session and of all devices,
+        including devices created within the block, are buffered and sent as
+        a single transactional set at the end. (All other operations, e.g.
+        getting the value of a node, will not be affected)
+
+        Warning:
+            The set is always performed as deep set if called on device nodes.
+
+        Raises:
+            SetTransactionError: If the data server rejected the set. The
+                error holds the nodes and values of the transaction for each
+                device.
+
+        Examples:
+            >>> with session.set_transaction():
+            ...     shfqc.system.clocks.referenceclock.in_.source(1)
+            ...     hdawg.system.clocks.referenceclock.source(2)
+        """
+        transaction: t.List[t.Tuple[str, t.Any]] = []
+        try:
+            with self._tk_object.set_transaction():
+                yield
+                transaction = list(self._tk_object.multi_transaction.result() or [])
+        except RuntimeError as error:
+            if not transaction:
+                raise
+            raise SetTransactionError(transaction, error) from error
+        finally:
+            for instrument in [self, *self._devices._devices.values()]:
+                instrument._snapshot_cache.invalidate()
+
     def poll(
         self,
         recording_time: float = 0.1,
@@ -668,17 +968,207 @@ class Session(ZIInstrument):
             Polled data in a dictionary. The key is a `Node` object and the
             value is a dictionary with the raw data from the device
         """
-        polled_data_tk = self._tk_object.poll(
-            recording_time=recording_time, timeout=timeout, flags=flags
+        polled_data_tk = timed(
+            self._latency_stats,
+            "poll",
+            self.name,
+            self._tk_object.poll,
+            recording_time=recording_time,
+            timeout=timeout,
+            flags=flags,
         )
         polled_data = {}
-        for tk_node, data in polled_data_tk.items():
-            tk_node = self._tk_object.raw_path_to_node(tk_node)
-            device = self.devices[tk_node.root.prefix_hide]
-            parameter = tk_node_to_parameter(device, tk_node)
+        devices: t.Dict[str, ZIDevices.DeviceType] = {}
+        observed: t.Dict[str, t.Dict[str, t.Any]] = {}
+        for raw_path, data in polled_data_tk.items():
+            raw_path = raw_path.lower()
+            serial = raw_path.split("/")[1]
+            if serial not in devices:
+                devices[serial] = self.devices[serial]
+            parameter = devices[serial].parameter_index.get(raw_path)
+            if parameter is None:
+                parameter = tk_node_to_parameter(
+                    devices[serial], self._tk_object.raw_path_to_node(raw_path)
+                )
             polled_data[parameter] = data
+            if devices[serial]._write_cache.enabled and isinstance(data, dict):
+                values = data.get("value")
+                if values is not None and len(values):
+                    observed.setdefault(serial, {})[raw_path] = values[-1]
+        # Values that differ from the last set ones were changed by others
+        for serial, values in observed.items():
+            devices[serial]._write_cache.observe(values)
         return polled_data
 
+    def get_many(
+        self, params_or_paths: t.Iterable[t.Union[ZIParameter, str]]
+    ) -> NodeDict:
+        """Get the values of parameters of multiple devices with a single command.
+
+        The caches of all parameters are updated with a common timestamp.
+
+        Args:
+            params_or_paths: Parameters or absolute node paths of the
+                parameters of the session and its devices. Node paths without
+                leading slash are relative to the session.
+
+        Returns:
+            Values of the parameters that can be accessed with both the
+            parameters and their lowercase absolute node paths.
+
+        Raises:
+            KeyError: If a node path does not match a parameter or the data
+                server did not return a value for it.
+        """
+        prefix = self._snapshot_cache._nodetree.prefix_hide
+        parameters = []
+        for item in params_or_paths:
+            if isinstance(item, str) and item.startswith("/"):
+                serial = item.split("/")[1].lower()
+                if serial != prefix:
+                    parameters.append(self.devices[serial]._zi_parameter(item))
+                    continue
+            parameters.append(self._zi_parameter(item))
+        return _get_many(self._tk_object.daq_server, parameters)
+
+    async def poll_async(
+        self,
+        recording_time: float = 0.1,
+        timeout: float = 0.5,
+        flags: PollFlags = PollFlags.DEFAULT,
+    ) -> t.Dict[ZIParameter, t.Dict[str, t.Any]]:
+        """Polls all subscribed data without blocking the event loop.
+
+        Asynchronous version of ``poll``. The poll is executed in order with
+        the other asynchronous operations of the session (see
+        ``zhinst.qcodes.qcodes_adaptions.run_async``).
+
+        Args:
+            recording_time: defines the duration of the poll. (default = 0.1)
+            timeout: Adds an additional timeout in seconds on top of
+                `recording_time`. (default = 0.5)
+            flags: Flags for the polling (see :class `PollFlags`:)
+
+        Returns:
+            Polled data in a dictionary. The key is a `Node` object and the
+            value is a dictionary with the raw data from the device
+        """
+        return await run_async(
+            self, self.poll, recording_time=recording_time, timeout=timeout, flags=flags
+        )
+
+    @contextmanager
+    def shared_snapshot(self, batch_size: t.Optional[int] = None):
+        """Context manager for a snapshot of all devices at once.
+
+        Gets the nodes of the session and of all created device objects with
+        a single command when entering the context. All snapshots of these
+        devices within the context (e.g. from a QCoDeS station) use the
+        fetched values instead of getting them from the data server again.
+
+        Args:
+            batch_size: Maximum number of devices per get command. If not
+                specified all devices are fetched with a single command.
+                (default = None)
+
+        Examples:
+            >>> with session.shared_snapshot():
+            ...     snapshot = station.snapshot()
+        """
+        instruments = [self, *self._devices._devices.values()]
+        with ZISnapshotHelper.shared_snapshot(
+            [instrument._snapshot_cache for instrument in instruments],
+            self._tk_object.daq_server,
+            batch_size=batch_size,
+        ):
+            yield
+
+    def snapshot_all_async(
+        self, batch_size: t.Optional[int] = None
+    ) -> "Future[t.Dict[str, dict]]":
+        """Take a snapshot of the session and all devices in the background.
+
+        The snapshot is taken on the background snapshot thread (see
+        ``ZIInstrument.snapshot_async``). The values of all devices originate
+        from a single get command (see ``shared_snapshot``), i.e. they match
+        the time at which this command was issued.
+
+        Args:
+            batch_size: Maximum number of devices per get command. If not
+                specified all devices are fetched with a single command.
+                (default = None)
+
+        Returns:
+            Future that resolves to the snapshot of every instrument by name.
+        """
+
+        def snapshot_all() -> t.Dict[str, dict]:
+            instruments = [self, *self._devices._devices.values()]
+            with self.shared_snapshot(batch_size=batch_size):
+                return {
+                    instrument.name: instrument.snapshot() for instrument in instruments
+                }
+
+        return submit_snapshot(snapshot_all)
+
+    def write_readable_snapshot_all(
+        self,
+        file: t.TextIO,
+        max_chars: int = 80,
+        batch_size: t.Optional[int] = None,
+    ) -> None:
+        """Write the readable snapshot of the session and all devices into a file.
+
+        The values of all devices are fetched with a single get command (see
+        ``shared_snapshot``) and the lines are written while they are
+        generated (see ``ZIInstrument.readable_snapshot``).
+
+        Args:
+            file: Text file handle (e.g. ``sys.stdout``).
+            max_chars: the maximum number of characters per line.
+            batch_size: Maximum number of devices per get command. If not
+                specified all devices are fetched with a single command.
+                (default = None)
+        """
+        instruments = [self, *self._devices._devices.values()]
+        with self.shared_snapshot(batch_size=batch_size):
+            for instrument in instruments:
+                instrument.write_readable_snapshot(file, max_chars=max_chars)
+
+    def latency_stats(self) -> t.Dict[str, t.Dict[str, t.Dict[str, float]]]:
+        """Latency statistics of the node operations.
+
+        Only contains the operations of the session, its devices and modules
+        recorded while ``latency_tracking`` was enabled. Gets and sets are
+        recorded by lowercase node path, polls by the name of the session and
+        module reads by the name of the module.
+
+        Returns:
+            Statistics by node path and operation (``get``, ``set``, ``poll``
+            or ``read``). The statistics consist of the number of calls
+            (``count``) and the ``mean``, ``p50``, ``p95``, ``p99`` and ``max``
+            duration in seconds.
+        """
+        return self._latency_stats.summary()
+
+    def reset_latency_stats(self) -> None:
+        """Remove all recorded latency statistics of the session."""
+        self._latency_stats.reset()
+
+    @property
+    def latency_tracking(self) -> bool:
+        """Flag if the latency of the node operations is recorded.
+
+        The latency statistics are disabled by default. Every session has its
+        own statistics, which include the operations of its devices and
+        modules (see ``latency_stats``).
+        """
+        return self._latency_stats.enabled
+
+    @latency_tracking.setter
+    def latency_tracking(self, value: bool) -> None:
+        self._latency_stats.enabled = value
+
     @property
     def devices(self) -> Devices:
         """Mapping for the connected devices."""
@@ -0,0 +1,175 @@
+"""Compact column-wise serialization of QCoDeS snapshots.
+
+A snapshot of a ZI instrument consists mostly of parameter entries with the
+same keys. The encoder splits the snapshot into its structure without the
+parameters and one column per parameter key (e.g. the paths, values and
+timestamps of the parameters). Columns with repeated entries are stored as a
+table of the unique entries and their indices. The result is compressed, which
+makes it a lot smaller than the JSON encoded snapshot.
+"""
+import json
+import typing as t
+import zlib
+
+from qcodes.utils.helpers import NumpyJSONEncoder
+
+# Identifier and format version of the encoded snapshots.
+_MAGIC = b"ZISNAP1\n"
+# Placeholder for an entry that is missing in a parameter.
+_MISSING = object()
+
+
+def _split_snapshot(
+    snapshot: dict, parameters: t.List[t.Tuple[str, str, dict]], prefix: str = ""
+) -> dict:
+    """Copy the structure of a snapshot without its parameters.
+
+    Args:
+        snapshot: Snapshot of an instrument, submodule or channel list.
+        parameters: List to which the parent path, name and snapshot of every
+            parameter is appended.
+        prefix: Path of the snapshot within the full snapshot.
+
+    Returns:
+        Snapshot without parameters.
+    """
+    structure = dict(snapshot)
+    if "parameters" in snapshot:
+        parent = prefix + "parameters"
+        for name, parameter in snapshot["parameters"].items():
+            parameters.append((parent, name, parameter))
+        structure["parameters"] = {}
+    for key in ("submodules", "channels"):
+        if key in snapshot:
+            structure[key] = {
+                name: _split_snapshot(submodule, parameters, f"{prefix}{key}/{name}/")
+                for name, submodule in snapshot[key].items()
+            }
+    return structure
+
+
+def _encode_column(entries: t.List[t.Any]) -> dict:
+    """Encode the entries of a column.
+
+    Args:
+        entries: Entries of the column. Missing entries are ``_MISSING``.
+
+    Returns:
+        Table of the unique entries and their indices, or the plain entries
+        if there are no missing entries and only few repetitions.
+    """
+    # The type is part of the key to keep e.g. 1 and 1.0 apart
+    lookup: t.Dict[t.Tuple[type, t.Any], int] = {}
+    try:
+        indices = [
+            lookup.setdefault((entry.__class__, entry), len(lookup))
+            for entry in entries
+        ]
+        uniques = [entry for _, entry in lookup]
+    except TypeError:
+        # unhashable entries (e.g. dictionaries) are not deduplicated
+        uniques = [entry for entry in entries if entry is not _MISSING]
+        position = iter(range(len(uniques)))
+        indices = [
+            len(uniques) if entry is _MISSING else next(position) for entry in entries
+        ]
+        if len(uniques) < len(entries):
+            uniques.append(_MISSING)
+    missing = next((i for i, entry in enumerate(uniques) if entry is _MISSING), None)
+    if missing is None and len(uniques) * 2 > len(entries):
+        return {"entries": entries}
+    column: t.Dict[str, t.Any] = {"uniques": uniques, "indices": indices}
+    if missing is not None:
+        uniques[missing] = None
+        column["missing"] = missing
+    return column
+
+
+def _decode_column(column: dict) -> t.List[t.Any]:
+    """Decode the entries of a column (see ``_encode_column``)."""
+    if "entries" in column:
+        return column["entries"]
+    uniques = column["uniques"]
+    if "missing" in column:
+        uniques[column["missing"]] = _MISSING
+    return [uniques[index] for index in column["indices"]]
+
+
+def encode_snapshot(snapshot: dict, level: int = 6) -> bytes:
+    """Encode a snapshot into the compact column-wise format.
+
+    Args:
+        snapshot: Snapshot of an instrument (e.g. from
+            ``ZIInstrument.snapshot``).
+        level: zlib compression level. (default = 6)
+
+    Returns:
+        Encoded snapshot.
+    """
+    parameters: t.List[t.Tuple[str, str, dict]] = []
+    structure = _split_snapshot(snapshot, parameters)
+    keys: t.Dict[str, None] = {}
+    for _, _, parameter in parameters:
+        keys.update(dict.fromkeys(parameter))
+    columns = {
+        key: _encode_column(
+            [parameter.get(key, _MISSING) for _, _, parameter in parameters]
+        )
+        for key in keys
+    }
+    encoded = json.dumps(
+        {
+            "structure": structure,
+            "parents": _encode_column([parent for parent, _, _ in parameters]),
+            "names": _encode_column([name for _, name, _ in parameters]),
+            "columns": columns,
+        },
+        cls=NumpyJSONEncoder,
+        separators=(",", ":"),
+    )
+    return _MAGIC + zlib.compress(encoded.encode("utf-8"), level)
+
+
+def decode_snapshot(data: bytes) -> dict:
+    """Decode a snapshot of the compact column-wise format.
+
+    Args:
+        data: Encoded snapshot (see ``encode_snapshot``).
+
+    Returns:
+        Snapshot as it would be returned by decoding the JSON encoded
+        snapshot.
+
+    Raises:
+        ValueError: If the data is not an encoded snapshot.
+    """
+    if not data.startswith(_MAGIC):
+        raise ValueError("Data is not an encoded snapshot.")
+    payload = data.partition(b"\n")[2]
+    decoded = json.loads(zlib.decompress(payload).decode("utf-8"))
+    snapshot = decoded["structure"]
+    columns = {
+        key: _decode_column(column) for key, column in decoded["columns"].items()
+    }
+    # Keys that are present in every parameter are set without checks
+    dense = [key for key, column in columns.items() if _MISSING not in column]
+    sparse = [key for key in columns if key not in dense]
+    parents = _decode_column(decoded["parents"])
+    names = _decode_column(decoded["names"])
+    layers: t.Dict[str, dict] = {}
+    for i, (parent, name, *row) in enumerate(
+        zip(parents, names, *(columns[key] for key in dense))
+    ):
+        layer = layers.get(parent)
+        if layer is None:
+            layer = snapshot
+            for key in parent.split("/"):
+                layer = layer[key]
+            layers[parent] = layer
+        parameter = dict(zip(dense, row))
+        for key in sparse:
+            entry = columns[key][i]
+            if entry is not _MISSING:
+                parameter[key] = entry
+        layer[name] = parameter
+    return snapshot
@@ -1,7 +1,9 @@
 import pytest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 from pathlib import Path
+from zhinst.toolkit.nodetree import NodeTree
 from zhinst.qcodes import ZISession
+from zhinst.qcodes.qcodes_adaptions import init_nodetree, ZIChannelList, ZIInstrument
 
 
 @pytest.fixture()
@@ -21,4 +23,74 @@ def session(data_dir, mock_connection):
     with json_path.open("r", encoding="UTF-8") as file:
         nodes_json = file.read()
     mock_connection.return_value.listNodesJSON.return_value = nodes_json
-    yield ZISession("localhost")
+    session = ZISession("localhost")
+    yield session
+    session.close()
+
+
+NODES = [
+    "/dev1234/demods/0/rate",
+    "/dev1234/demods/0/sample",
+    "/dev1234/demods/1/rate",
+    "/dev1234/sigouts/0/enables/0",
+    "/dev1234/sigouts/0/enables/3",
+    "/dev1234/sigouts/0/on",
+    "/dev1234/system/fwrevision",
+    "/dev1234/system/impedance/calib/tamp0",
+    "/dev1234/stats/physical/voltages/2",
+    "/dev1234/features/devtype",
+]
+
+
+def node_info(node):
+    return {
+        "Node": node.upper(),
+        "Description": f"Description of {node}",
+        "Properties": "Read, Write, Setting",
+        "Type": "Double",
+        "Unit": "V",
+    }
+
+
+@pytest.fixture()
+def nodetree():
+    connection = MagicMock()
+    yield NodeTree(
+        connection,
+        prefix_hide="dev1234",
+        preloaded_json={node: node_info(node) for node in NODES},
+    )
+
+
+def tree_structure(layer, prefix=""):
+    structure = {}
+    for name, parameter in layer.parameters.items():
+        structure[prefix + name] = (
+            type(parameter),
+            getattr(parameter, "zi_node", None),
+        )
+    for name, submodule in layer.submodules.items():
+        if isinstance(submodule, ZIChannelList):
+            structure[prefix + name] = (type(submodule), submodule._zi_node)
+            for i, item in enumerate(submodule):
+                structure[f"{prefix}{name}[{i}]"] = (type(item), item._zi_node)
+                structure.update(tree_structure(item, f"{prefix}{name}[{i}]."))
+        else:
+            structure[prefix + name] = (type(submodule), submodule._zi_node)
+            structure.update(tree_structure(submodule, f"{prefix}{name}."))
+    return structure
+
+
+@pytest.fixture()
+def create_instrument():
+    instruments = []
+
+    def create(name, nodetree, **kwargs):
+        instrument = ZIInstrument(name, nodetree)
+        instruments.append(instrument)
+        init_nodetree(instrument, nodetree, instrument._snapshot_cache, **kwargs)
+        return instrument
+
+    yield create
+    for instrument in instruments:
+        instrument.close()
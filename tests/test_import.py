@@ -0,0 +1,42 @@
+import subprocess
+import sys
+
+import zhinst.qcodes
+
+HEAVY_MODULES = [
+    "qcodes",
+    "zhinst.toolkit",
+    "zhinst.qcodes.session",
+    "zhinst.qcodes.device_creator",
+]
+# Packages of which no module may be imported by ``import zhinst.qcodes``.
+HEAVY_PACKAGES = [
+    "zhinst.qcodes.driver",
+    "zhinst.toolkit.driver.devices",
+]
+
+
+def imported_modules():
+    code = "import sys\nimport zhinst.qcodes\nprint(','.join(sorted(sys.modules)))\n"
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    return output.strip().split(",")
+
+
+def test_cold_import():
+    modules = imported_modules()
+    assert not set(HEAVY_MODULES) & set(modules)
+    prefixes = tuple(package + "." for package in HEAVY_PACKAGES)
+    assert not [module for module in modules if (module + ".").startswith(prefixes)]
+
+
+def test_lazy_attributes():
+    from zhinst.qcodes import device_creator
+    from zhinst.toolkit import PollFlags
+
+    assert zhinst.qcodes.HDAWG is device_creator.HDAWG
+    assert zhinst.qcodes.PollFlags is PollFlags
+    for name in zhinst.qcodes.__all__:
+        assert getattr(zhinst.qcodes, name)
+    assert set(zhinst.qcodes.__all__) <= set(dir(zhinst.qcodes))
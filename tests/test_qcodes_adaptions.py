@@ -0,0 +1,718 @@
+import asyncio
+import io
+import itertools
+import threading
+import time
+import pytest
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from fixtures import NODES, nodetree, create_instrument, node_info, tree_structure
+from zhinst.toolkit.nodetree import NodeTree
+
+from zhinst.qcodes import qcodes_adaptions
+from zhinst.qcodes.qcodes_adaptions import (
+    _OrderedExecutor,
+    invalidate_caches,
+    rebind_nodetree,
+    rebuild_snapshot,
+    tk_node_to_parameter,
+    ZIParameter,
+    ZISnapshotHelper,
+)
+
+
+class TestLazyNodetree:
+    def test_same_tree(self, nodetree, create_instrument):
+        eager = create_instrument("eager_same", nodetree)
+        lazy = create_instrument("lazy_same", nodetree, lazy=True)
+        assert tree_structure(lazy) == tree_structure(eager)
+
+    def test_created_on_access(self, nodetree, create_instrument):
+        lazy = create_instrument("lazy_access", nodetree, lazy=True)
+        assert "_zi_pending" in lazy.__dict__
+        parameter = lazy.demods[1].rate
+        assert isinstance(parameter, ZIParameter)
+        assert parameter.zi_node == "/DEV1234/DEMODS/1/RATE"
+        assert "_zi_pending" not in lazy.__dict__
+        assert "_zi_pending" in lazy.sigouts[0].__dict__
+        assert "_zi_pending" in lazy.system.__dict__
+
+    def test_snapshot(self, nodetree, create_instrument):
+        nodetree.connection.get.return_value = {}
+        lazy = create_instrument("lazy_snapshot", nodetree, lazy=True)
+        snapshot = lazy.snapshot(update=False)
+        assert (
+            "rate"
+            in snapshot["submodules"]["demods"]["channels"]["lazy_snapshot_demods0"][
+                "parameters"
+            ]
+        )
+
+    def test_concurrent_first_access(self, nodetree, create_instrument):
+        lazy = create_instrument("lazy_threads", nodetree, lazy=True)
+        add_parameter = qcodes_adaptions._add_parameter
+
+        def slow_add_parameter(*args, **kwargs):
+            time.sleep(0.05)
+            add_parameter(*args, **kwargs)
+
+        with patch.object(qcodes_adaptions, "_add_parameter", slow_add_parameter):
+            with ThreadPoolExecutor(4) as executor:
+                futures = [
+                    executor.submit(lambda: lazy.demods[0].sample) for _ in range(4)
+                ]
+                parameters = [future.result(timeout=10) for future in futures]
+        assert all(parameter is parameters[0] for parameter in parameters)
+        assert list(lazy.demods[0].parameters) == ["rate", "sample"]
+
+
+class TestSharedMetadata:
+    def test_shared_between_instruments(self, nodetree, create_instrument):
+        metadata_table = {}
+        first = create_instrument(
+            "shared_first", nodetree, metadata_table=metadata_table
+        )
+        second = create_instrument(
+            "shared_second", nodetree, metadata_table=metadata_table
+        )
+        assert len(metadata_table) == len(NODES)
+        first_rate, second_rate = first.demods[0].rate, second.demods[0].rate
+        assert first_rate._metadata is second_rate._metadata
+        assert first_rate.unit is second_rate.unit
+        first_rate.unit = "mV"
+        assert first_rate.unit == "mV"
+        assert second_rate.unit == "V"
+
+    def test_changed_node_info(self, nodetree, create_instrument):
+        metadata_table = {}
+        first = create_instrument(
+            "changed_first", nodetree, metadata_table=metadata_table
+        )
+        nodetree.raw_dict["/dev1234/demods/0/rate"]["Unit"] = "Hz"
+        second = create_instrument(
+            "changed_second", nodetree, metadata_table=metadata_table
+        )
+        assert len(metadata_table) == len(NODES) + 1
+        assert first.demods[0].rate.unit == "V"
+        assert second.demods[0].rate.unit == "Hz"
+        assert first.demods[1].rate._metadata is second.demods[1].rate._metadata
+
+    def test_docstring(self, nodetree, create_instrument):
+        instrument = create_instrument("shared_doc", nodetree)
+        docstring = instrument.demods[0].rate.__doc__
+        assert docstring.startswith("Description of /dev1234/demods/0/rate")
+        assert "* `name` rate" in docstring
+        assert "* `unit` V" in docstring
+
+
+class TestParameterIndex:
+    def test_filled(self, nodetree, create_instrument):
+        instrument = create_instrument("index_filled", nodetree)
+        index = instrument.parameter_index
+        assert len(index) == len(NODES)
+        parameter = index["/dev1234/demods/1/rate"]
+        assert parameter is instrument.demods[1].rate
+        assert index.path(parameter) == "/dev1234/demods/1/rate"
+        assert tk_node_to_parameter(instrument, nodetree.demods[1].rate) is parameter
+
+    def test_lazy(self, nodetree, create_instrument):
+        instrument = create_instrument("index_lazy", nodetree, lazy=True)
+        assert len(instrument.parameter_index) == 0
+        parameter = tk_node_to_parameter(instrument, nodetree.sigouts[0].on)
+        assert parameter is instrument.sigouts[0].on
+        assert instrument.parameter_index["/dev1234/sigouts/0/on"] is parameter
+
+    def test_channel_list_sync(self, nodetree, create_instrument):
+        instrument = create_instrument("index_sync", nodetree)
+        demod = instrument.demods[1]
+        instrument.demods.remove(demod)
+        assert "/dev1234/demods/1/rate" not in instrument.parameter_index
+        instrument.demods.append(demod)
+        assert instrument.parameter_index["/dev1234/demods/1/rate"] is demod.rate
+
+
+class TestNodeFilter:
+    def test_include_exclude(self, nodetree, create_instrument):
+        instrument = create_instrument(
+            "filter",
+            nodetree,
+            include=["/*/DEMODS/*", "/*/system/*"],
+            exclude=["/*/demods/*/sample"],
+        )
+        assert sorted(instrument.parameter_index) == [
+            "/dev1234/demods/0/rate",
+            "/dev1234/demods/1/rate",
+            "/dev1234/system/fwrevision",
+            "/dev1234/system/impedance/calib/tamp0",
+        ]
+        assert "sigouts" not in instrument.submodules
+
+
+class TestRebindNodetree:
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_rebind(self, nodetree, lazy, create_instrument):
+        instrument = create_instrument(f"rebind_{lazy}", nodetree, lazy=lazy)
+        parameter = instrument.demods[0].rate
+        new_nodetree = NodeTree(
+            MagicMock(),
+            prefix_hide="dev1234",
+            preloaded_json={node: node_info(node) for node in NODES},
+        )
+        rebind_nodetree(instrument, SimpleNamespace(root=new_nodetree))
+        assert instrument.demods[0].rate is parameter
+        assert parameter.tk_node.root is new_nodetree
+        assert instrument.sigouts[0].on.tk_node.root is new_nodetree
+        assert instrument._snapshot_cache._nodetree is new_nodetree
+        new_nodetree.connection.getDouble.return_value = 2.0
+        assert parameter() == 2.0
+        nodetree.connection.getDouble.assert_not_called()
+
+
+class TestIncrementalSnapshot:
+    @staticmethod
+    def rate(snapshot):
+        demods = snapshot["submodules"]["demods"]["channels"]
+        return demods["incremental_demods0"]["parameters"]["rate"]["value"]
+
+    def test_mirror(self, nodetree, create_instrument):
+        instrument = create_instrument("incremental", nodetree)
+        nodetree.connection.get.side_effect = lambda *args, **kwargs: {
+            "/dev1234/demods/0/rate": {"timestamp": [1], "value": [10.0]}
+        }
+        with patch("zhinst.qcodes.qcodes_adaptions.ziDAQServer") as server:
+            instrument.incremental_snapshot = True
+        mirror = server.return_value
+        assert "/dev1234/demods/0/rate" in mirror.subscribe.call_args[0][0]
+
+        mirror.poll.return_value = {}
+        assert self.rate(instrument.snapshot()) == 10.0
+
+        mirror.poll.return_value = {
+            "/dev1234/demods/0/rate": {"timestamp": [2, 3], "value": [11.0, 12.0]}
+        }
+        assert self.rate(instrument.snapshot()) == 12.0
+        assert nodetree.connection.get.call_count == 1
+
+        mirror.poll.side_effect = EOFError
+        assert self.rate(instrument.snapshot()) == 10.0
+        assert nodetree.connection.get.call_count == 2
+
+        instrument.incremental_snapshot = False
+        mirror.unsubscribe.assert_called_once_with("*")
+        mirror.disconnect.assert_called_once()
+
+        with patch("zhinst.qcodes.qcodes_adaptions.ziDAQServer") as server:
+            instrument.incremental_snapshot = True
+        instrument.close()
+        server.return_value.disconnect.assert_called_once()
+
+
+class TestSnapshotTTL:
+    def test_reuse(self, nodetree, create_instrument):
+        instrument = create_instrument("snapshot_ttl", nodetree)
+        nodetree.connection.get.return_value = {}
+        cache = instrument._snapshot_cache
+        instrument.snapshot()
+        instrument.snapshot()
+        assert nodetree.connection.get.call_count == 2
+        assert (cache.hits, cache.misses) == (0, 2)
+
+        instrument.snapshot_ttl = 60
+        instrument.snapshot()
+        instrument.snapshot()
+        instrument.demods[0].snapshot()
+        assert nodetree.connection.get.call_count == 2
+        assert (cache.hits, cache.misses) == (3, 2)
+
+        instrument.demods[0].rate(1)
+        instrument.snapshot()
+        assert nodetree.connection.get.call_count == 3
+        assert (cache.hits, cache.misses) == (3, 3)
+
+
+class TestSharedSnapshot:
+    def test_single_get(self, nodetree, create_instrument):
+        other_tree = NodeTree(
+            nodetree.connection,
+            prefix_hide="dev5678",
+            preloaded_json={
+                node: node_info(node)
+                for node in (node.replace("dev1234", "dev5678") for node in NODES)
+            },
+        )
+        first = create_instrument("shared_first", nodetree)
+        second = create_instrument("shared_second", other_tree)
+        connection = nodetree.connection
+        connection.get.return_value = {
+            "/dev1234/demods/0/rate": {"timestamp": [0], "value": [1.0]},
+            "/dev5678/demods/0/rate": {"timestamp": [0], "value": [2.0]},
+        }
+        with ZISnapshotHelper.shared_snapshot(
+            [first._snapshot_cache, second._snapshot_cache], connection
+        ):
+            first.snapshot()
+            second.snapshot()
+        connection.get.assert_called_once()
+        assert connection.get.call_args[0][0] == "/dev1234/*,/dev5678/*"
+        assert first.demods[0].rate.cache.get(get_if_invalid=False) == 1.0
+        assert second.demods[0].rate.cache.get(get_if_invalid=False) == 2.0
+        assert not first._snapshot_cache._is_running
+
+        connection.get.reset_mock()
+        with ZISnapshotHelper.shared_snapshot(
+            [first._snapshot_cache, second._snapshot_cache],
+            connection,
+            batch_size=1,
+        ):
+            pass
+        assert connection.get.call_count == 2
+
+
+class TestConvertValues:
+    def test_convert(self):
+        values = ZISnapshotHelper._convert_values(
+            {
+                "/DEV1234/demods/0/rate": {
+                    "timestamp": np.array([1], dtype=np.uint64),
+                    "value": np.array([1.5]),
+                },
+                "/dev1234/sigouts/0/on": np.array([1]),
+                "/dev1234/demods/0/sample": {"timestamp": [1], "value": [1 + 2j]},
+            }
+        )
+        assert values == {
+            "/dev1234/demods/0/rate": 1.5,
+            "/dev1234/sigouts/0/on": 1,
+            "/dev1234/demods/0/sample": "(1+2j)",
+        }
+        assert type(values["/dev1234/demods/0/rate"]) is float
+
+
+class TestSnapshotAsync:
+    def test_point_in_time(self, nodetree, create_instrument):
+        instrument = create_instrument("snapshot_async", nodetree)
+        issued = []
+
+        def get(*args, **kwargs):
+            issued.append(datetime.now())
+            return {"/dev1234/demods/0/rate": {"timestamp": [0], "value": [3.0]}}
+
+        nodetree.connection.get.side_effect = get
+        future = instrument.snapshot_async()
+        snapshot = future.result(timeout=10)
+        assert snapshot["name"] == "snapshot_async"
+        rate = instrument.demods[0].rate
+        assert rate.cache.get(get_if_invalid=False) == 3.0
+        assert rate.cache.timestamp <= issued[0]
+        nodetree.connection.get.assert_called_once()
+
+    def test_concurrent_gets(self, nodetree, create_instrument):
+        instrument = create_instrument("snapshot_async_gets", nodetree)
+        nodetree.connection.get.return_value = {
+            "/dev1234/demods/0/rate": {"timestamp": [0], "value": [3.0]}
+        }
+        in_snapshot = threading.Event()
+        release = threading.Event()
+
+        def get_double(path):
+            if threading.current_thread() is threading.main_thread():
+                return 7.0
+            # fallback get of the snapshot for nodes without snapshot value
+            in_snapshot.set()
+            release.wait(10)
+            return 5.0
+
+        nodetree.connection.getDouble.side_effect = get_double
+        future = instrument.snapshot_async()
+        try:
+            assert in_snapshot.wait(10)
+            # gets of the measurement thread are not served by the snapshot
+            assert instrument.demods[0].rate() == 7.0
+            for parameter in instrument.parameter_index.values():
+                assert parameter(parse=False) == 7.0
+        finally:
+            release.set()
+        snapshot = future.result(timeout=10)
+        demods = snapshot["submodules"]["demods"]["channels"]
+        assert demods["snapshot_async_gets_demods0"]["parameters"]["rate"]["value"] == 3
+        assert demods["snapshot_async_gets_demods1"]["parameters"]["rate"]["value"] == 5
+
+
+class TestSnapshotDelta:
+    def test_chain(self, nodetree, create_instrument):
+        instrument = create_instrument("snapshot_delta", nodetree)
+        values = {
+            "/dev1234/demods/0/rate": 1.0,
+            "/dev1234/demods/1/rate": 2.0,
+            "/dev1234/sigouts/0/on": 1.0,
+        }
+        nodetree.connection.get.side_effect = lambda *args, **kwargs: {
+            path: {"timestamp": [0], "value": [value]} for path, value in values.items()
+        }
+        base = instrument.snapshot_delta()
+        values["/dev1234/demods/1/rate"] = 5.0
+        first = instrument.snapshot_delta(since=base["token"])
+        values["/dev1234/sigouts/0/on"] = 0.0
+        second = instrument.snapshot_delta(since=first["token"])
+
+        assert first["since"] == base["token"]
+        assert list(first["parameters"]) == [
+            "submodules/demods/channels/snapshot_delta_demods1/parameters/rate"
+        ]
+        assert list(second["parameters"]) == [
+            "submodules/sigouts/channels/snapshot_delta_sigouts0/parameters/on"
+        ]
+        full = rebuild_snapshot(base, [first, second])
+        channels = full["submodules"]["demods"]["channels"]
+        assert channels["snapshot_delta_demods0"]["parameters"]["rate"]["value"] == 1
+        assert channels["snapshot_delta_demods1"]["parameters"]["rate"]["value"] == 5
+        sigouts = full["submodules"]["sigouts"]["channels"]
+        assert sigouts["snapshot_delta_sigouts0"]["parameters"]["on"]["value"] == 0
+        assert "snapshot" in base and "parameters" not in base
+
+        with pytest.raises(ValueError):
+            rebuild_snapshot(base, [second])
+        with pytest.raises(KeyError):
+            instrument.snapshot_delta(since="unknown")
+
+
+class TestFilteredSnapshot:
+    def test_include_exclude(self, nodetree, capsys, create_instrument):
+        instrument = create_instrument("snapshot_filter", nodetree)
+        nodetree.connection.get.return_value = {
+            "/dev1234/demods/0/rate": {"timestamp": [0], "value": [1.0]},
+            "/dev1234/demods/1/rate": {"timestamp": [0], "value": [2.0]},
+            "/dev1234/sigouts/0/on": {"timestamp": [0], "value": [1.0]},
+            "/dev1234/sigouts/0/enables/0": {"timestamp": [0], "value": [0.0]},
+            "/dev1234/sigouts/0/enables/3": {"timestamp": [0], "value": [0.0]},
+        }
+        snapshot = instrument.snapshot(
+            include=["sigouts/*", "demods/*/rate"],
+            exclude=["sigouts/0/enables/*"],
+        )
+        nodetree.connection.get.assert_called_once()
+        nodetree.connection.getDouble.assert_not_called()
+        assert (
+            nodetree.connection.get.call_args[0][0]
+            == "/dev1234/demods/*,/dev1234/sigouts/*"
+        )
+        assert snapshot.keys() == instrument.snapshot(update=False).keys()
+        assert sorted(snapshot["submodules"]) == ["demods", "sigouts"]
+        sigout = snapshot["submodules"]["sigouts"]["channels"][
+            "snapshot_filter_sigouts0"
+        ]
+        assert list(sigout["parameters"]) == ["on"]
+        assert sigout["submodules"] == {}
+        demods = snapshot["submodules"]["demods"]["channels"]
+        assert demods["snapshot_filter_demods1"]["parameters"]["rate"]["value"] == 2
+        assert "sample" not in demods["snapshot_filter_demods0"]["parameters"]
+        assert snapshot["name"] == "snapshot_filter"
+
+        instrument.print_readable_snapshot(include=["demods/*/rate"])
+        output = capsys.readouterr().out
+        assert "snapshot_filter_demods1:" in output
+        assert "sigouts" not in output
+
+    def test_absolute_patterns(self, nodetree, create_instrument):
+        instrument = create_instrument("snapshot_absolute", nodetree)
+        nodetree.connection.get.return_value = {
+            "/dev1234/sigouts/0/on": {"timestamp": [0], "value": [1.0]},
+        }
+        snapshot = instrument.snapshot(include=["/*/sigouts/*", "/dev5678/demods/*"])
+        nodetree.connection.get.assert_called_once()
+        assert nodetree.connection.get.call_args[0][0] == "/dev1234/sigouts/*"
+        assert list(snapshot["submodules"]) == ["sigouts"]
+
+        nodetree.connection.get.reset_mock()
+        snapshot = instrument.snapshot(include=["/dev5678/*"])
+        nodetree.connection.get.assert_not_called()
+        assert snapshot["submodules"] == {}
+
+
+class TestReadableSnapshot:
+    def test_stream(self, nodetree, create_instrument):
+        instrument = create_instrument("snapshot_readable", nodetree)
+        nodetree.connection.get.return_value = {
+            node: {"timestamp": [0], "value": [1.0]} for node in NODES
+        }
+        lines = instrument.readable_snapshot()
+        assert next(lines) == "snapshot_readable:"
+        assert nodetree.connection.get.call_count == 1
+        # no snapshot context is held while the iteration is paused
+        assert not instrument._snapshot_cache.is_running
+        assert "\trate   :\t1 (V)" in list(lines)
+        assert nodetree.connection.get.call_count == 1
+        nodetree.connection.getDouble.assert_not_called()
+
+        file = io.StringIO()
+        instrument.write_readable_snapshot(file, include=["demods/*"])
+        assert nodetree.connection.get.call_count == 2
+        assert file.getvalue().splitlines()[:4] == [
+            "snapshot_readable_demods0:",
+            "\tparameter: value",
+            "\t" + "-" * 72,
+            "\trate   :\t1 (V)",
+        ]
+        assert "sigouts" not in file.getvalue()
+
+    def test_print_single_get(self, nodetree, capsys, create_instrument):
+        instrument = create_instrument("snapshot_print", nodetree)
+        nodetree.connection.get.return_value = {
+            node: {"timestamp": [0], "value": [1.0]} for node in NODES
+        }
+        instrument.print_readable_snapshot()
+        ZISnapshotHelper.print_readable_snapshot(instrument.demods[0], update=True)
+        assert nodetree.connection.get.call_count == 2
+        assert nodetree.connection.get.call_args[0][0] == "/dev1234/demods/0/*"
+        nodetree.connection.getDouble.assert_not_called()
+        assert "snapshot_print_demods0:" in capsys.readouterr().out
+
+
+class TestConcurrentSnapshot:
+    @staticmethod
+    def rate(snapshot):
+        demods = snapshot["submodules"]["demods"]["channels"]
+        return demods[f"{snapshot['name']}_demods0"]["parameters"]["rate"]["value"]
+
+    def test_shared_fetch(self, nodetree, create_instrument):
+        instrument = create_instrument("snapshot_concurrent", nodetree)
+        cache = instrument._snapshot_cache
+        release = threading.Event()
+
+        def get(*args, **kwargs):
+            release.wait(10)
+            return {node: {"timestamp": [0], "value": [5.0]} for node in NODES}
+
+        nodetree.connection.get.side_effect = get
+        with ThreadPoolExecutor(4) as executor:
+            futures = [executor.submit(instrument.snapshot) for _ in range(4)]
+            deadline = time.monotonic() + 10
+            while cache.hits < 3 and time.monotonic() < deadline:
+                time.sleep(0.001)
+            release.set()
+            snapshots = [future.result(timeout=10) for future in futures]
+        assert nodetree.connection.get.call_count == 1
+        assert [self.rate(snapshot) for snapshot in snapshots] == [5.0] * 4
+        assert (cache.hits, cache.misses) == (3, 1)
+
+    def test_stress(self, nodetree, create_instrument):
+        instrument = create_instrument("snapshot_stress", nodetree)
+        cache = instrument._snapshot_cache
+        counter = itertools.count()
+
+        def get(*args, **kwargs):
+            time.sleep(0.001)
+            value = float(next(counter))
+            return {node: {"timestamp": [0], "value": [value]} for node in NODES}
+
+        def worker():
+            rates = []
+            for i in range(20):
+                with cache.snapshot():
+                    # nested snapshots use the values of the outer one
+                    outer = self.rate(instrument.snapshot())
+                    assert self.rate(instrument.snapshot()) == outer
+                rates.append(outer)
+                if i % 5 == 0:
+                    cache.invalidate()
+            assert not cache.is_running
+            return rates
+
+        nodetree.connection.get.side_effect = get
+        instrument.snapshot_ttl = 60
+        with ThreadPoolExecutor(8) as executor:
+            futures = [executor.submit(worker) for _ in range(8)]
+            rates = [rate for future in futures for rate in future.result(60)]
+        fetched = nodetree.connection.get.call_count
+        assert set(rates) <= set(map(float, range(fetched)))
+        assert cache.hits + cache.misses == len(rates)
+        assert fetched == cache.misses < len(rates)
+        nodetree.connection.getDouble.assert_not_called()
+
+    def test_parameters_untouched(self, nodetree, create_instrument):
+        instrument = create_instrument("snapshot_untouched", nodetree)
+        # the snapshots fall back to a (slow) get of every parameter
+        nodetree.connection.get.return_value = {}
+
+        def get_double(path):
+            if threading.current_thread() is threading.main_thread():
+                return 7.0
+            time.sleep(0.001)
+            return 5.0
+
+        nodetree.connection.getDouble.side_effect = get_double
+        rate = instrument.demods[0].rate
+        stop = threading.Event()
+
+        def snapshots():
+            while not stop.is_set():
+                instrument.snapshot()
+
+        with ThreadPoolExecutor(4) as executor:
+            futures = [executor.submit(snapshots) for _ in range(4)]
+            try:
+                for _ in range(300):
+                    assert rate(parse=False) == 7.0
+            finally:
+                stop.set()
+            for future in futures:
+                future.result(timeout=10)
+        for parameter in instrument.parameter_index.values():
+            assert parameter(parse=False) == 7.0
+
+
+class TestGetMany:
+    def test_single_get(self, nodetree, create_instrument):
+        instrument = create_instrument("get_many", nodetree)
+        connection = nodetree.connection
+        connection.get.return_value = {
+            "/dev1234/demods/0/rate": {"timestamp": [0], "value": np.array([2.5])},
+            "/dev1234/sigouts/0/on": {"timestamp": [0], "value": np.array([1])},
+        }
+        rate = instrument.demods[0].rate
+        values = instrument.get_many([rate, "SIGOUTS/0/ON"])
+        connection.get.assert_called_once_with(
+            "/dev1234/demods/0/rate,/dev1234/sigouts/0/on",
+            settingsonly=False,
+            flat=True,
+        )
+        assert values[rate] == 2.5
+        assert values["/dev1234/sigouts/0/on"] == 1
+        assert type(values["/dev1234/sigouts/0/on"]) is int
+        on = instrument.sigouts[0].on
+        assert on.cache.get(get_if_invalid=False) == 1
+        assert on.cache.timestamp == rate.cache.timestamp
+
+        with pytest.raises(KeyError):
+            instrument.get_many(["demods/1/rate"])
+        with pytest.raises(KeyError):
+            instrument.get_many(["demods/0/unknown"])
+
+
+class TestSetIfChanged:
+    def test_suppress(self, nodetree, create_instrument):
+        instrument = create_instrument("set_if_changed", nodetree)
+        connection = nodetree.connection
+        rate = instrument.demods[0].rate
+        rate(5.0)
+        rate(5.0)
+        assert connection.set.call_count == 2
+        assert instrument.suppressed_writes == 0
+
+        instrument.suppress_redundant_writes = True
+        # only values acknowledged in a deep set are recorded
+        rate(5.0)
+        rate(5.0)
+        assert connection.set.call_count == 4
+        connection.syncSetDouble.return_value = 5.0
+        rate(5.0, deep=True)
+        rate(5.0)
+        rate(5)
+        assert connection.set.call_count == 4
+        assert instrument.suppressed_writes == 2
+
+        # external change observed in a snapshot
+        connection.get.return_value = {
+            "/dev1234/demods/0/rate": {"timestamp": [0], "value": [7.0]}
+        }
+        instrument.snapshot()
+        rate(5.0)
+        assert connection.set.call_count == 5
+
+        rate(5.0, deep=True)
+        instrument.invalidate_write_cache()
+        rate(5.0)
+        assert connection.set.call_count == 6
+        assert instrument.suppressed_writes == 2
+
+    def test_invalidate_caches(self, nodetree, create_instrument):
+        instrument = create_instrument("set_if_changed_invalidate", nodetree)
+        connection = nodetree.connection
+        connection.syncSetDouble.return_value = 5.0
+        instrument.suppress_redundant_writes = True
+        rate = instrument.demods[0].rate
+        rate(5.0, deep=True)
+        # e.g. called by a toolkit function of a submodule
+        invalidate_caches(instrument.demods[0])
+        rate(5.0)
+        assert connection.set.call_count == 1
+
+        rate(5.0, deep=True)
+        rebind_nodetree(instrument, SimpleNamespace(root=nodetree))
+        rate(5.0)
+        assert connection.set.call_count == 2
+        assert instrument.suppressed_writes == 0
+
+
+class TestAsync:
+    def test_ordered_executor(self):
+        executor = _OrderedExecutor(2, "test-ordered")
+        release = threading.Event()
+        calls = []
+
+        def first():
+            release.wait(10)
+            calls.append("first")
+
+        first_future = executor.submit("a", first)
+        second_future = executor.submit("a", calls.append, "second")
+        # other keys are not blocked by the pending calls of "a"
+        executor.submit("b", release.set).result(timeout=10)
+        second_future.result(timeout=10)
+        assert first_future.done()
+        assert calls == ["first", "second"]
+
+    def test_get_set_async(self, nodetree, create_instrument):
+        instrument = create_instrument("async_parameter", nodetree)
+        connection = nodetree.connection
+        calls = []
+
+        def set_value(path, value):
+            time.sleep(0.01)
+            calls.append(("set", value))
+
+        def get_double(path):
+            calls.append(("get",))
+            return 3.0
+
+        connection.set.side_effect = set_value
+        connection.getDouble.side_effect = get_double
+        rate = instrument.demods[0].rate
+
+        async def main():
+            return await asyncio.gather(
+                rate.set_async(1.0), rate.set_async(2.0), rate.get_async()
+            )
+
+        assert asyncio.run(main()) == [None, None, 3.0]
+        assert calls == [("set", 1.0), ("set", 2.0), ("get",)]
+
+    def test_wait_async(self, nodetree, create_instrument):
+        instrument = create_instrument("async_wait", nodetree)
+        connection = nodetree.connection
+        changed = threading.Event()
+
+        def get_double(path):
+            if path.endswith("rate"):
+                return 3.0
+            return 1 if changed.is_set() else 0
+
+        connection.getDouble.side_effect = get_double
+
+        async def main():
+            wait = asyncio.ensure_future(
+                instrument.sigouts[0].on.wait_for_state_change_async(1, timeout=5)
+            )
+            await asyncio.sleep(0)
+            # the wait does not delay the other operations of the instrument
+            rate = await instrument.demods[0].rate.get_async()
+            assert not wait.done()
+            changed.set()
+            await wait
+            return rate
+
+        assert asyncio.run(main()) == 3.0
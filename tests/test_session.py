@@ -0,0 +1,289 @@
+import json
+import threading
+import numpy as np
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, call, patch
+from fixtures import (
+    NODES,
+    create_instrument,
+    mock_connection,
+    data_dir,
+    node_info,
+    nodetree,
+    session,
+)
+from zhinst.toolkit.nodetree import NodeTree
+
+from zhinst.qcodes.driver.devices.base import ZIBaseInstrument
+from zhinst.qcodes.session import (
+    DeviceConnectionError,
+    Devices,
+    SetTransactionError,
+    ZISession,
+)
+
+
+class TestConnectDevices:
+    @pytest.fixture()
+    def server(self):
+        with patch("zhinst.qcodes.session.ziDAQServer") as server:
+            server.return_value.getString.return_value = json.dumps(
+                {"DEV1": {"INTERFACE": "none", "INTERFACES": "USB,1GbE"}}
+            )
+            yield server
+
+    def test_connect(self, session, server):
+        threads = set()
+
+        def connect_device(serial, interface):
+            threads.add(threading.current_thread())
+            return MagicMock()
+
+        with patch.object(
+            session.toolkit_session, "connect_device", side_effect=connect_device
+        ) as connect, patch.object(
+            Devices, "__getitem__", side_effect=lambda serial: f"device {serial}"
+        ):
+            devices = session.connect_devices(
+                ["DEV1", "dev2", "dev1"], interfaces={"dev2": "USB"}
+            )
+        assert devices == {"dev1": "device dev1", "dev2": "device dev2"}
+        # Dedicated connection for every parallel connection attempt
+        assert server.call_count == 2
+        assert server.return_value.disconnect.call_count == 2
+        server.return_value.connectDevice.assert_has_calls(
+            [call("dev1", "1GbE"), call("dev2", "USB")], any_order=True
+        )
+        connect.assert_has_calls(
+            [call("dev1", interface="1GbE"), call("dev2", interface="USB")]
+        )
+        assert threads == {threading.main_thread()}
+
+    def test_errors_per_device(self, session, server):
+        def connect_device(serial, interface):
+            if serial == "dev2":
+                raise RuntimeError("Connection failed")
+
+        server.return_value.connectDevice.side_effect = connect_device
+        with patch.object(
+            session.toolkit_session, "connect_device", return_value=MagicMock()
+        ) as connect, patch.object(
+            Devices, "__getitem__", side_effect=lambda serial: f"device {serial}"
+        ):
+            with pytest.raises(DeviceConnectionError) as error:
+                session.connect_devices(
+                    ["dev1", "dev2", "dev3"], interfaces="1GbE", max_workers=2
+                )
+        assert error.value.devices == {
+            "dev1": "device dev1",
+            "dev3": "device dev3",
+        }
+        assert list(error.value.errors) == ["dev2"]
+        assert "dev2" in str(error.value)
+        assert connect.call_count == 2
+
+    def test_existing_device(self, session, server):
+        existing = MagicMock()
+        session.devices._devices["dev1"] = existing
+        with patch.object(
+            session.toolkit_session, "connect_device", return_value=MagicMock()
+        ), patch.object(
+            Devices,
+            "__getitem__",
+            side_effect=lambda serial: session.devices._devices.get(serial),
+        ):
+            devices = session.connect_devices(
+                ["dev1", "dev2"], interfaces="1GbE", lazy=True
+            )
+        assert devices == {"dev1": existing, "dev2": None}
+        assert "dev1" not in session.devices._default_properties
+        assert session.devices._default_properties["dev2"]["lazy"]
+
+
+class CustomInstrument(ZIBaseInstrument):
+    pass
+
+
+class TestReconnectDevice:
+    @staticmethod
+    def tk_device(nodes=NODES, unit="V"):
+        nodedoc = {node: node_info(node) for node in nodes}
+        nodedoc["/dev1234/demods/0/rate"]["Unit"] = unit
+        tk_device = MagicMock()
+        tk_device.root = NodeTree(
+            MagicMock(), prefix_hide="dev1234", preloaded_json=nodedoc
+        )
+        tk_device.serial = "dev1234"
+        tk_device.device_type = "MFLI"
+        return tk_device
+
+    @staticmethod
+    def reconnect(session, tk_device):
+        with patch.object(
+            session.toolkit_session, "connect_device", return_value=tk_device
+        ), patch.object(Devices, "connected", return_value=["dev1234"]):
+            return session.reconnect_device("dev1234")
+
+    @pytest.fixture()
+    def device(self, session):
+        device = CustomInstrument(
+            self.tk_device(), session, name="reconnect", lazy=True, exclude=["*/on"]
+        )
+        session._devices._devices["dev1234"] = device
+        yield device
+        session._devices._devices.pop("dev1234").close()
+
+    def test_rebind(self, session, device):
+        with patch("zhinst.qcodes.qcodes_adaptions.ziDAQServer") as server:
+            device.incremental_snapshot = True
+            tk_device = self.tk_device()
+            assert self.reconnect(session, tk_device) is device
+        assert device.demods[0].rate.tk_node.root is tk_device.root
+        assert device.incremental_snapshot
+        assert server.call_count == 2
+        server.return_value.disconnect.assert_called_once()
+        assert server.return_value.subscribe.call_count == 2
+
+    @pytest.mark.parametrize("changes", [{"unit": "mV"}, {"nodes": NODES[:-1]}])
+    def test_recreate(self, session, device, changes):
+        device.snapshot_ttl = 5.0
+        device.suppress_redundant_writes = True
+        new_device = self.reconnect(session, self.tk_device(**changes))
+        assert new_device is not device
+        assert type(new_device) is CustomInstrument
+        assert new_device.name == "reconnect"
+        assert "_zi_pending" in vars(new_device)
+        assert "on" not in new_device.sigouts[0].parameters
+        assert new_device.snapshot_ttl == 5.0
+        assert new_device.suppress_redundant_writes
+
+
+def test_shared_snapshot(session, mock_connection):
+    connection = mock_connection.return_value
+    connection.get.return_value = {"/zi/about/version": {"value": ["22.02"]}}
+    with session.shared_snapshot():
+        session.snapshot()
+        session.snapshot()
+    connection.get.assert_called_once()
+    assert connection.get.call_args[0][0] == "/zi/*"
+    assert session.about.version.cache.get(get_if_invalid=False) == "22.02"
+
+
+def test_snapshot_all_async(session, mock_connection):
+    connection = mock_connection.return_value
+    connection.get.return_value = {"/zi/about/version": {"value": ["22.02"]}}
+    snapshots = session.snapshot_all_async().result(timeout=10)
+    assert list(snapshots) == [session.name]
+    connection.get.assert_called_once()
+
+
+def test_get_many(session, mock_connection, nodetree, create_instrument):
+    device = create_instrument("get_many_device", nodetree)
+    connection = mock_connection.return_value
+    connection.get.return_value = {
+        "/zi/about/version": {"timestamp": [0], "value": ["22.02"]},
+        "/dev1234/demods/0/rate": {"timestamp": [0], "value": np.array([7.0])},
+    }
+    with patch.object(Devices, "__getitem__", return_value=device):
+        values = session.get_many(["/zi/about/version", "/DEV1234/demods/0/rate"])
+    connection.get.assert_called_once_with(
+        "/zi/about/version,/dev1234/demods/0/rate", settingsonly=False, flat=True
+    )
+    assert values[session.about.version] == "22.02"
+    assert values[device.demods[0].rate] == 7.0
+    rate_timestamp = device.demods[0].rate.cache.timestamp
+    assert rate_timestamp == session.about.version.cache.timestamp
+
+
+class TestSetTransaction:
+    @pytest.fixture()
+    def device(self, session, nodetree, create_instrument):
+        device = create_instrument("transaction_device", nodetree)
+        device._tk_object = SimpleNamespace(root=nodetree)
+        session._devices._devices["dev1234"] = device
+        session.toolkit_session.devices._devices["dev1234"] = device._tk_object
+        yield device
+        del session._devices._devices["dev1234"]
+        del session.toolkit_session.devices._devices["dev1234"]
+
+    def test_single_set(self, session, mock_connection, device):
+        connection = mock_connection.return_value
+        with session.set_transaction():
+            device.demods[0].rate(5.0)
+            session.debug.level(3)
+            connection.set.assert_not_called()
+        connection.set.assert_called_once_with(
+            [("/dev1234/demods/0/rate", 5.0), ("/zi/debug/level", 3)]
+        )
+        device.demods[0].rate(6.0)
+        device._tk_object.root.connection.set.assert_called_once()
+
+    def test_device_created_within(self, session, mock_connection, nodetree):
+        connection = mock_connection.return_value
+        tk_devices = session.toolkit_session.devices
+        with patch.object(
+            type(tk_devices), "connected", return_value=["dev1234"]
+        ), patch.object(
+            tk_devices, "_create_device", return_value=SimpleNamespace(root=nodetree)
+        ):
+            with session.set_transaction():
+                tk_devices["dev1234"].root.demods[0].rate(5.0)
+        del tk_devices["dev1234"]
+        connection.set.assert_called_once_with([("/dev1234/demods/0/rate", 5.0)])
+        nodetree.connection.set.assert_not_called()
+
+    def test_rejected(self, session, mock_connection, device):
+        connection = mock_connection.return_value
+        connection.set.side_effect = RuntimeError(
+            "ZIAPIWriteException with status code: 32780. "
+            "Write to /dev1234/demods/0/rate failed"
+        )
+        with pytest.raises(SetTransactionError) as error:
+            with session.set_transaction():
+                device.demods[0].rate(5.0)
+                session.debug.level(3)
+        assert error.value.nodes == {
+            "dev1234": {"/dev1234/demods/0/rate": 5.0},
+            "zi": {"/zi/debug/level": 3},
+        }
+        assert "Write to /dev1234/demods/0/rate failed" in str(error.value)
+        assert "dev1234: /dev1234/demods/0/rate = 5.0" in str(error.value)
+
+    def test_error_within(self, session, device):
+        with pytest.raises(RuntimeError, match="within the block"):
+            with session.set_transaction():
+                device.demods[0].rate(5.0)
+                raise RuntimeError("within the block")
+
+
+def test_latency_stats(session, mock_connection, nodetree):
+    tk_device = MagicMock(serial="dev1234", device_type="MFLI", root=nodetree)
+    device = ZIBaseInstrument(tk_device, session, name="latency_device", raw=True)
+    other = ZISession("localhost", new_session=True)
+    connection = mock_connection.return_value
+    connection.poll.return_value = {}
+    try:
+        device.demods[0].rate(1.0)
+        assert session.latency_stats() == {}
+        session.latency_tracking = True
+        assert not other.latency_tracking
+        for value in range(100):
+            device.demods[0].rate(value)
+        device.demods[0].rate()
+        session.poll()
+        other.latency_tracking = True
+        other.poll()
+        other.reset_latency_stats()
+        stats = session.latency_stats()
+        rate = stats["/dev1234/demods/0/rate"]
+        assert rate["set"]["count"] == 100
+        assert rate["get"]["count"] == 1
+        assert 0 < rate["set"]["p50"] <= rate["set"]["p99"] <= rate["set"]["max"]
+        assert stats[session.name]["poll"]["count"] == 1
+        assert other.name not in stats
+        session.reset_latency_stats()
+        assert session.latency_stats() == {}
+    finally:
+        device.close()
+        other.close()
@@ -0,0 +1,22 @@
+import json
+
+import pytest
+from qcodes.utils.helpers import NumpyJSONEncoder
+
+from fixtures import NODES, create_instrument, nodetree
+from zhinst.qcodes.snapshot_codec import decode_snapshot, encode_snapshot
+
+
+def test_roundtrip(nodetree, create_instrument):
+    instrument = create_instrument("snapshot_codec", nodetree)
+    values = {node: {"timestamp": [0], "value": [1]} for node in NODES}
+    values["/dev1234/demods/0/rate"]["value"] = [1.5]
+    values["/dev1234/demods/0/sample"]["value"] = [1 + 2j]
+    nodetree.connection.get.return_value = values
+    snapshot = instrument.snapshot()
+    data = encode_snapshot(snapshot)
+    expected = json.loads(json.dumps(snapshot, cls=NumpyJSONEncoder))
+    assert decode_snapshot(data) == expected
+    assert len(data) < len(json.dumps(snapshot, cls=NumpyJSONEncoder))
+    with pytest.raises(ValueError):
+        decode_snapshot(b"{}")